@@ -10,6 +10,10 @@ def parse_cli() -> argparse.Namespace:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--method")
+    parser.add_argument("--solver", default="dpll")
+    parser.add_argument("--preprocess", action="store_true")
+    parser.add_argument("--restarts", default="none")
+    parser.add_argument("--phase-saving", action="store_true")
     parser.add_argument("-n", type=int)
 
     return parser.parse_args()
@@ -19,6 +23,14 @@ if __name__ == "__main__":
 
     cli_args = parse_cli()
     method = cli_args.method
+    if cli_args.solver != "dpll":
+        method = f"{cli_args.solver}-{method}"
+    if cli_args.preprocess:
+        method = f"bve-{method}"
+    if cli_args.restarts != "none":
+        method = f"{method}-{cli_args.restarts}"
+    if cli_args.phase_saving:
+        method = f"{method}-phase"
 
     for fp in sorted(glob.glob(os.path.join("results", method, f"n={cli_args.n}", "l=*.json"))):
         with open(fp, "r") as f:
@@ -31,3 +43,27 @@ if __name__ == "__main__":
         print(f"- sat. rate:       {round(sat_rate * 100, 2)}%")
         print(f"- med. runtime:    {round(results_df.runtime.median(), 2)}s")
         print(f"- med. call count: {int(results_df.n_calls.median())}")
+        if "status" in results_df:
+            n_aborted = int(
+                results_df.status.isin(["timeout", "budget", "killed"]).sum()
+            )
+            print(f"- aborted:         {n_aborted}")
+        if "n_restarts" in results_df:
+            print(f"- med. restarts:   {int(results_df.n_restarts.median())}")
+        if "stats" in results_df:
+            stats_df = pd.DataFrame(list(results_df.stats))
+            for key in [
+                "decisions", "propagations", "conflicts", "backtracks",
+                "max_depth"
+            ]:
+                label = f"med. {key}:"
+                print(f"- {label:<16} {int(stats_df[key].median())}")
+
+            # share of the total solver time, summed over all formulas
+            total_time = stats_df.total_time.sum()
+            for key in [
+                "copy_time", "select_time", "propagate_time", "analyze_time"
+            ]:
+                share = stats_df[key].sum() / max(total_time, 1e-9)
+                label = f"{key}:"
+                print(f"- {label:<16} {round(share * 100, 1)}%")
@@ -0,0 +1,165 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+
+from einstein import build_puzzle
+from sat.benchmark import BenchmarkSuite, COUNTERS
+from sat.formulas import CNF
+from sat.solvers import DPLL, CDCL
+from sat.selectors import (
+    NaiveSelector,
+    TwoClauseSelector,
+    ModalVariableSelector,
+    VSIDSSelector
+)
+
+
+SOLVERS = {
+    "dpll-naive": lambda: DPLL(selector=NaiveSelector()),
+    "dpll-two": lambda: DPLL(selector=TwoClauseSelector()),
+    "dpll-modal": lambda: DPLL(selector=ModalVariableSelector()),
+    "cdcl-vsids": lambda: CDCL(selector=VSIDSSelector())
+}
+
+# fixed-seed random 3-SAT below, at and above the phase transition
+RANDOM_N_VARS = 50
+RANDOM_RATIOS = (3.0, 4.26, 5.0)
+RANDOM_COUNT = 10
+RANDOM_SEED = 0
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+
+# the formula parsed and written by the DIMACS microbenchmarks
+DIMACS_N_VARS = 2000
+DIMACS_RATIO = 4.26
+
+BASELINE_PATH = "./benchmarks/baseline.json"
+
+
+def parse_cli() -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", dest="pattern", default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--time-threshold", type=float, default=1.0)
+    timing = parser.add_mutually_exclusive_group()
+    timing.add_argument("--timing", action="store_true")
+    timing.add_argument("--counters-only", action="store_true")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--verbose", "-v", action="store_true")
+
+    return parser.parse_args()
+
+
+def build_suite(tmp_dir: str) -> BenchmarkSuite:
+
+    suite = BenchmarkSuite()
+
+    for ratio in RANDOM_RATIOS:
+        formulas = CNF.generate_many(
+            RANDOM_N_VARS, round(ratio * RANDOM_N_VARS), RANDOM_COUNT,
+            seed=RANDOM_SEED
+        )
+        for name, factory in SOLVERS.items():
+            suite.add_solver(
+                f"random-{RANDOM_N_VARS}-{ratio}/{name}", factory, formulas
+            )
+
+    test_cnfs = [
+        CNF.from_dimacs(fp)
+        for fp in sorted(glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf")))
+    ]
+    for name, factory in SOLVERS.items():
+        suite.add_solver(f"test_cnfs/{name}", factory, test_cnfs)
+
+    einstein = build_puzzle().cnf
+    for name, factory in SOLVERS.items():
+        suite.add_solver(f"einstein/{name}", factory, [einstein])
+
+    dimacs_path = os.path.join(tmp_dir, "dimacs.cnf")
+    formula = CNF.generate(
+        DIMACS_N_VARS, round(DIMACS_RATIO * DIMACS_N_VARS), seed=RANDOM_SEED
+    )
+    formula.to_dimacs(dimacs_path)
+
+    def parse():
+
+        CNF.from_dimacs(dimacs_path)
+
+        return
+
+    def write():
+
+        formula.to_dimacs(os.path.join(tmp_dir, "written.cnf"))
+
+        return
+
+    suite.add("dimacs/parse", parse)
+    suite.add("dimacs/write", write)
+
+    return suite
+
+
+if __name__ == "__main__":
+
+    cli_args = parse_cli()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        suite = build_suite(tmp_dir)
+        results = suite.run(
+            repeat=cli_args.repeat,
+            pattern=cli_args.pattern,
+            verbose=cli_args.verbose
+        )
+
+    if cli_args.output is not None:
+        BenchmarkSuite.write(cli_args.output, results)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    baseline = BenchmarkSuite.read(cli_args.baseline)
+
+    # cases left out by --filter keep their baseline
+    if cli_args.update_baseline:
+        os.makedirs(os.path.dirname(cli_args.baseline), exist_ok=True)
+        BenchmarkSuite.write(
+            cli_args.baseline, {**(baseline or dict()), **results}
+        )
+        sys.exit(0)
+
+    if baseline is None:
+        print(f"No baseline at {cli_args.baseline}", file=sys.stderr)
+        sys.exit(0)
+
+    # the counters only vary with the code; times also vary between
+    # machines, so they are only compared against a baseline recorded on
+    # this one (or on request), and with a looser threshold for the noise
+    regressions = BenchmarkSuite.compare(
+        results, baseline, threshold=cli_args.threshold, metrics=COUNTERS
+    )
+    machine = BenchmarkSuite.read_machine(cli_args.baseline)
+    same_machine = machine == BenchmarkSuite.machine()
+    if cli_args.timing or (same_machine and not cli_args.counters_only):
+        regressions.extend(
+            BenchmarkSuite.compare(
+                results,
+                baseline,
+                threshold=cli_args.time_threshold,
+                metrics=["time"]
+            )
+        )
+    elif not cli_args.counters_only:
+        print(
+            "Baseline from another machine, times not compared",
+            file=sys.stderr
+        )
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    sys.exit(1 if len(regressions) > 0 else 0)
@@ -2,8 +2,8 @@
 import argparse
 import json
 
-from sat.puzzle import Puzzle
-from sat.solvers import DPLL
+from sat.puzzle import AUX_PREFIX, Puzzle
+from sat.solvers import DPLL, PortfolioSolver
 
 from sat.selectors import (
     NaiveSelector,
@@ -30,6 +30,10 @@ def parse_cli() -> argparse.Namespace:
         "--verbose", "-v",
         action="store_true"
     )
+    parser.add_argument(
+        "--portfolio",
+        action="store_true"
+    )
 
     return parser.parse_args()
 
@@ -82,14 +86,17 @@ if __name__ == "__main__":
     with open("./output/var_map.json", "w") as f:
         json.dump(puzzle_cnf._var_map, f)
 
-    solver = DPLL(
-        selector=SELECTORS[cli_args.selector](),
-        verbose=cli_args.verbose
-    )
+    if cli_args.portfolio:
+        solver = PortfolioSolver(verbose=cli_args.verbose)
+    else:
+        solver = DPLL(
+            selector=SELECTORS[cli_args.selector](),
+            verbose=cli_args.verbose
+        )
     tau = solver.solve(puzzle_cnf)
     with open("./output/solution.txt", "w") as f:
         for (var, val) in tau.items():
-            if val:
+            if val and not var.startswith(AUX_PREFIX):
                 f.write(str(puzzle_cnf._var_map[var]) + " " +  var + "\n")
-    print(tau)
+    print(puzzle.decode(tau))
     print(puzzle_cnf.evaluate(tau))
@@ -2,11 +2,19 @@
 import argparse
 
 from sat.experiment import Experiment
+from sat.solvers import (
+    DPLL,
+    CDCL,
+    NoRestarts,
+    LubyRestarts,
+    GeometricRestarts
+)
 from sat.selectors import (
     NaiveSelector,
     RandomChoiceSelector,
     TwoClauseSelector,
-    ModalVariableSelector
+    ModalVariableSelector,
+    VSIDSSelector
 )
 
 
@@ -14,7 +22,19 @@ SELECTORS = {
     "naive": NaiveSelector,
     "random": RandomChoiceSelector,
     "two": TwoClauseSelector,
-    "modal": ModalVariableSelector
+    "modal": ModalVariableSelector,
+    "vsids": VSIDSSelector
+}
+
+SOLVERS = {
+    "dpll": DPLL,
+    "cdcl": CDCL
+}
+
+RESTARTS = {
+    "none": NoRestarts,
+    "luby": LubyRestarts,
+    "geometric": GeometricRestarts
 }
 
 
@@ -22,6 +42,16 @@ def parse_cli() -> argparse.Namespace:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--method")
+    parser.add_argument("--solver", default="dpll", choices=SOLVERS.keys())
+    parser.add_argument("--preprocess", action="store_true")
+    parser.add_argument("--restarts", default="none", choices=RESTARTS.keys())
+    parser.add_argument("--phase-saving", action="store_true")
+    parser.add_argument("-j", dest="n_workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-decisions", type=int, default=None)
+    parser.add_argument("--max-propagations", type=int, default=None)
+    parser.add_argument("--max-conflicts", type=int, default=None)
     parser.add_argument("-n", dest="n_vars", type=int)
     parser.add_argument("-rmin", dest="min_ratio", type=float, default=3.0)
     parser.add_argument("-rmax", dest="max_ratio", type=float, default=6.0)
@@ -39,6 +69,27 @@ if __name__ == "__main__":
         n_vars=cli_args.n_vars,
         min_ratio=cli_args.min_ratio,
         max_ratio=cli_args.max_ratio,
-        ratio_step=cli_args.ratio_step
+        ratio_step=cli_args.ratio_step,
+        solver=SOLVERS[cli_args.solver],
+        preprocess=cli_args.preprocess,
+        solver_options={
+            "restart_policy": RESTARTS[cli_args.restarts](),
+            "phase_saving": cli_args.phase_saving,
+            "max_decisions": cli_args.max_decisions,
+            "max_propagations": cli_args.max_propagations,
+            "max_conflicts": cli_args.max_conflicts
+        },
+        n_workers=cli_args.n_workers,
+        timeout=cli_args.timeout,
+        seed=cli_args.seed
     )
-    exp.run(f"results/{cli_args.method}/")
+    method = cli_args.method
+    if cli_args.solver != "dpll":
+        method = f"{cli_args.solver}-{method}"
+    if cli_args.preprocess:
+        method = f"bve-{method}"
+    if cli_args.restarts != "none":
+        method = f"{method}-{cli_args.restarts}"
+    if cli_args.phase_saving:
+        method = f"{method}-phase"
+    exp.run(f"results/{method}/")
@@ -0,0 +1,192 @@
+from dataclasses import dataclass
+import json
+import math
+import platform
+import re
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .formulas import CNF
+from .solvers._base_solver import Solver
+from .solvers._stats import SolverStats
+
+
+# the counters of `SolverStats` compared besides the time; they are
+# deterministic, so a change in them is a change in the search itself
+COUNTERS = ("decisions", "propagations", "conflicts")
+
+# times below this many seconds are too noisy to compare
+MIN_TIME = 1e-3
+
+# cases faster than this many seconds are looped within every timed run,
+# like `timeit` does, to average out the timer and scheduler noise
+MIN_RUN_TIME = 0.1
+
+
+@dataclass
+class Regression:
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+
+        if self.baseline == 0:
+            return float("inf")
+
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+
+        return f"{self.case} {self.metric}: " \
+            f"{self.baseline:.4g} -> {self.current:.4g} ({self.ratio:.2f}x)"
+
+
+class BenchmarkSuite:
+
+    def __init__(self):
+
+        # every case is a callable running the work once, returning the
+        # counters it wants compared besides the time
+        self.cases = dict()
+
+        return
+
+    def add(self, name: str, case: Callable[[], Dict[str, float]]):
+
+        if name in self.cases:
+            raise ValueError(f"Duplicate benchmark {name}")
+        self.cases[name] = case
+
+        return
+
+    def add_solver(
+        self,
+        name: str,
+        solver_factory: Callable[[], Solver],
+        formulas: Sequence[CNF]
+    ):
+
+        def case() -> Dict[str, float]:
+
+            stats = SolverStats()
+            for formula in formulas:
+                solver = solver_factory()
+                solver.solve(formula)
+                stats.merge(solver.stats)
+
+            return {counter: getattr(stats, counter) for counter in COUNTERS}
+
+        self.add(name, case)
+
+        return
+
+    def run(
+        self,
+        repeat: int = 5,
+        pattern: str = None,
+        seed: int = 0,
+        verbose: bool = False
+    ) -> Dict[str, Dict[str, float]]:
+
+        # the fastest of `repeat` runs is the least disturbed by the machine;
+        # every call reseeds the randomized selectors so that the counters
+        # are reproducible
+        results = dict()
+        for name, case in self.cases.items():
+            if pattern is not None and re.search(pattern, name) is None:
+                continue
+
+            np.random.seed(seed)
+            t_start = time.perf_counter()
+            counters = case() or dict()
+            first = time.perf_counter() - t_start
+            number = max(math.ceil(MIN_RUN_TIME / max(first, 1e-9)), 1)
+
+            times = list()
+            for _ in range(repeat):
+                t_start = time.perf_counter()
+                for _ in range(number):
+                    np.random.seed(seed)
+                    case()
+                times.append((time.perf_counter() - t_start) / number)
+
+            results[name] = {"time": min(times), **counters}
+            if verbose:
+                print(f"{name:<40} {min(times):.4f}s")
+
+        return results
+
+    @staticmethod
+    def compare(
+        results: Dict[str, Dict[str, float]],
+        baseline: Dict[str, Dict[str, float]],
+        threshold: float = 0.25,
+        metrics: Sequence[str] = None
+    ) -> List[Regression]:
+
+        # every metric is lower-is-better; cases or metrics missing from
+        # either side are not compared, nor those not in `metrics` if given
+        regressions = list()
+        for name, case_metrics in results.items():
+            if name not in baseline:
+                continue
+            for metric, current in case_metrics.items():
+                if metrics is not None and metric not in metrics:
+                    continue
+                previous = baseline[name].get(metric)
+                if previous is None:
+                    continue
+                if metric == "time" and max(current, previous) < MIN_TIME:
+                    continue
+                if current > previous * (1 + threshold):
+                    regressions.append(
+                        Regression(name, metric, previous, current)
+                    )
+
+        return regressions
+
+    @staticmethod
+    def machine() -> Dict[str, str]:
+
+        # what a recorded time depends on besides the code
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor()
+        }
+
+    @staticmethod
+    def write(fp: str, results: Dict[str, Dict[str, float]]):
+
+        report = {
+            "machine": BenchmarkSuite.machine(),
+            "results": results
+        }
+        with open(fp, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+        return
+
+    @staticmethod
+    def read(fp: str) -> Optional[Dict[str, Dict[str, float]]]:
+
+        try:
+            with open(fp, "r") as f:
+                return json.load(f)["results"]
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def read_machine(fp: str) -> Optional[Dict[str, str]]:
+
+        try:
+            with open(fp, "r") as f:
+                return json.load(f).get("machine")
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,176 @@
+import itertools
+from typing import Callable, Dict, List, Sequence
+
+from .formulas import CNF
+
+
+# the auxiliary variables of every encoding are named `{aux_prefix}{i}`
+# with fresh numbers `i`
+DEFAULT_AUX_PREFIX = "aux"
+
+# the numbers are drawn for the whole process rather than per formula, since
+# formulas are merged by variable name and separately encoded constraints
+# must not end up sharing their auxiliary variables
+_aux_ids = itertools.count(1)
+
+# literals per group of the commander encoding
+COMMANDER_GROUP_SIZE = 3
+
+
+def at_most_one(
+    cnf: CNF,
+    literals: Sequence[str],
+    encoding: str = "sequential",
+    aux_prefix: str = DEFAULT_AUX_PREFIX
+):
+
+    # adds clauses to `cnf` allowing at most one of `literals` to be true;
+    # "pairwise" needs no auxiliary variables but n(n-1)/2 clauses, the
+    # others are linear in n
+    if encoding not in AMO_ENCODINGS:
+        raise ValueError(f"Unknown at-most-one encoding: {encoding}")
+
+    lits = [cnf.encode(literal) for literal in literals]
+    if len(lits) > 1:
+        AMO_ENCODINGS[encoding](cnf, lits, aux_prefix)
+
+    return
+
+
+def exactly_one(
+    cnf: CNF,
+    literals: Sequence[str],
+    encoding: str = "sequential",
+    aux_prefix: str = DEFAULT_AUX_PREFIX
+):
+
+    cnf.add_clause(*literals)
+    at_most_one(cnf, literals, encoding=encoding, aux_prefix=aux_prefix)
+
+    return
+
+
+def at_most_k(
+    cnf: CNF,
+    literals: Sequence[str],
+    k: int,
+    encoding: str = "sequential",
+    aux_prefix: str = DEFAULT_AUX_PREFIX
+):
+
+    # the at-most-one encodings serve k = 1; larger bounds use the
+    # sequential counter
+    if k < 0:
+        raise ValueError("Expected a non-negative bound")
+    if k == 1:
+        at_most_one(cnf, literals, encoding=encoding, aux_prefix=aux_prefix)
+        return
+    if encoding != "sequential":
+        raise ValueError(f"Unknown at-most-k encoding: {encoding}")
+
+    lits = [cnf.encode(literal) for literal in literals]
+    if k == 0:
+        for lit in lits:
+            cnf.add_int_clause(-lit)
+    elif k < len(lits):
+        _sequential_counter(cnf, lits, k, aux_prefix)
+
+    return
+
+
+def _fresh(cnf: CNF, aux_prefix: str) -> int:
+
+    # a name the formula already uses, e.g. one of its own, is skipped
+    var = f"{aux_prefix}{next(_aux_ids)}"
+    while var in cnf._var_map:
+        var = f"{aux_prefix}{next(_aux_ids)}"
+
+    return cnf._intern(var)
+
+
+def _pairwise(cnf: CNF, lits: List[int], aux_prefix: str):
+
+    for i in range(len(lits)):
+        for j in range(i + 1, len(lits)):
+            cnf.add_int_clause(-lits[i], -lits[j])
+
+    return
+
+
+def _sequential(cnf: CNF, lits: List[int], aux_prefix: str):
+
+    # Sinz's sequential counter for k = 1: s_i holds if one of the first
+    # i literals is true
+    _sequential_counter(cnf, lits, 1, aux_prefix)
+
+    return
+
+
+def _sequential_counter(cnf: CNF, lits: List[int], k: int, aux_prefix: str):
+
+    # s[i][j] holds if at least j + 1 of the first i + 1 literals are true;
+    # a literal may not be true once k earlier ones are
+    n = len(lits)
+    s = [[_fresh(cnf, aux_prefix) for _ in range(k)] for _ in range(n - 1)]
+
+    cnf.add_int_clause(-lits[0], s[0][0])
+    for j in range(1, k):
+        cnf.add_int_clause(-s[0][j])
+    for i in range(1, n - 1):
+        cnf.add_int_clause(-lits[i], s[i][0])
+        cnf.add_int_clause(-s[i - 1][0], s[i][0])
+        for j in range(1, k):
+            cnf.add_int_clause(-lits[i], -s[i - 1][j - 1], s[i][j])
+            cnf.add_int_clause(-s[i - 1][j], s[i][j])
+        cnf.add_int_clause(-lits[i], -s[i - 1][k - 1])
+    cnf.add_int_clause(-lits[n - 1], -s[n - 2][k - 1])
+
+    return
+
+
+def _commander(cnf: CNF, lits: List[int], aux_prefix: str):
+
+    # Klieber and Kwon: at most one literal per group, every true literal
+    # sets its group's commander, and at most one commander, recursively
+    while len(lits) > COMMANDER_GROUP_SIZE:
+        commanders = list()
+        for start in range(0, len(lits), COMMANDER_GROUP_SIZE):
+            group = lits[start:start + COMMANDER_GROUP_SIZE]
+            if len(group) == 1:
+                commanders.append(group[0])
+                continue
+            _pairwise(cnf, group, aux_prefix)
+            commander = _fresh(cnf, aux_prefix)
+            for lit in group:
+                cnf.add_int_clause(-lit, commander)
+            commanders.append(commander)
+        lits = commanders
+    _pairwise(cnf, lits, aux_prefix)
+
+    return
+
+
+def _ladder(cnf: CNF, lits: List[int], aux_prefix: str):
+
+    # Gent and Nightingale: the ladder y_1 <- y_2 <- ... <- y_{n-1}, where a
+    # true i-th literal puts the step between y_{i-1} and y_i
+    n = len(lits)
+    y = [_fresh(cnf, aux_prefix) for _ in range(n - 1)]
+
+    for i in range(n - 2):
+        cnf.add_int_clause(-y[i + 1], y[i])
+    cnf.add_int_clause(-lits[0], -y[0])
+    for i in range(1, n - 1):
+        cnf.add_int_clause(-lits[i], y[i - 1])
+        cnf.add_int_clause(-lits[i], -y[i])
+    cnf.add_int_clause(-lits[n - 1], y[n - 2])
+
+    return
+
+
+AMO_ENCODINGS: Dict[str, Callable[[CNF, List[int], str], None]] = {
+    "pairwise": _pairwise,
+    "sequential": _sequential,
+    "commander": _commander,
+    "ladder": _ladder
+}
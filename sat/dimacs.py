@@ -0,0 +1,183 @@
+from typing import List, Tuple
+import warnings
+
+import numpy as np
+
+
+DIMACS_CHUNK_SIZE = 1 << 20
+
+
+def read_dimacs(
+    fp: str, chunk_size: int = DIMACS_CHUNK_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+
+    # streams the file in chunks cut at line boundaries and returns the
+    # literals and clause offsets in the file's own variable numbering
+    reader = _DimacsReader()
+
+    with open(fp, "r") as f:
+        rest = ""
+        while not reader.done:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                reader.feed(rest)
+                break
+            text = rest + chunk
+            cut = text.rfind("\n") + 1
+            rest = text[cut:]
+            reader.feed(text[:cut])
+
+    return reader.finish()
+
+
+def _parse_ints(text: str) -> np.ndarray:
+
+    # numpy < 2 only warns on malformed input and returns a truncated array
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=np.int32, sep=" ")
+        except DeprecationWarning as e:
+            raise ValueError(str(e))
+
+
+class _DimacsReader:
+
+    def __init__(self):
+
+        # clauses are terminated by 0 as in the DIMACS standard, or by the
+        # end of their line as in the files this package used to write; the
+        # first 0 anywhere settles it, until then the text is kept back
+        self.zero_terminated = None
+        self.undecided_text = list()
+        self.done = False
+
+        self.n_clauses = 0
+        self.n_lits = 0
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.lit_chunks = list()
+        self.pending = np.zeros(0, dtype=np.int32)
+
+        return
+
+    def feed(self, text: str):
+
+        if self.done or len(text) == 0 or text.isspace():
+            return
+
+        # comments, the header and the SATLIB end marker are rare past the
+        # first chunk, so lines are only inspected one by one when needed
+        if self.zero_terminated is None or "c" in text or "p" in text or \
+           "%" in text:
+            text = "\n".join(self._filter_lines(text))
+        if len(text) == 0 or text.isspace():
+            return
+
+        if self.zero_terminated is None:
+            tokens = _parse_ints(text)
+            if not (tokens == 0).any():
+                self.undecided_text.append(text)
+                return
+            self.zero_terminated = True
+            if len(self.undecided_text) > 0:
+                tokens = _parse_ints("\n".join(self.undecided_text + [text]))
+                self.undecided_text = list()
+        else:
+            tokens = _parse_ints(text)
+        self._add_tokens(tokens)
+
+        return
+
+    def finish(self) -> Tuple[np.ndarray, np.ndarray]:
+
+        # a file without any 0 has one clause per line
+        if self.zero_terminated is None and len(self.undecided_text) > 0:
+            self.zero_terminated = False
+            self._add_tokens(
+                self._parse_lines("\n".join(self.undecided_text))
+            )
+            self.undecided_text = list()
+
+        # tolerate a missing terminator after the last clause
+        if len(self.pending) > 0:
+            self._add_tokens(np.zeros(1, dtype=np.int32))
+
+        if len(self.lit_chunks) > 0:
+            lits = np.concatenate(self.lit_chunks)
+        else:
+            lits = np.zeros(0, dtype=np.int32)
+
+        return lits, self.offsets[:self.n_clauses + 1]
+
+    def _filter_lines(self, text: str) -> List[str]:
+
+        lines = list()
+        for line in text.splitlines():
+            line = line.strip()
+            if len(line) == 0 or line[0] == "c":
+                continue
+            elif line[0] == "p":
+                self._read_header(line)
+                continue
+            elif line[0] == "%":
+                self.done = True
+                break
+            lines.append(line)
+
+        return lines
+
+    def _read_header(self, line: str):
+
+        fields = line.split()
+        if len(fields) != 4 or fields[1] != "cnf":
+            raise ValueError(f"Invalid DIMACS header: {line}")
+
+        # preallocate the clause offsets for the announced clause count
+        n_clauses = int(fields[3])
+        if self.n_clauses == 0 and n_clauses + 1 > len(self.offsets):
+            self.offsets = np.zeros(n_clauses + 1, dtype=np.int64)
+
+        return
+
+    def _parse_lines(self, text: str) -> np.ndarray:
+
+        tokens = list()
+        for line in text.splitlines():
+            lits = [int(token) for token in line.split()]
+            if len(lits) > 0:
+                tokens.extend(lits)
+                tokens.append(0)
+
+        return np.array(tokens, dtype=np.int32)
+
+    def _add_tokens(self, tokens: np.ndarray):
+
+        if len(self.pending) > 0:
+            tokens = np.concatenate([self.pending, tokens])
+
+        zeros = np.flatnonzero(tokens == 0)
+        if len(zeros) == 0:
+            self.pending = tokens
+            return
+        self.pending = tokens[zeros[-1] + 1:]
+
+        # the k-th terminator at position z closes a clause ending after
+        # z - k literals of this batch
+        body = tokens[:zeros[-1] + 1]
+        lits = body[body != 0]
+        ends = self.n_lits + zeros - np.arange(len(zeros))
+
+        n_clauses = self.n_clauses + len(zeros)
+        if n_clauses + 1 > len(self.offsets):
+            offsets = np.zeros(
+                max(2 * len(self.offsets), n_clauses + 1), dtype=np.int64
+            )
+            offsets[:self.n_clauses + 1] = self.offsets[:self.n_clauses + 1]
+            self.offsets = offsets
+        self.offsets[self.n_clauses + 1:n_clauses + 1] = ends
+
+        self.lit_chunks.append(lits)
+        self.n_clauses = n_clauses
+        self.n_lits += len(lits)
+
+        return
@@ -2,16 +2,32 @@
 from dataclasses import dataclass, asdict
 import glob
 import json
-from multiprocessing import Pool
+import multiprocessing as mp
+from multiprocessing.connection import Connection, wait
+from multiprocessing.pool import Pool
 import os
 import time
-from typing import Dict, List, Self
+import traceback
+import itertools
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    Type,
+    Union
+)
 
 import numpy as np
 
 from .formulas import CNF
+from .preprocessing import Preprocessor
 from .solvers import DPLL
-from .solvers._exceptions import TimeoutException
+from .solvers._base_solver import Solver
+from .solvers._exceptions import BudgetException, TimeoutException
 from .selectors import BaseSelector
 
 
@@ -20,20 +36,42 @@ class Result:
 
     result: bool
     runtime: float
-    n_calls: int
+    n_calls: Optional[int]
+    n_restarts: Optional[int]
+    status: str
+    stats: Dict
 
 
 DATASET_SIZE = 100
 
+# formulas generated per task; fixed so that a seed gives the same dataset
+# with or without a pool
+GENERATE_CHUNK = 10
+
+# seconds a task may overrun the solver's own timeout before its worker is
+# killed
+KILL_GRACE = 5.0
+
 
 class Dataset:
 
+    # all formulas of a dataset share three flat arrays: the literals, the
+    # clause offsets into them, and the formula offsets into the clauses
+    LITS_FILE = "lits.npy"
+    OFFSETS_FILE = "offsets.npy"
+    FORMULAS_FILE = "formulas.npy"
+
     def __init__(self):
 
         self.formulas = list()
         self.config = dict()
         self.path = None
 
+        # memory-mapped arrays of a cached dataset
+        self._lits = None
+        self._offsets = None
+        self._formula_offsets = None
+
         return
 
     @classmethod
@@ -46,30 +84,69 @@ class Dataset:
 
         dataset.path = dir_path
 
-        for cnf_fp in glob.glob(os.path.join(dir_path, "*.cnf")):
-            dataset.formulas.append(CNF.from_dimacs(cnf_fp))
+        # datasets written before the binary cache hold one DIMACS file per
+        # formula, and are parsed eagerly
+        if os.path.exists(os.path.join(dir_path, cls.LITS_FILE)):
+            dataset._lits = np.load(
+                os.path.join(dir_path, cls.LITS_FILE), mmap_mode="r"
+            )
+            dataset._offsets = np.load(
+                os.path.join(dir_path, cls.OFFSETS_FILE), mmap_mode="r"
+            )
+            dataset._formula_offsets = np.load(
+                os.path.join(dir_path, cls.FORMULAS_FILE), mmap_mode="r"
+            )
+        else:
+            for cnf_fp in glob.glob(os.path.join(dir_path, "*.cnf")):
+                dataset.formulas.append(CNF.from_dimacs(cnf_fp))
 
         with open(os.path.join(dir_path, "config.json"), "r") as f:
             dataset.config = json.load(f)
 
         return dataset
 
+    @property
+    def is_cached(self) -> bool:
+
+        return self._lits is not None
+
     @classmethod
-    def generate(cls, n_vars: int, n_clauses: int) -> Self:
+    def generate(
+        cls,
+        n_vars: int,
+        n_clauses: int,
+        seed: Union[int, Sequence[int]] = None,
+        pool: Pool = None
+    ) -> Self:
 
         dataset = cls()
         dataset.config["n"] = n_vars
         dataset.config["l"] = n_clauses
+        if seed is not None:
+            dataset.config["seed"] = seed
 
-        dataset._generate_formulas(DATASET_SIZE)
+        dataset._generate_formulas(DATASET_SIZE, seed, pool)
 
         return dataset
 
-    def _generate_formulas(self, n: int):
+    def _generate_formulas(
+        self, n: int, seed: Union[int, Sequence[int]], pool: Pool = None
+    ):
 
-        for _ in range(n):
-            cnf = CNF.generate(n=self.config["n"], l=self.config["l"])
-            self.formulas.append(cnf)
+        # every chunk is drawn in one go from a seed of its own
+        sizes = [
+            min(GENERATE_CHUNK, n - start)
+            for start in range(0, n, GENERATE_CHUNK)
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = [
+            (self.config["n"], self.config["l"], size, 3, child_seed)
+            for size, child_seed in zip(sizes, seeds)
+        ]
+
+        starmap = itertools.starmap if pool is None else pool.starmap
+        for formulas in starmap(CNF.generate_many, tasks):
+            self.formulas.extend(formulas)
 
         return
 
@@ -80,10 +157,31 @@ class Dataset:
         elif not os.path.exists(path):
             os.makedirs(path)
 
+        formulas = [self[i] for i in range(len(self))]
         self.path = path
 
-        for i in range(len(self)):
-            self[i].to_dimacs(os.path.join(self.path, f"f{i}.cnf"))
+        # literals keep their variable ids, as in a DIMACS file
+        arrays = [formula.as_arrays() for formula in formulas]
+        n_lits = np.cumsum([0] + [len(lits) for lits, _ in arrays])
+        n_clauses = np.cumsum([0] + [len(formula) for formula in formulas])
+        lits = np.concatenate(
+            [np.zeros(0, dtype=np.int32)] + [lits for lits, _ in arrays]
+        )
+        offsets = np.concatenate(
+            [np.zeros(1, dtype=np.int64)] + [
+                offsets[1:] + base
+                for (_, offsets), base in zip(arrays, n_lits)
+            ]
+        )
+
+        np.save(os.path.join(path, self.LITS_FILE), lits.astype(np.int32))
+        np.save(
+            os.path.join(path, self.OFFSETS_FILE), offsets.astype(np.int64)
+        )
+        np.save(
+            os.path.join(path, self.FORMULAS_FILE),
+            n_clauses.astype(np.int64)
+        )
 
         with open(os.path.join(self.path, "config.json"), "w") as f:
             json.dump(self.config, f)
@@ -92,11 +190,22 @@ class Dataset:
 
     def __len__(self) -> int:
 
+        if self.is_cached:
+            return len(self._formula_offsets) - 1
+
         return len(self.formulas)
 
     def __getitem__(self, idx: int) -> CNF:
 
-        return self.formulas[idx]
+        if not self.is_cached:
+            return self.formulas[idx]
+
+        # only the pages of this formula are read from the cache
+        start, end = self._formula_offsets[idx:idx + 2]
+        offsets = np.asarray(self._offsets[start:end + 1])
+        lits = np.asarray(self._lits[offsets[0]:offsets[-1]])
+
+        return CNF._from_numbered(lits, offsets - offsets[0])
 
 
 class Experiment:
@@ -107,10 +216,24 @@ class Experiment:
         n_vars: int,
         min_ratio: float,
         max_ratio: float,
-        ratio_step: float
+        ratio_step: float,
+        solver: Type[Solver] = DPLL,
+        preprocess: bool = False,
+        solver_options: Dict = None,
+        n_workers: int = None,
+        timeout: float = 300.0,
+        kill_grace: float = KILL_GRACE,
+        seed: int = None
     ):
 
         self.selector = selector
+        self.solver = solver
+        self.solver_options = solver_options or dict()
+        self.preprocess = preprocess
+        self.n_workers = n_workers or os.cpu_count()
+        self.timeout = timeout
+        self.kill_grace = kill_grace
+        self.seed = seed
 
         self.n_vars = n_vars
         self.min_ratio = min_ratio
@@ -130,67 +253,105 @@ class Experiment:
             start=self.min_ratio, stop=self.max_ratio, step=self.ratio_step
         )
 
-        for ratio in ratios:
-            l = int(ratio * self.n_vars)
-            self._run_experiment(
-                dataset_path,
-                l,
-                n_iter,
-                os.path.join(outpath, f"n={self.n_vars}")
-            )
+        # the pool generates the datasets; the formulas are solved by
+        # workers of our own, which can be killed, see `_run_tasks`
+        with Pool(processes=self.n_workers) as pool:
+            for ratio in ratios:
+                l = int(ratio * self.n_vars)
+                self._run_experiment(
+                    pool,
+                    dataset_path,
+                    l,
+                    n_iter,
+                    os.path.join(outpath, f"n={self.n_vars}")
+                )
 
         return
 
     def _run_experiment(
-        self, dataset_path: str, l: int, n_iter: int, outpath: str
+        self,
+        pool: Pool,
+        dataset_path: str,
+        l: int,
+        n_iter: int,
+        outpath: str
     ):
 
         print("Loading dataset...")
-        dataset = self._get_dataset(os.path.join(dataset_path, f"l={l}"), l)
+        dataset = self._get_dataset(
+            os.path.join(dataset_path, f"l={l}"), l, pool
+        )
 
         assert len(dataset) >= n_iter
 
         print("Starting...")
-        results = Pool(processes=8).starmap(
-            self._solve_formula,
-            [[formula] for formula in dataset.formulas[:n_iter]]
-        )
+        results = [None] * n_iter
+        tasks = [(dataset.path, i) for i in range(n_iter)]
+        for k, (i, result) in enumerate(_run_tasks(self, tasks)):
+            results[i] = result
+            print(f"[{k + 1}/{n_iter}] formula {i}")
         self._write_results(results, l, dataset.config, outpath)
 
         return
 
-    def _get_dataset(self, dataset_path: str, l: int) -> Dataset:
+    def _get_dataset(
+        self, dataset_path: str, l: int, pool: Pool = None
+    ) -> Dataset:
 
         if not os.path.exists(dataset_path):
             print(f"Generating dataset for n={self.n_vars}, l={l}")
-            dataset = Dataset.generate(n_vars=self.n_vars, n_clauses=l)
+            dataset = Dataset.generate(
+                n_vars=self.n_vars,
+                n_clauses=l,
+                seed=None if self.seed is None else [self.seed, l],
+                pool=pool
+            )
             print(f"- {dataset_path}")
             dataset.write(dataset_path)
 
+        # datasets of per-formula DIMACS files are converted once
         dataset = Dataset.from_cache(dataset_path)
+        if not dataset.is_cached:
+            dataset.write(dataset_path, overwrite=True)
+            dataset = Dataset.from_cache(dataset_path)
 
         return dataset
 
-    def _solve_formula(self, formula: CNF):
+    def _solve_formula(self, formula: CNF) -> Result:
 
-        solver = DPLL(selector=self.selector)
+        solver = self.solver(selector=self.selector, **self.solver_options)
 
+        # the solver stops itself at the timeout or when a work budget is
+        # used up; `_run_tasks` kills the worker if it fails to
         t_start = time.time()
         try:
-            solution = solver.solve(formula, timeout=300.0)
-            t_end = time.time()
-            print(solver._n_calls, t_end - t_start)
+            if self.preprocess:
+                preprocessor = Preprocessor()
+                reduced = preprocessor.preprocess(formula)
+                solution = solver.solve(reduced, timeout=self.timeout)
+                if solution is not None:
+                    solution = preprocessor.reconstruct(solution)
+            else:
+                solution = solver.solve(formula, timeout=self.timeout)
+            status = "unsat" if solution is None else "sat"
+        except BudgetException:
+            solution = None
+            status = "budget"
         except TimeoutException:
             solution = None
-            print("(aborted)")
-            return None
+            status = "timeout"
+        t_end = time.time()
+        print(solver._n_calls, t_end - t_start, status)
         if solution is not None:
             assert formula.evaluate(solution)
 
         return Result(
             result=solution is not None,
             runtime=t_end - t_start,
-            n_calls=solver._n_calls
+            n_calls=solver._n_calls,
+            n_restarts=solver._n_restarts,
+            status=status,
+            stats=asdict(solver.stats)
         )
 
     def _write_results(
@@ -212,3 +373,140 @@ class Experiment:
             json.dump(results_json, f)
 
         return
+
+
+def _run_tasks(
+    experiment: Experiment, tasks: Sequence[Tuple[str, int]]
+) -> Iterator[Tuple[int, Result]]:
+
+    # solves the tasks in worker processes, one task at a time each, and
+    # yields the results as they come; a worker still busy `kill_grace`
+    # seconds past the solver's timeout is terminated, whatever it is stuck
+    # in, and replaced, and its task is recorded as killed
+    kill_after = None
+    if experiment.timeout is not None:
+        kill_after = experiment.timeout + experiment.kill_grace
+
+    pending = list(reversed(tasks))
+    idle = list()
+    running = dict()
+    try:
+        while len(pending) > 0 or len(running) > 0:
+            while len(pending) > 0 and len(running) < experiment.n_workers:
+                if len(idle) > 0:
+                    worker = idle.pop()
+                else:
+                    worker = _start_worker(experiment)
+                task = pending.pop()
+                worker[1].send(task)
+                running[worker[1]] = (worker, task, time.time())
+
+            timeout = None
+            if kill_after is not None:
+                t_first = min(t_sent for _, _, t_sent in running.values())
+                timeout = max(t_first + kill_after - time.time(), 0.0)
+
+            for conn in wait(list(running), timeout=timeout):
+                worker, task, t_sent = running.pop(conn)
+                try:
+                    ok, answer = conn.recv()
+                except EOFError:
+                    # the worker died on its own, e.g. out of memory
+                    _stop_worker(worker)
+                    yield task[1], _killed_result(time.time() - t_sent)
+                    continue
+                idle.append(worker)
+                if not ok:
+                    raise RuntimeError(
+                        f"Solving formula {task[1]} failed:\n{answer}"
+                    )
+                yield answer
+
+            for conn, (worker, task, t_sent) in list(running.items()):
+                runtime = time.time() - t_sent
+                if kill_after is not None and runtime >= kill_after:
+                    del running[conn]
+                    _stop_worker(worker)
+                    yield task[1], _killed_result(runtime)
+    finally:
+        for worker in idle:
+            _stop_worker(worker)
+        for worker, _, _ in running.values():
+            _stop_worker(worker)
+
+    return
+
+
+def _start_worker(experiment: Experiment) -> Tuple[mp.Process, Connection]:
+
+    conn, worker_conn = mp.Pipe()
+    process = mp.Process(
+        target=_task_worker, args=(experiment, worker_conn), daemon=True
+    )
+    process.start()
+
+    # only the worker's end stays open, so that its death reads as EOF
+    worker_conn.close()
+
+    return process, conn
+
+
+def _stop_worker(worker: Tuple[mp.Process, Connection]):
+
+    process, conn = worker
+    if process.is_alive():
+        process.terminate()
+    process.join()
+    conn.close()
+
+    return
+
+
+def _killed_result(runtime: float) -> Result:
+
+    # nothing is known about the search of a killed task
+    return Result(
+        result=False,
+        runtime=runtime,
+        n_calls=None,
+        n_restarts=None,
+        status="killed",
+        stats=dict()
+    )
+
+
+def _task_worker(experiment: Experiment, conn: Connection):
+
+    # the traceback is sent as text, the exception itself may not pickle
+    _init_worker(experiment)
+    while True:
+        task = conn.recv()
+        try:
+            conn.send((True, _solve_cached(task)))
+        except Exception:
+            conn.send((False, traceback.format_exc()))
+
+
+# the experiment a worker process solves formulas for, set once per worker,
+# and the datasets it has mapped so far
+_worker_experiment = None
+_worker_datasets = dict()
+
+
+def _init_worker(experiment: Experiment):
+
+    global _worker_experiment
+    _worker_experiment = experiment
+    _worker_datasets.clear()
+
+    return
+
+
+def _solve_cached(task: Tuple[str, int]) -> Tuple[int, Result]:
+
+    dataset_path, i = task
+    if dataset_path not in _worker_datasets:
+        _worker_datasets[dataset_path] = Dataset.from_cache(dataset_path)
+    formula = _worker_datasets[dataset_path][i]
+
+    return i, _worker_experiment._solve_formula(formula)
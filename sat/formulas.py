@@ -1,26 +1,59 @@
-
 import abc
-from typing import List, Self, Set
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Self, Set, Tuple, Union
 
 import numpy as np
 
 from .clauses import Conjunction, Disjunction
 from .constants import NOT, Tau
+from .dimacs import read_dimacs
+
+
+# anything np.random.default_rng accepts
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def normalize_clause(lits: Iterable[int]) -> Optional[List[int]]:
+
+    # the literals without duplicates, in their order, or None for a
+    # tautology, which every assignment satisfies
+    clause = list(dict.fromkeys(lits))
+    clause_set = set(clause)
+    if any(-lit in clause_set for lit in clause):
+        return None
+
+    return clause
+
+
+@dataclass
+class SimplifyStats:
+
+    duplicates: int = 0
+    tautologies: int = 0
+    subsumed: int = 0
+    strengthened: int = 0
 
 
 class ClausalFormula(abc.ABC):
 
     def __init__(self, clauses: List = None):
 
-        if clauses is None:
-            clauses = list()
-
-        self.clauses = clauses
+        # variables are interned once: `_var_map` maps a name to its id
+        # (1-based) and `_var_names` maps an id back to its name
         self._var_map = dict()
+        self._var_names = [None]
         self._n_vars = 0
 
-        for clause in self.clauses:
-            self._update_var_map(clause.literals)
+        # literals are signed variable ids, stored flat; clause i spans
+        # `_lits[_offsets[i]:_offsets[i + 1]]`
+        self._lits = array("i")
+        self._offsets = array("q", [0])
+
+        if clauses is not None:
+            for clause in clauses:
+                self.add_clause(*clause.literals)
 
         return
 
@@ -40,15 +73,23 @@ class ClausalFormula(abc.ABC):
 
     def __getitem__(self, idx: int) -> Disjunction:
 
-        return self.clauses[idx]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+
+        return self._literal_connective(
+            *[self.decode(lit) for lit in self.int_clause(idx)]
+        )
 
     def __iter__(self):
 
-        return iter(self.clauses)
+        for i in range(len(self)):
+            yield self[i]
 
     def __len__(self) -> int:
 
-        return len(self.clauses)
+        return len(self._offsets) - 1
 
     def __str__(self) -> str:
 
@@ -72,40 +113,168 @@ class ClausalFormula(abc.ABC):
 
         raise NotImplementedError
 
+    @property
+    def clauses(self) -> List:
+
+        return list(self)
+
     @property
     def vars(self) -> Set[str]:
 
         return set(self._var_map.keys())
 
+    @property
+    def n_vars(self) -> int:
+
+        return self._n_vars
+
+    def var_name(self, var: int) -> str:
+
+        return self._var_names[var]
+
+    def encode(self, literal: str) -> int:
+
+        if literal.startswith(NOT):
+            return -self._intern(literal[1:])
+
+        return self._intern(literal)
+
+    def decode(self, lit: int) -> str:
+
+        if lit < 0:
+            return NOT + self._var_names[-lit]
+
+        return self._var_names[lit]
+
+    def _intern(self, var: str) -> int:
+
+        var_id = self._var_map.get(var)
+        if var_id is None:
+            self._n_vars += 1
+            var_id = self._n_vars
+            self._var_map[var] = var_id
+            self._var_names.append(var)
+
+        return var_id
+
+    def int_clause(self, idx: int) -> array:
+
+        return self._lits[self._offsets[idx]:self._offsets[idx + 1]]
+
+    def int_clauses(self) -> Iterator[array]:
+
+        for i in range(len(self)):
+            yield self._lits[self._offsets[i]:self._offsets[i + 1]]
+
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+
+        # copies, since a view would pin the buffers and keep the formula
+        # from growing
+        lits = np.array(self._lits, dtype=np.int32)
+        offsets = np.array(self._offsets, dtype=np.int64)
+
+        return lits, offsets
+
+    def as_matrix(self) -> np.ndarray:
+
+        # one row per clause, padded with zeros to the longest clause
+        lits, offsets = self.as_arrays()
+        lengths = np.diff(offsets)
+        matrix = np.zeros((len(self), lengths.max(initial=0)), np.int32)
+        rows = np.repeat(np.arange(len(self)), lengths)
+        cols = np.arange(len(lits)) - np.repeat(offsets[:-1], lengths)
+        matrix[rows, cols] = lits
+
+        return matrix
+
+    def copy(self) -> Self:
+
+        formula = type(self)()
+        formula._var_map = dict(self._var_map)
+        formula._var_names = list(self._var_names)
+        formula._n_vars = self._n_vars
+        formula._lits = array("i", self._lits)
+        formula._offsets = array("q", self._offsets)
+
+        return formula
+
     def add_clause(self, *literals):
 
-        self.clauses.append(self._literal_connective(*literals))
-        self._update_var_map(literals)
+        self._lits.extend([self.encode(literal) for literal in literals])
+        self._offsets.append(len(self._lits))
+
+        return
+
+    def add_int_clause(self, *lits: int):
+
+        for lit in lits:
+            if lit == 0 or abs(lit) > self._n_vars:
+                raise ValueError(f"Unknown variable id: {lit}")
+
+        self._lits.extend(lits)
+        self._offsets.append(len(self._lits))
 
         return
 
-    def _update_var_map(self, literals: List[str]):
+    def _replace_clauses(self, int_clauses: Iterable[Iterable[int]]):
 
-        for literal in literals:
-            if literal.startswith(NOT):
-                literal = literal[1:]
-            if literal not in self._var_map.keys():
-                self._n_vars += 1
-                self._var_map[literal] = self._n_vars
+        self._lits = array("i")
+        self._offsets = array("q", [0])
+        for lits in int_clauses:
+            self._lits.extend(lits)
+            self._offsets.append(len(self._lits))
 
         return
 
+    def _set_arrays(self, lits: np.ndarray, offsets: np.ndarray):
+
+        self._lits = array("i")
+        self._lits.frombytes(np.ascontiguousarray(lits, np.int32).tobytes())
+        self._offsets = array("q")
+        self._offsets.frombytes(
+            np.ascontiguousarray(offsets, np.int64).tobytes()
+        )
+
+        return
+
+    def _lit_values(self, tau: Tau) -> List[int]:
+
+        # indexed by signed literal: 1 if true, -1 if false, 0 if unassigned
+        # (negative literals wrap around to the back half of the list)
+        lit_values = [0] * (2 * self._n_vars + 1)
+        for var, val in tau.items():
+            var_id = self._var_map.get(var)
+            if var_id is None:
+                continue
+            lit_values[var_id] = 1 if val else -1
+            lit_values[-var_id] = -1 if val else 1
+
+        return lit_values
+
     def has_empty_clauses(self) -> bool:
 
-        return any([clause.is_empty() for clause in self])
+        offsets = self._offsets
+
+        return any(
+            offsets[i] == offsets[i + 1] for i in range(len(self))
+        )
 
     def has_unit_clauses(self) -> bool:
 
-        return any([clause.is_unit() for clause in self])
+        offsets = self._offsets
+
+        return any(
+            offsets[i + 1] - offsets[i] == 1 for i in range(len(self))
+        )
 
     def get_unit_clauses(self) -> Set[str]:
 
-        return [clause for clause in self if clause.is_unit()]
+        offsets = self._offsets
+
+        return [
+            self[i] for i in range(len(self))
+            if offsets[i + 1] - offsets[i] == 1
+        ]
 
 
 class DNF(ClausalFormula):
@@ -126,24 +295,32 @@ class CNF(ClausalFormula):
     @classmethod
     def from_dimacs(cls, fp: str) -> Self:
 
+        return cls._from_numbered(*read_dimacs(fp))
+
+    @classmethod
+    def _from_numbered(
+        cls, lits: np.ndarray, offsets: np.ndarray, name_offset: int = 0
+    ) -> Self:
+
+        # builds the var map in bulk: variable v is named p{v + name_offset}
+        # and interned in order of first appearance
         cnf = cls()
 
-        with open(fp, "r") as f:
-            dimacs_clauses = [line.strip() for line in f.readlines()]
+        abs_lits = np.abs(lits)
+        numbers, first = np.unique(abs_lits, return_index=True)
+        numbers = numbers[np.argsort(first)]
 
-        for dimacs_clause in dimacs_clauses:
-            if dimacs_clause[0] in ("c", "p"):
-                continue
-            elif dimacs_clause[0] == "%":
-                break
-            literals = []
-            for i_str in dimacs_clause.split():
-                i = int(i_str)
-                if i > 0:
-                    literals.append(f"p{i}")
-                elif i < 0:
-                    literals.append(f"{NOT}p{abs(i)}")
-            cnf.add_clause(*literals)
+        ids = np.zeros(numbers.max() + 1 if len(numbers) > 0 else 1, np.int32)
+        ids[numbers] = np.arange(1, len(numbers) + 1, dtype=np.int32)
+
+        cnf._var_names = [None] + [
+            f"p{number + name_offset}" for number in numbers
+        ]
+        cnf._var_map = {
+            name: var for var, name in enumerate(cnf._var_names) if var > 0
+        }
+        cnf._n_vars = len(numbers)
+        cnf._set_arrays(np.where(lits > 0, 1, -1) * ids[abs_lits], offsets)
 
         return cnf
 
@@ -151,9 +328,47 @@ class CNF(ClausalFormula):
     def from_dnf(cls, dnf: DNF) -> Self:
 
         cnf = cls()
-        dnf_clauses = [clause.literals for clause in dnf]
+        cnf._var_map = dict(dnf._var_map)
+        cnf._var_names = list(dnf._var_names)
+        cnf._n_vars = dnf._n_vars
+
+        dnf_clauses = list(dnf.int_clauses())
         for cnf_clause in CNF._build_clause_from_dnf(dnf_clauses):
-            cnf.add_clause(*cnf_clause)
+            cnf.add_int_clause(*cnf_clause)
+
+        return cnf
+
+    @classmethod
+    def from_dnf_definitional(cls, dnf: DNF, aux_prefix: str) -> Self:
+
+        # Plaisted-Greenbaum encoding: every term of two or more literals
+        # gets an auxiliary variable `{aux_prefix}{i}` implying the term, and
+        # one clause asserts that some term holds; equisatisfiable with the
+        # distribution of `from_dnf` but linear in the size of the DNF
+        cnf = cls()
+        cnf._var_map = dict(dnf._var_map)
+        cnf._var_names = list(dnf._var_names)
+        cnf._n_vars = dnf._n_vars
+
+        dnf_clauses = list(dnf.int_clauses())
+        if len(dnf_clauses) == 1:
+            for literal in dnf_clauses[0]:
+                cnf.add_int_clause(literal)
+            return cnf
+
+        terms = list()
+        for i, dnf_clause in enumerate(dnf_clauses):
+            if len(dnf_clause) == 1:
+                terms.append(dnf_clause[0])
+                continue
+            name = f"{aux_prefix}{i}"
+            if name in cnf._var_map:
+                raise ValueError(f"Auxiliary variable {name} is in use")
+            aux = cnf._intern(name)
+            for literal in dnf_clause:
+                cnf.add_int_clause(-aux, literal)
+            terms.append(aux)
+        cnf.add_int_clause(*terms)
 
         return cnf
 
@@ -169,21 +384,46 @@ class CNF(ClausalFormula):
                     yield [literal] + x
 
     @classmethod
-    def generate(cls, n: int, l: int, k: int = 3) -> Self:
+    def generate(
+        cls, n: int, l: int, k: int = 3, seed: SeedLike = None
+    ) -> Self:
 
-        domain = [f"p{i}" for i in range(n)]
-        cnf = cls()
-
-        for _ in range(l):
-            vars = np.random.choice(domain, size=k, replace=False)
-            lits = [
-                f"{NOT}{var}"
-                if np.random.uniform() > 0.5 else var
-                for var in vars
-            ]
-            cnf.add_clause(*lits)
+        return cls.generate_many(n, l, 1, k=k, seed=seed)[0]
 
-        return cnf
+    @classmethod
+    def generate_many(
+        cls, n: int, l: int, count: int, k: int = 3, seed: SeedLike = None
+    ) -> List[Self]:
+
+        # `count` random k-CNFs over p0, ..., p{n - 1}, drawn all at once:
+        # every clause has k distinct variables, each negated with
+        # probability 1/2
+        if k > n:
+            raise ValueError(f"Cannot draw {k} distinct variables of {n}")
+        rng = np.random.default_rng(seed)
+        n_rows = count * l
+
+        if 2 * k > n:
+            vars = np.argsort(rng.random((n_rows, n)), axis=1)[:, :k]
+        else:
+            # rows repeating a variable are redrawn, which is rare for
+            # small k
+            vars = rng.integers(n, size=(n_rows, k))
+            while True:
+                ordered = np.sort(vars, axis=1)
+                repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+                if not repeated.any():
+                    break
+                vars[repeated] = rng.integers(n, size=(repeated.sum(), k))
+        signs = np.where(rng.random((n_rows, k)) > 0.5, -1, 1)
+
+        lits = (signs * (vars + 1)).astype(np.int32).reshape(count, l * k)
+        offsets = np.arange(0, l * k + 1, k, dtype=np.int64)
+
+        return [
+            cls._from_numbered(lits[i], offsets, name_offset=-1)
+            for i in range(count)
+        ]
 
     @property
     def _clause_connective(self):
@@ -197,90 +437,162 @@ class CNF(ClausalFormula):
 
     def append_cnf(self, cnf: Self):
 
-        for clause in cnf:
-            self.add_clause(*clause.literals)
+        # map the other formula's variable ids onto ours, interning lazily so
+        # that only variables which actually occur get added
+        remap = [0] * (cnf._n_vars + 1)
+        for lit in cnf._lits:
+            var = abs(lit)
+            if remap[var] == 0:
+                remap[var] = self._intern(cnf._var_names[var])
+            self._lits.append(remap[var] if lit > 0 else -remap[var])
+        base = self._offsets[-1]
+        self._offsets.extend([base + offset for offset in cnf._offsets[1:]])
 
         return
 
-    def simplify(self):
+    def simplify(self) -> SimplifyStats:
 
-        i = 0
-        n = 0
-        while i < len(self):
-            clause_i = self[i]
-            j = i + 1
-            while j < len(self):
-                clause_j = self[j]
-                if clause_i.is_equivalent(clause_j):
-                    self.clauses.remove(clause_j)
-                    n += 1
-                else:
-                    j += 1
-            i += 1
+        stats = SimplifyStats()
 
-        print(f"Removed {n} clauses")
+        # exact duplicates share a canonical key; tautologies are always
+        # satisfied, and would wrongly subsume and strengthen the others
+        clauses = list()
+        seen = set()
+        for lits in self.int_clauses():
+            clause = normalize_clause(lits)
+            if clause is None:
+                stats.tautologies += 1
+                continue
+            key = tuple(sorted(clause))
+            if key in seen:
+                stats.duplicates += 1
+            else:
+                seen.add(key)
+                clauses.append(clause)
+
+        clause_sets = [set(clause) for clause in clauses]
+        occurs = defaultdict(set)
+        for c, clause_set in enumerate(clause_sets):
+            for lit in clause_set:
+                occurs[lit].add(c)
+
+        # every clause C, smallest first, removes the clauses it subsumes and
+        # strengthens those it resolves with on one literal; all candidates
+        # contain C's least frequent variable in one polarity or the other
+        queue = deque(
+            sorted(range(len(clauses)), key=lambda c: len(clauses[c]))
+        )
+        while len(queue) > 0:
+            c = queue.popleft()
+            clause_set = clause_sets[c]
+            if clause_set is None or len(clause_set) == 0:
+                continue
 
-        return
+            pivot = min(
+                clause_set,
+                key=lambda lit: len(occurs[lit]) + len(occurs[-lit])
+            )
+            for d in list(occurs[pivot] | occurs[-pivot]):
+                other_set = clause_sets[d]
+                if d == c or other_set is None or \
+                   len(other_set) < len(clause_set):
+                    continue
+
+                missing = [lit for lit in clause_set if lit not in other_set]
+                if len(missing) == 0:
+                    for lit in other_set:
+                        occurs[lit].discard(d)
+                    clause_sets[d] = None
+                    stats.subsumed += 1
+                elif len(missing) == 1 and -missing[0] in other_set:
+                    other_set.discard(-missing[0])
+                    occurs[-missing[0]].discard(d)
+                    stats.strengthened += 1
+                    queue.append(d)
+
+        self._replace_clauses(
+            [
+                [lit for lit in clause if lit in clause_set]
+                for clause, clause_set in zip(clauses, clause_sets)
+                if clause_set is not None
+            ]
+        )
+
+        return stats
 
     def reduce(self, tau: Tau):
 
-        i = 0
-        # n = 0
-        while i < len(self):
-            clause = self[i]
-            # print(i)
-            remove = False
-            # print(clause)
-            for var, val in tau.items():
-                # import pdb; pdb.set_trace()
-                # if n == 2 and var == "p2":
-                #     import pdb; pdb.set_trace()
-                if val:
-                    if var in clause.literals:
-                        remove = True
-                    else:
-                        clause.remove(f"{NOT}{var}")
-                        # print(f"- Changed: {clause}")
-                else:
-                    if f"{NOT}{var}" in clause.literals:
-                        remove = True
-                    else:
-                        clause.remove(var)
-                        # print(f"- Changed: {clause}")
-            if remove:
-                self.clauses.remove(clause)
-                # print("- Removed")
-            else:
-                i += 1
-            # n += 1
+        self._reduce_lit_values(self._lit_values(tau))
+
+        return
+
+    def _reduce_lit_values(self, lit_values: List[int]):
+
+        reduced = list()
+        for lits in self.int_clauses():
+            if any(lit_values[lit] == 1 for lit in lits):
+                continue
+            reduced.append([lit for lit in lits if lit_values[lit] == 0])
+
+        self._replace_clauses(reduced)
 
         return
 
     def evaluate(self, tau: Tau):
 
-        result = True
-        for clause in self:
-            clause_result = False
-            for literal in clause:
-                if literal.startswith(NOT):
-                    var = literal[1:]
-                    if var not in tau:
-                        continue
-                    clause_result |= not tau[var]
-                else:
-                    var = literal
-                    if var not in tau:
-                        continue
-                    clause_result |= tau[var]
-            result &= clause_result
-
-        return result
+        values = np.zeros((1, self._n_vars + 1), dtype=np.int8)
+        for var, val in tau.items():
+            var_id = self._var_map.get(var)
+            if var_id is not None:
+                values[0, var_id] = 1 if val else -1
+
+        return bool(self._satisfied_clauses(values).all())
+
+    def evaluate_batch(
+        self, assignments: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+
+        # column j of `assignments` holds the value of variable id j + 1;
+        # returns whether each assignment satisfies the formula, and how many
+        # assignments falsify each clause
+        assignments = np.asarray(assignments, dtype=bool)
+        if assignments.ndim != 2 or assignments.shape[1] != self._n_vars:
+            raise ValueError(
+                f"Expected an (assignments x {self._n_vars}) matrix, "
+                f"got shape {assignments.shape}"
+            )
+
+        values = np.zeros((len(assignments), self._n_vars + 1), np.int8)
+        values[:, 1:] = np.where(assignments, 1, -1)
+        satisfied = self._satisfied_clauses(values)
+
+        return satisfied.all(axis=1), (~satisfied).sum(axis=0)
+
+    def _satisfied_clauses(
+        self, values: np.ndarray, max_cells: int = 1 << 24
+    ) -> np.ndarray:
+
+        # `values` holds one row of variable values (1 true, -1 false, 0
+        # unassigned) per assignment, with column 0 left unassigned for the
+        # padding of the literal matrix; returns an (assignments x clauses)
+        # matrix of satisfied flags, evaluated in row blocks to bound memory
+        matrix = self.as_matrix()
+        vars = np.abs(matrix)
+        signs = np.sign(matrix).astype(np.int8)
+
+        satisfied = np.zeros((len(values), len(self)), dtype=bool)
+        block = max(1, max_cells // max(matrix.size, 1))
+        for start in range(0, len(values), block):
+            lit_values = values[start:start + block][:, vars] * signs
+            satisfied[start:start + block] = (lit_values == 1).any(axis=2)
+
+        return satisfied
 
     def to_dimacs(self, fp: str):
 
         with open(fp, "w") as f:
             f.write(f"p cnf {self._n_vars} {len(self)}\n")
-            for clause in self:
-                f.write(clause.to_dimacs(var_map=self._var_map) + "\n")
+            for lits in self.int_clauses():
+                f.write(" ".join([str(lit) for lit in lits] + ["0"]) + "\n")
 
         return
@@ -0,0 +1,256 @@
+from typing import List, Optional
+
+import numpy as np
+
+from .formulas import CNF, normalize_clause
+from .trail import Trail
+
+
+class OccurrenceIndex:
+
+    def __init__(self, formula: CNF, trail: Trail):
+
+        self.formula = formula
+        self.trail = trail
+
+        n_vars = formula.n_vars
+
+        # duplicate literals and tautologies are dropped, as by the solvers
+        self.clauses = list()
+        for lits in formula.int_clauses():
+            clause = normalize_clause(lits)
+            if clause is not None and len(clause) > 0:
+                self.clauses.append(clause)
+
+        # static occurrence lists, indexed by signed literal
+        self.occurs = [list() for _ in range(2 * n_vars + 1)]
+        for c, clause in enumerate(self.clauses):
+            for lit in clause:
+                self.occurs[lit].append(c)
+
+        # the index mirrors the trail in its own values so that it can catch
+        # up lazily, undoing and redoing assignments in LIFO order
+        self.values = [0] * (2 * n_vars + 1)
+        self._applied = list()
+        self._low = 0
+        trail.backtrack_hooks.append(self._on_backtrack)
+
+        # per clause: number of true and of unassigned literals; a clause is
+        # active (part of the residual formula) while it has no true literal
+        self.n_true = [0] * len(self.clauses)
+        self.n_free = [len(clause) for clause in self.clauses]
+
+        # active clauses, bucketed by residual length and in a flat list
+        # (with positions) to draw from uniformly
+        max_len = max(self.n_free, default=0)
+        self.buckets = [set() for _ in range(max_len + 1)]
+        self.active = list()
+        self._active_pos = [0] * len(self.clauses)
+
+        # per literal: occurrences in active clauses while unassigned; per
+        # variable: total of both polarities, bucketed by score, and split by
+        # whether the clause has two or at least three residual literals
+        self.counts = [0] * (2 * n_vars + 1)
+        self.scores = [0] * (n_vars + 1)
+        self._score_buckets = [set(range(1, n_vars + 1))]
+        self._max_score = 0
+        self.short_counts = [0] * (n_vars + 1)
+        self.long_counts = [0] * (n_vars + 1)
+        self.two_clause_vars = set()
+
+        for c, clause in enumerate(self.clauses):
+            self._activate(c)
+            for lit in clause:
+                self._add(lit, len(clause) >= 3)
+
+        return
+
+    def __len__(self) -> int:
+
+        return len(self.active)
+
+    def sync(self):
+
+        # undo what the trail has backtracked over, then apply what it has
+        # assigned since the last call
+        while len(self._applied) > self._low:
+            self._unassign(self._applied.pop())
+        for lit in self.trail.lits[len(self._applied):]:
+            self._assign(lit)
+            self._applied.append(lit)
+        self._low = len(self._applied)
+
+        return
+
+    def modal_var(self) -> Optional[int]:
+
+        if self._max_score == 0:
+            return None
+
+        return next(iter(self._score_buckets[self._max_score]))
+
+    def two_clause_var(self) -> Optional[int]:
+
+        # a variable whose residual occurrences are all in binary clauses
+        if len(self.two_clause_vars) == 0:
+            return None
+
+        return next(iter(self.two_clause_vars))
+
+    def random_literal(self) -> Optional[int]:
+
+        if len(self.active) == 0:
+            return None
+
+        clause = self.clauses[self.active[np.random.randint(len(self.active))]]
+        free = [lit for lit in clause if self.values[lit] == 0]
+
+        return free[np.random.randint(len(free))]
+
+    def close(self):
+
+        self.trail.backtrack_hooks.remove(self._on_backtrack)
+
+        return
+
+    def _on_backtrack(self, undone: List[int]):
+
+        self._low = min(self._low, len(self.trail))
+
+        return
+
+    def _assign(self, lit: int):
+
+        values = self.values
+        n_free = self.n_free
+
+        for c in self.occurs[lit]:
+            self.n_true[c] += 1
+            if self.n_true[c] == 1:
+                self._deactivate(c)
+                long = n_free[c] >= 3
+                for q in self.clauses[c]:
+                    if values[q] == 0:
+                        self._remove(q, long)
+            n_free[c] -= 1
+
+        for c in self.occurs[-lit]:
+            if self.n_true[c] == 0:
+                self._remove(-lit, n_free[c] >= 3)
+                self._resize(c, n_free[c], n_free[c] - 1)
+                if n_free[c] == 3:
+                    for q in self.clauses[c]:
+                        if values[q] == 0 and q != -lit:
+                            self._remove(q, True)
+                            self._add(q, False)
+            n_free[c] -= 1
+
+        values[lit] = 1
+        values[-lit] = -1
+
+        return
+
+    def _unassign(self, lit: int):
+
+        values = self.values
+        n_free = self.n_free
+
+        values[lit] = 0
+        values[-lit] = 0
+
+        for c in self.occurs[-lit]:
+            n_free[c] += 1
+            if self.n_true[c] == 0:
+                self._resize(c, n_free[c] - 1, n_free[c])
+                if n_free[c] == 3:
+                    for q in self.clauses[c]:
+                        if values[q] == 0 and q != -lit:
+                            self._remove(q, False)
+                            self._add(q, True)
+                self._add(-lit, n_free[c] >= 3)
+
+        for c in self.occurs[lit]:
+            n_free[c] += 1
+            self.n_true[c] -= 1
+            if self.n_true[c] == 0:
+                self._activate(c)
+                long = n_free[c] >= 3
+                for q in self.clauses[c]:
+                    if values[q] == 0:
+                        self._add(q, long)
+
+        return
+
+    def _activate(self, c: int):
+
+        self.buckets[self.n_free[c]].add(c)
+        self._active_pos[c] = len(self.active)
+        self.active.append(c)
+
+        return
+
+    def _deactivate(self, c: int):
+
+        self.buckets[self.n_free[c]].discard(c)
+        last = self.active.pop()
+        if last != c:
+            pos = self._active_pos[c]
+            self.active[pos] = last
+            self._active_pos[last] = pos
+
+        return
+
+    def _resize(self, c: int, old_n_free: int, n_free: int):
+
+        self.buckets[old_n_free].discard(c)
+        self.buckets[n_free].add(c)
+
+        return
+
+    def _add(self, lit: int, long: bool):
+
+        var = abs(lit)
+        self.counts[lit] += 1
+        if long:
+            self.long_counts[var] += 1
+        else:
+            self.short_counts[var] += 1
+        self._rescore(var, 1)
+
+        return
+
+    def _remove(self, lit: int, long: bool):
+
+        var = abs(lit)
+        self.counts[lit] -= 1
+        if long:
+            self.long_counts[var] -= 1
+        else:
+            self.short_counts[var] -= 1
+        self._rescore(var, -1)
+
+        return
+
+    def _rescore(self, var: int, delta: int):
+
+        # scores only ever move by one, so the bucket of the maximum score
+        # can be tracked without a heap
+        score = self.scores[var]
+        self._score_buckets[score].discard(var)
+        score += delta
+        self.scores[var] = score
+        if score == len(self._score_buckets):
+            self._score_buckets.append(set())
+        self._score_buckets[score].add(var)
+        if score > self._max_score:
+            self._max_score = score
+        while self._max_score > 0 and \
+                len(self._score_buckets[self._max_score]) == 0:
+            self._max_score -= 1
+
+        if self.short_counts[var] > 0 and self.long_counts[var] == 0:
+            self.two_clause_vars.add(var)
+        else:
+            self.two_clause_vars.discard(var)
+
+        return
@@ -0,0 +1,171 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, List, Set
+
+from .constants import Tau
+from .formulas import CNF, normalize_clause
+
+
+@dataclass
+class PreprocessStats:
+
+    duplicates: int = 0
+    tautologies: int = 0
+    subsumed: int = 0
+    strengthened: int = 0
+    pure_literals: int = 0
+    eliminated_vars: int = 0
+    removed_clauses: int = 0
+
+
+class Preprocessor:
+
+    def __init__(
+        self,
+        max_growth: int = 0,
+        max_occurrences: int = 20,
+        max_resolvent_len: int = 20
+    ):
+
+        # a variable is only eliminated if it occurs at most
+        # `max_occurrences` times, none of its resolvents is longer than
+        # `max_resolvent_len`, and replacing its clauses by their resolvents
+        # adds at most `max_growth` clauses
+        self.max_growth = max_growth
+        self.max_occurrences = max_occurrences
+        self.max_resolvent_len = max_resolvent_len
+
+        self.stats = PreprocessStats()
+        self._formula = None
+        self._eliminated = list()
+
+        return
+
+    def preprocess(self, formula: CNF, frozen: Iterable[str] = ()) -> CNF:
+
+        # returns a formula over the same variables that is satisfiable iff
+        # `formula` is; models of it are mapped back by `reconstruct`
+        self.stats = PreprocessStats()
+        self._formula = formula
+        self._eliminated = list()
+
+        reduced = formula.copy()
+        simplify_stats = reduced.simplify()
+        self.stats.duplicates = simplify_stats.duplicates
+        self.stats.tautologies = simplify_stats.tautologies
+        self.stats.subsumed = simplify_stats.subsumed
+        self.stats.strengthened = simplify_stats.strengthened
+
+        clauses = [list(lits) for lits in reduced.int_clauses()]
+        frozen_vars = {formula._var_map[var] for var in frozen}
+        clauses = self._eliminate(clauses, frozen_vars)
+        self.stats.removed_clauses = len(formula) - len(clauses)
+        reduced._replace_clauses(clauses)
+
+        return reduced
+
+    def reconstruct(self, tau: Tau) -> Tau:
+
+        # extends a model of the preprocessed formula to the eliminated
+        # variables, newest elimination first: a variable is made true only
+        # if one of its positive clauses is not satisfied otherwise
+        formula = self._formula
+        values = [0] * (formula.n_vars + 1)
+        for var, val in tau.items():
+            values[formula._var_map[var]] = 1 if val else -1
+
+        for var, pos_clauses in reversed(self._eliminated):
+            values[var] = -1
+            for clause in pos_clauses:
+                if not any(
+                    values[abs(lit)] == (1 if lit > 0 else -1)
+                    for lit in clause if lit != var
+                ):
+                    values[var] = 1
+                    break
+
+        return {
+            formula.var_name(var): values[var] != -1
+            for var in range(1, formula.n_vars + 1)
+        }
+
+    def _eliminate(
+        self, clauses: List[List[int]], frozen: Set[int]
+    ) -> List[List[int]]:
+
+        alive = [True] * len(clauses)
+        occurs = defaultdict(set)
+        for c, clause in enumerate(clauses):
+            for lit in clause:
+                occurs[lit].add(c)
+
+        def remove(c: int):
+
+            alive[c] = False
+            for lit in clauses[c]:
+                occurs[lit].discard(c)
+
+            return
+
+        # cheapest candidates first; eliminating a variable changes the
+        # occurrences of its neighbours, so passes repeat until none applies
+        changed = True
+        while changed:
+            changed = False
+            candidates = sorted(
+                {abs(lit) for lit in occurs if len(occurs[lit]) > 0} - frozen,
+                key=lambda var: len(occurs[var]) * len(occurs[-var])
+            )
+            for var in candidates:
+                pos = [clauses[c] for c in occurs[var]]
+                neg = [clauses[c] for c in occurs[-var]]
+                if len(pos) + len(neg) == 0:
+                    continue
+
+                if len(pos) == 0 or len(neg) == 0:
+                    self.stats.pure_literals += 1
+                    resolvents = list()
+                elif len(pos) + len(neg) > self.max_occurrences:
+                    continue
+                else:
+                    resolvents = self._resolve_all(pos, neg, var)
+                    if resolvents is None:
+                        continue
+                    self.stats.eliminated_vars += 1
+
+                self._eliminated.append((var, pos))
+                for c in list(occurs[var] | occurs[-var]):
+                    remove(c)
+                for resolvent in resolvents:
+                    d = len(clauses)
+                    clauses.append(resolvent)
+                    alive.append(True)
+                    for lit in resolvent:
+                        occurs[lit].add(d)
+                changed = True
+
+        return [clause for clause, kept in zip(clauses, alive) if kept]
+
+    def _resolve_all(
+        self, pos: List[List[int]], neg: List[List[int]], var: int
+    ) -> List[List[int]]:
+
+        # all non-tautological resolvents on `var`, or None if they exceed
+        # the elimination bounds
+        resolvents = list()
+        limit = len(pos) + len(neg) + self.max_growth
+        for pos_clause in pos:
+            for neg_clause in neg:
+                resolvent = normalize_clause(
+                    [lit for lit in pos_clause if lit != var] +
+                    [lit for lit in neg_clause if lit != -var]
+                )
+                if resolvent is None:
+                    continue
+                if len(resolvent) > self.max_resolvent_len:
+                    return None
+                resolvents.append(resolvent)
+                if len(resolvents) > limit:
+                    return None
+
+        return resolvents
@@ -1,16 +1,35 @@
 
-from typing import Dict
+from typing import Dict, Iterator
 
-from .constants import NOT
+from .cardinality import exactly_one
+from .constants import NOT, Tau
 from .formulas import CNF, DNF
+from .solvers import iter_models
+
+
+# prefix of the auxiliary variables of the rule and cardinality encodings; the
+# puzzle's own propositions all start with "p"
+AUX_PREFIX = "aux"
 
 
 class Puzzle(object):
 
-    def __init__(self, n: int, vals: Dict[str, str]):
+    def __init__(
+        self,
+        n: int,
+        vals: Dict[str, str],
+        definitional: bool = True,
+        cardinality: str = "sequential"
+    ):
 
         self._n = n
 
+        # rules are encoded with auxiliary variables, linear in the number of
+        # houses, or else distributed into exponentially many clauses; the
+        # uniqueness of values uses one of the encodings of `cardinality`
+        self._definitional = definitional
+        self._cardinality = cardinality
+
         if any([len(vals[cat]) != self._n for cat in vals.keys()]):
             raise Exception
         self._vals = vals
@@ -35,45 +54,25 @@ class Puzzle(object):
 
         self._baseline_rules = CNF()
 
-        # ensure no value can occur at two houses simultaneously
+        # ensure every value occurs at exactly one house
         for cat in self._vals.keys():
-            cat_rule = CNF()
             for val in self._vals[cat]:
-                val_rule = CNF()
-                val_rule.add_clause(
-                    *[self._prop(cat, val, i) for i in range(self._n)]
+                exactly_one(
+                    self._baseline_rules,
+                    [self._prop(cat, val, i) for i in range(self._n)],
+                    encoding=self._cardinality,
+                    aux_prefix=AUX_PREFIX
                 )
-                for i in range(0, self._n):
-                    for j in range(i + 1, self._n):
-                        val_rule.add_clause(
-                            self._prop(cat, val, i, neg=True),
-                            self._prop(cat, val, j, neg=True)
-                        )
-                cat_rule.append_cnf(val_rule)
-            self._baseline_rules.append_cnf(cat_rule)
-
-        # ensure two values can occur at no house simultaneously
+
+        # ensure every house has exactly one value of every category
         for cat in self._vals.keys():
-            cat_rule = CNF()
             for pos in range(self._n):
-                pos_rule = CNF()
-                pos_rule.add_clause(
-                    *[self._prop(cat, val, pos) for val in self._vals[cat]]
+                exactly_one(
+                    self._baseline_rules,
+                    [self._prop(cat, val, pos) for val in self._vals[cat]],
+                    encoding=self._cardinality,
+                    aux_prefix=AUX_PREFIX
                 )
-                for i_1 in range(0, len(self._vals[cat])):
-                    val_1 = self._vals[cat][i_1]
-                    for i_2 in range(i_1 + 1, len(self._vals[cat])):
-                        val_2 = self._vals[cat][i_2]
-                        pos_rule.add_clause(
-                            self._prop(cat, val_1, pos, neg=True),
-                            self._prop(cat, val_2, pos, neg=True)
-                        )
-                # import pdb; pdb.set_trace()
-                cat_rule.append_cnf(pos_rule)
-            # import pdb; pdb.set_trace()
-            self._baseline_rules.append_cnf(cat_rule)
-
-        # import pdb; pdb.set_trace()
 
         return
 
@@ -132,10 +131,43 @@ class Puzzle(object):
 
         cnf = CNF()
 
-        for rule in self.rules:
-            cnf.append_cnf(CNF.from_dnf(rule))
+        for r, rule in enumerate(self.rules):
+            if self._definitional:
+                cnf.append_cnf(
+                    CNF.from_dnf_definitional(rule, f"{AUX_PREFIX}{r}_")
+                )
+            else:
+                cnf.append_cnf(CNF.from_dnf(rule))
 
         cnf.append_cnf(self._baseline_rules)
         cnf.simplify()
 
         return cnf
+
+    def decode(self, tau: Tau) -> Dict[int, Dict[str, str]]:
+
+        # the value of every category at every house; auxiliary variables
+        # are not part of the solution
+        solution = {pos: dict() for pos in range(self._n)}
+        for cat, vals in self._vals.items():
+            for val in vals:
+                for pos in range(self._n):
+                    if tau.get(self._prop(cat, val, pos), False):
+                        solution[pos][cat] = val
+
+        return solution
+
+    def iter_solutions(
+        self, limit: int = None
+    ) -> Iterator[Dict[int, Dict[str, str]]]:
+
+        # the distinct solutions, decoded; the auxiliary variables are left
+        # out of the enumeration so that each solution is found once
+        cnf = self.cnf
+        projection = [
+            var for var in cnf.vars if not var.startswith(AUX_PREFIX)
+        ]
+        for tau in iter_models(cnf, projection=projection, limit=limit):
+            yield self.decode(tau)
+
+        return
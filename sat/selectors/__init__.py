@@ -4,3 +4,4 @@ from .naive import NaiveSelector
 from .random_choice import RandomChoiceSelector
 from .two_clause import TwoClauseSelector
 from .modal_variable import ModalVariableSelector
+from .vsids import VSIDSSelector
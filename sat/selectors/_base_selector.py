@@ -1,30 +1,54 @@
-
 import abc
+from typing import List, Optional, Tuple
 
 from ..formulas import CNF
-from ..constants import NOT
+from ..occurrences import OccurrenceIndex
+from ..trail import Trail
 
 
 class BaseSelector(abc.ABC):
 
     def __init__(self):
 
+        self._index = None
+
         return
 
     @abc.abstractclassmethod
-    def select(self, formula: CNF) -> (str, bool):
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
 
         raise NotImplementedError
 
-    def _lit_to_var(self, lit: str) -> str:
+    def reset(self, formula: CNF, trail: Trail):
+
+        # called by the solvers before each search; derived state is rebuilt
+        # lazily on the next selection
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+        return
+
+    def on_conflict(self, clause: List[int]):
+
+        # called by the solvers with every clause they learn, or with the
+        # falsified clause if they do not learn
+        return
+
+    def _lit_to_var(self, lit: int) -> int:
+
+        return abs(lit)
+
+    def assign(self, lit: int) -> bool:
 
-        if lit.startswith(NOT):
-            var = lit[1:]
-        else:
-            var = lit
+        return lit > 0
 
-        return var
+    def _occurrences(self, formula: CNF, trail: Trail) -> OccurrenceIndex:
 
-    def assign(self, lit: str) -> bool:
+        if self._index is None or self._index.trail is not trail or \
+           self._index.formula is not formula:
+            self.reset(formula, trail)
+            self._index = OccurrenceIndex(formula, trail)
+        self._index.sync()
 
-        return not lit.startswith(NOT)
+        return self._index
@@ -0,0 +1,98 @@
+from typing import List
+
+
+class ActivityHeap:
+
+    def __init__(self, activity: List[float]):
+
+        # binary max-heap of variables keyed by `activity`, with the position
+        # of every variable so that it can be found and moved in O(log n)
+        self.activity = activity
+        self.heap = list()
+        self.pos = [-1] * len(activity)
+
+        return
+
+    def __len__(self) -> int:
+
+        return len(self.heap)
+
+    def __contains__(self, var: int) -> bool:
+
+        return self.pos[var] >= 0
+
+    def push(self, var: int):
+
+        if self.pos[var] >= 0:
+            return
+
+        self.pos[var] = len(self.heap)
+        self.heap.append(var)
+        self._sift_up(self.pos[var])
+
+        return
+
+    def pop(self) -> int:
+
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if len(heap) > 0:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+
+        return top
+
+    def increased(self, var: int):
+
+        # restores the heap order after the activity of `var` went up
+        if self.pos[var] >= 0:
+            self._sift_up(self.pos[var])
+
+        return
+
+    def _sift_up(self, i: int):
+
+        heap = self.heap
+        pos = self.pos
+        activity = self.activity
+
+        var = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if activity[heap[parent]] >= activity[var]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = var
+        pos[var] = i
+
+        return
+
+    def _sift_down(self, i: int):
+
+        heap = self.heap
+        pos = self.pos
+        activity = self.activity
+
+        var = heap[i]
+        n = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and \
+               activity[heap[child + 1]] > activity[heap[child]]:
+                child += 1
+            if activity[heap[child]] <= activity[var]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = var
+        pos[var] = i
+
+        return
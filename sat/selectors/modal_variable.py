@@ -1,9 +1,8 @@
-
-from collections import defaultdict
+from typing import Optional, Tuple
 
 from ._base_selector import BaseSelector
 from ..formulas import CNF
-from ..constants import NOT
+from ..trail import Trail
 
 
 class ModalVariableSelector(BaseSelector):
@@ -14,23 +13,11 @@ class ModalVariableSelector(BaseSelector):
 
         return
 
-    def select(self, formula: CNF) -> (str, bool):
-
-        pos_occ = defaultdict(int)
-        neg_occ = defaultdict(int)
-        max_occ = 0
-        modal_var = None
-
-        for clause in formula:
-            for lit in clause:
-                if lit.startswith(NOT):
-                    var = lit[1:]
-                    neg_occ[var] += 1
-                else:
-                    var = lit
-                    pos_occ[var] += 1
-                if pos_occ[var] + neg_occ[var] > max_occ:
-                    max_occ = pos_occ[var] + neg_occ[var]
-                    modal_var = var
-
-        return (modal_var, pos_occ[modal_var] > neg_occ[modal_var])
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
+
+        index = self._occurrences(formula, trail)
+        modal_var = index.modal_var()
+        if modal_var is None:
+            return None
+
+        return (modal_var, index.counts[modal_var] > index.counts[-modal_var])
@@ -1,6 +1,8 @@
+from typing import List, Optional, Tuple
 
 from ._base_selector import BaseSelector
 from ..formulas import CNF
+from ..trail import Trail
 
 
 class NaiveSelector(BaseSelector):
@@ -9,12 +11,75 @@ class NaiveSelector(BaseSelector):
 
         super().__init__(*args, **kwargs)
 
+        self._formula = None
+        self._trail = None
+
+        # every clause before the cursor is satisfied or falsified by the
+        # trail; one (trail length, cursor) checkpoint per selection lets a
+        # backtrack rewind it instead of rescanning from the first clause
+        self._cursor = 0
+        self._checkpoints = list()
+
+        return
+
+    def reset(self, formula: CNF, trail: Trail):
+
+        super().reset(formula, trail)
+
+        if self._trail is not None:
+            self._trail.backtrack_hooks.remove(self._on_backtrack)
+        self._formula = formula
+        self._trail = trail
+        trail.backtrack_hooks.append(self._on_backtrack)
+
+        self._cursor = 0
+        self._checkpoints = list()
+
         return
 
-    def select(self, formula: CNF) -> (str, bool):
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
+
+        if self._trail is not trail or self._formula is not formula:
+            self.reset(formula, trail)
+
+        # the first literal of the first clause left in the residual formula
+        values = trail.values
+        lit = None
+        c = self._cursor
+        while c < len(formula):
+            lits = formula.int_clause(c)
+            for clause_lit in lits:
+                if values[clause_lit] == 1:
+                    break
+                elif values[clause_lit] == 0 and lit is None:
+                    lit = clause_lit
+            else:
+                if lit is not None:
+                    break
+            lit = None
+            c += 1
+
+        self._cursor = c
+        if len(self._checkpoints) > 0 and \
+           self._checkpoints[-1][0] == len(trail):
+            self._checkpoints[-1] = (len(trail), c)
+        else:
+            self._checkpoints.append((len(trail), c))
+
+        if lit is None:
+            return None
 
-        lit = formula[0][0]
         val = self.assign(lit)
         var = self._lit_to_var(lit)
 
         return (var, val)
+
+    def _on_backtrack(self, undone: List[int]):
+
+        # a checkpoint stays valid while the trail keeps its prefix
+        checkpoints = self._checkpoints
+        while len(checkpoints) > 0 and checkpoints[-1][0] > len(self._trail):
+            checkpoints.pop()
+        self._cursor = checkpoints[-1][1] if len(checkpoints) > 0 else 0
+
+        return
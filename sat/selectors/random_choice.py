@@ -1,8 +1,8 @@
-
-import numpy as np
+from typing import Optional, Tuple
 
 from ._base_selector import BaseSelector
 from ..formulas import CNF
+from ..trail import Trail
 
 
 class RandomChoiceSelector(BaseSelector):
@@ -13,11 +13,11 @@ class RandomChoiceSelector(BaseSelector):
 
         return
 
-    def select(self, formula: CNF) -> (str, bool):
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
 
-        clause_i = np.random.randint(0, high=len(formula))
-        lit_i = np.random.randint(0, high=len(formula[clause_i]))
-        lit = formula[clause_i][lit_i]
+        lit = self._occurrences(formula, trail).random_literal()
+        if lit is None:
+            return None
 
         val = self.assign(lit)
         var = self._lit_to_var(lit)
@@ -1,8 +1,8 @@
+from typing import Optional, Tuple
 
 from ._base_selector import BaseSelector
-from .random_choice import RandomChoiceSelector
 from ..formulas import CNF
-from ..constants import NOT
+from ..trail import Trail
 
 
 class TwoClauseSelector(BaseSelector):
@@ -11,31 +11,19 @@ class TwoClauseSelector(BaseSelector):
 
         super().__init__(*args, **kwargs)
 
-        self.fallback_selector = RandomChoiceSelector()
-
         return
 
-    def select(self, formula: CNF) -> (str, bool):
-
-        # print(len([clause for clause in formula if len(clause) == 2]))
-
-        selection = None
-        for var in formula.vars:
-            clauses = [
-                clause for clause in formula
-                if (
-                    var in clause.literals or f"{NOT}{var}" in clause.literals
-                )
-            ]
-            # print(var, clauses)
-            if len(clauses) > 0 and \
-               max([len(clause) for clause in clauses]) == 2:
-                selection = (var, True)
-                break
-
-        if selection is None:
-            # print("falling back")
-            selection = self.fallback_selector.select(formula)
-        # print(selection)
-
-        return selection
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
+
+        index = self._occurrences(formula, trail)
+
+        var = index.two_clause_var()
+        if var is not None:
+            return (var, True)
+
+        # fall back to a random literal of a random residual clause
+        lit = index.random_literal()
+        if lit is None:
+            return None
+
+        return (self._lit_to_var(lit), self.assign(lit))
@@ -0,0 +1,95 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ._base_selector import BaseSelector
+from ._heap import ActivityHeap
+from ..formulas import CNF
+from ..trail import Trail
+
+
+class VSIDSSelector(BaseSelector):
+
+    def __init__(
+        self,
+        *args,
+        decay: float = 0.95,
+        default_phase: bool = True,
+        **kwargs
+    ):
+
+        super().__init__(*args, **kwargs)
+
+        self.decay = decay
+        self.default_phase = default_phase
+
+        self._trail = None
+        self.activity = [0.0]
+        self.phases = [default_phase]
+        self._heap = ActivityHeap(self.activity)
+        self._inc = 1.0
+
+        return
+
+    def reset(self, formula: CNF, trail: Trail):
+
+        super().reset(formula, trail)
+
+        if self._trail is not None:
+            self._trail.backtrack_hooks.remove(self._on_backtrack)
+        self._trail = trail
+        trail.backtrack_hooks.append(self._on_backtrack)
+
+        # occurrence counts, scaled below a single bump, break ties until
+        # the first conflicts are seen
+        lits, _ = formula.as_arrays()
+        occ = np.bincount(np.abs(lits), minlength=formula.n_vars + 1)
+        self.activity = (0.5 * occ / max(occ.max(initial=0), 1)).tolist()
+        self.phases = [self.default_phase] * (formula.n_vars + 1)
+        self._inc = 1.0
+
+        self._heap = ActivityHeap(self.activity)
+        for var in range(1, formula.n_vars + 1):
+            self._heap.push(var)
+
+        return
+
+    def select(self, formula: CNF, trail: Trail) -> Optional[Tuple[int, bool]]:
+
+        if self._trail is not trail:
+            self.reset(formula, trail)
+
+        values = trail.values
+        heap = self._heap
+        while len(heap) > 0:
+            var = heap.pop()
+            if values[var] == 0:
+                return (var, self.phases[var])
+
+        return None
+
+    def on_conflict(self, clause: List[int]):
+
+        activity = self.activity
+        for lit in clause:
+            var = abs(lit)
+            activity[var] += self._inc
+            self._heap.increased(var)
+
+        # decaying every score is the same as growing the bump
+        self._inc /= self.decay
+        if self._inc > 1e100:
+            for var in range(len(activity)):
+                activity[var] *= 1e-100
+            self._inc *= 1e-100
+
+        return
+
+    def _on_backtrack(self, undone: List[int]):
+
+        for lit in undone:
+            var = abs(lit)
+            self.phases[var] = lit > 0
+            self._heap.push(var)
+
+        return
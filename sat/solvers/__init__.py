@@ -1,2 +1,18 @@
 
 from .dpll import DPLL
+from .cdcl import CDCL
+from .incremental import IncrementalSolver
+from .enumeration import iter_models
+from .portfolio import PortfolioSolver
+from .cube import CubeAndConquer
+from ._restarts import (
+    RestartPolicy, NoRestarts, LubyRestarts, GeometricRestarts
+)
+from ._stats import SolverStats
+from .observers import (
+    SearchObserver,
+    SelectorLearning,
+    TraceLogger,
+    ProgressLogger,
+    SamplingProfiler
+)
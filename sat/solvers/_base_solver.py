@@ -1,15 +1,109 @@
-
 import abc
+import time
+from typing import List
 
-from ..formulas import ClausalFormula
+from ._exceptions import BudgetException, TimeoutException
+from .observers import EVENTS, SearchObserver, TraceLogger
+from ._propagation import WatchedPropagator
+from ._restarts import RestartPolicy, NoRestarts
+from ._stats import SolverStats
+from ..formulas import ClausalFormula, CNF, normalize_clause
+from ..trail import Trail
 
 
 class Solver:
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        restart_policy: RestartPolicy = None,
+        phase_saving: bool = False,
+        max_decisions: int = None,
+        max_propagations: int = None,
+        max_conflicts: int = None
+    ):
 
         self._verbose = verbose
-        self._n_calls = 0
+        self.stats = SolverStats()
+
+        # observers of the search, see `add_observer`
+        self._observers = list()
+        self._update_hooks()
+        if verbose:
+            self.add_observer(TraceLogger())
+
+        self._restart_policy = restart_policy or NoRestarts()
+        self._phase_saving = phase_saving
+
+        # deterministic work budgets, unlimited if None
+        self._max_decisions = max_decisions
+        self._max_propagations = max_propagations
+        self._max_conflicts = max_conflicts
+
+        return
+
+    # the counters predate `stats` and remain as aliases into it
+    @property
+    def _n_calls(self) -> int:
+
+        return self.stats.decisions
+
+    @_n_calls.setter
+    def _n_calls(self, value: int):
+
+        self.stats.decisions = value
+
+        return
+
+    @property
+    def _n_conflicts(self) -> int:
+
+        return self.stats.conflicts
+
+    @_n_conflicts.setter
+    def _n_conflicts(self, value: int):
+
+        self.stats.conflicts = value
+
+        return
+
+    @property
+    def _n_restarts(self) -> int:
+
+        return self.stats.restarts
+
+    @_n_restarts.setter
+    def _n_restarts(self, value: int):
+
+        self.stats.restarts = value
+
+        return
+
+    def add_observer(self, observer: SearchObserver):
+
+        self._observers.append(observer)
+        self._update_hooks()
+
+        return
+
+    def remove_observer(self, observer: SearchObserver):
+
+        self._observers.remove(observer)
+        self._update_hooks()
+
+        return
+
+    def _update_hooks(self):
+
+        # one list of bound methods per event, holding only the observers
+        # that override it; an event nobody listens to costs the search an
+        # empty loop
+        for event in EVENTS:
+            hooks = [
+                getattr(observer, event) for observer in self._observers
+                if observer.overrides(event)
+            ]
+            setattr(self, f"_{event}_hooks", hooks)
 
         return
 
@@ -17,3 +111,101 @@ class Solver:
     def solve(self, formula: ClausalFormula):
 
         raise NotImplementedError
+
+    @staticmethod
+    def _load_clauses(formula: CNF) -> List[List[int]]:
+
+        # drop duplicate literals and tautologies, which never constrain the
+        # search
+        clauses = list()
+        for lits in formula.int_clauses():
+            clause = normalize_clause(lits)
+            if clause is not None:
+                clauses.append(clause)
+
+        return clauses
+
+    def _init_budgets(self, timeout: float = None):
+
+        def limit(budget: int) -> float:
+
+            return float("inf") if budget is None else budget
+
+        self._decision_limit = limit(self._max_decisions)
+        self._propagation_limit = limit(self._max_propagations)
+        self._conflict_limit = limit(self._max_conflicts)
+
+        self._timeout = timeout
+        self._t_start = time.time()
+        self._n_checks = 0
+
+        return
+
+    def _check_budgets(self, propagator: WatchedPropagator):
+
+        # the counters are compared on every iteration of the search loop,
+        # the clock is only read every 256th time
+        if self._n_calls >= self._decision_limit or \
+           propagator.n_propagations >= self._propagation_limit or \
+           self._n_conflicts >= self._conflict_limit:
+            raise BudgetException
+
+        self._n_checks += 1
+        if self._timeout is not None and self._n_checks & 0xFF == 0 and \
+           time.time() - self._t_start > self._timeout:
+            raise TimeoutException
+
+        return
+
+    def _init_restarts(self, trail: Trail):
+
+        self._restart_policy.reset()
+        self._conflicts_to_restart = self._restart_policy.next_interval()
+
+        # the last value of every variable, 0 until it is first undone
+        self._phases = [0] * (trail.n_vars + 1)
+        if self._phase_saving:
+            trail.backtrack_hooks.append(self._save_phases)
+
+        return
+
+    def _count_conflict(self):
+
+        if self._conflicts_to_restart is not None:
+            self._conflicts_to_restart -= 1
+
+        return
+
+    def _restart_due(self) -> bool:
+
+        return self._conflicts_to_restart is not None and \
+            self._conflicts_to_restart <= 0
+
+    def _restart(self, propagator: WatchedPropagator):
+
+        propagator.backtrack(0)
+        self._n_restarts += 1
+        self._conflicts_to_restart = self._restart_policy.next_interval()
+        for hook in self._on_restart_hooks:
+            hook(self)
+
+        return
+
+    def _phase(self, var: int, val: bool) -> bool:
+
+        # a saved phase overrides the selector's choice of polarity
+        if self._phases[var] == 0:
+            return val
+
+        return self._phases[var] > 0
+
+    def _save_phases(self, undone: List[int]):
+
+        phases = self._phases
+        for lit in undone:
+            if lit > 0:
+                phases[lit] = 1
+            else:
+                phases[-lit] = -1
+
+        return
@@ -7,3 +7,8 @@ class UNSATException(Exception):
 class TimeoutException(Exception):
 
     pass
+
+
+class BudgetException(TimeoutException):
+
+    pass
@@ -0,0 +1,150 @@
+from typing import List, Optional
+
+from ..trail import Trail
+
+
+class WatchedPropagator:
+
+    def __init__(self, trail: Trail):
+
+        self.trail = trail
+        self.clauses = list()
+
+        # clauses watching each literal, indexed by signed literal; every
+        # clause of two or more literals watches its first two positions
+        self.watches = [list() for _ in range(2 * trail.n_vars + 1)]
+
+        # the propagation queue is the suffix of the trail from `qhead` on
+        self.qhead = 0
+
+        # trail literals whose watches have been visited, over all calls
+        self.n_propagations = 0
+
+        return
+
+    def grow(self, n_vars: int):
+
+        # grows the trail and the watch lists to `n_vars` variables
+        old_n_vars = self.trail.n_vars
+        if n_vars <= old_n_vars:
+            return
+
+        watches = [list() for _ in range(2 * n_vars + 1)]
+        for var in range(1, old_n_vars + 1):
+            watches[var] = self.watches[var]
+            watches[-var] = self.watches[-var]
+        self.watches = watches
+        self.trail.grow(n_vars)
+
+        return
+
+    def add_clause(self, clause: List[int]) -> bool:
+
+        # adds a clause at decision level 0, assigning it if it is unit;
+        # returns False if the clause is falsified by the current trail
+        values = self.trail.values
+
+        free = [lit for lit in clause if values[lit] != -1]
+        if len(free) == 0:
+            return False
+        elif any(values[lit] == 1 for lit in free):
+            if len(clause) == 1:
+                return True
+        elif len(free) == 1:
+            self.trail.assign(free[0], reason=clause)
+            if len(clause) == 1:
+                return True
+
+        # move two non-false literals (or the single one) to the front
+        for i, lit in enumerate(free[:2]):
+            k = clause.index(lit)
+            clause[i], clause[k] = clause[k], clause[i]
+
+        self.clauses.append(clause)
+        self.attach(clause)
+
+        return True
+
+    def attach(self, clause: List[int]):
+
+        self.watches[clause[0]].append(clause)
+        self.watches[clause[1]].append(clause)
+
+        return
+
+    def detach(self, clause: List[int]):
+
+        # compare by identity, equal clauses may be watched more than once
+        for lit in clause[:2]:
+            self.watches[lit] = [
+                watched for watched in self.watches[lit]
+                if watched is not clause
+            ]
+
+        return
+
+    def propagate(self) -> Optional[List[int]]:
+
+        # visits only the clauses watching a literal falsified since the last
+        # call; returns the conflicting clause, if any
+        trail = self.trail
+        values = trail.values
+        watches = self.watches
+        lits = trail.lits
+        qstart = self.qhead
+
+        while self.qhead < len(lits):
+            false_lit = -lits[self.qhead]
+            self.qhead += 1
+
+            watchers = watches[false_lit]
+            n = len(watchers)
+            i = 0
+            j = 0
+            while i < n:
+                clause = watchers[i]
+                i += 1
+
+                # keep the falsified watch in the second position
+                if clause[0] == false_lit:
+                    clause[0] = clause[1]
+                    clause[1] = false_lit
+                first = clause[0]
+                if values[first] == 1:
+                    watchers[j] = clause
+                    j += 1
+                    continue
+
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if values[lit] != -1:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    watchers[j] = clause
+                    j += 1
+                    if values[first] == -1:
+                        while i < n:
+                            watchers[j] = watchers[i]
+                            i += 1
+                            j += 1
+                        del watchers[j:]
+                        self.n_propagations += self.qhead - qstart
+                        self.qhead = len(lits)
+                        return clause
+                    trail.assign(first, reason=clause)
+
+            del watchers[j:]
+
+        self.n_propagations += self.qhead - qstart
+
+        return None
+
+    def backtrack(self, level: int) -> List[int]:
+
+        undone = self.trail.backtrack(level)
+        self.qhead = min(self.qhead, len(self.trail))
+
+        return undone
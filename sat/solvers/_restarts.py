@@ -0,0 +1,85 @@
+import abc
+from typing import Optional
+
+
+class RestartPolicy(abc.ABC):
+
+    def reset(self):
+
+        return
+
+    @abc.abstractmethod
+    def next_interval(self) -> Optional[int]:
+
+        # number of conflicts until the next restart, None for never
+        raise NotImplementedError
+
+
+class NoRestarts(RestartPolicy):
+
+    def next_interval(self) -> Optional[int]:
+
+        return None
+
+
+class LubyRestarts(RestartPolicy):
+
+    def __init__(self, unit: int = 100):
+
+        self.unit = unit
+        self._i = 0
+
+        return
+
+    def reset(self):
+
+        self._i = 0
+
+        return
+
+    def next_interval(self) -> Optional[int]:
+
+        self._i += 1
+
+        return self.unit * luby(self._i)
+
+
+class GeometricRestarts(RestartPolicy):
+
+    def __init__(self, first: int = 100, factor: float = 1.5):
+
+        self.first = first
+        self.factor = factor
+        self._interval = first
+
+        return
+
+    def reset(self):
+
+        self._interval = self.first
+
+        return
+
+    def next_interval(self) -> Optional[int]:
+
+        interval = int(self._interval)
+        self._interval *= self.factor
+
+        return interval
+
+
+def luby(i: int) -> int:
+
+    # the i-th term (from 1) of 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...: the term
+    # closing a block of length 2^k - 1 is 2^(k-1), and every block repeats
+    # the previous one twice before it
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+
+    return 1 << (k - 1)
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, fields
+from typing import Self
+
+
+@dataclass
+class SolverStats:
+
+    decisions: int = 0
+    propagations: int = 0
+    conflicts: int = 0
+    backtracks: int = 0
+    restarts: int = 0
+    max_depth: int = 0
+
+    # seconds spent loading the formula into the solver's own structures,
+    # choosing decisions, propagating and analyzing conflicts, and in total
+    copy_time: float = 0.0
+    select_time: float = 0.0
+    propagate_time: float = 0.0
+    analyze_time: float = 0.0
+    total_time: float = 0.0
+
+    def merge(self, other: Self):
+
+        # adds up the work of two searches; the depth is the larger one
+        for field in fields(self):
+            if field.name == "max_depth":
+                self.max_depth = max(self.max_depth, other.max_depth)
+            else:
+                setattr(
+                    self, field.name,
+                    getattr(self, field.name) + getattr(other, field.name)
+                )
+
+        return
@@ -0,0 +1,239 @@
+import time
+from typing import List, Optional, Tuple
+
+from ._base_solver import Solver
+from ._propagation import WatchedPropagator
+from ._restarts import RestartPolicy
+from ._stats import SolverStats
+from ..selectors._base_selector import BaseSelector
+from ._exceptions import UNSATException
+from .observers import SelectorLearning
+
+from ..constants import Tau
+from ..formulas import CNF
+from ..trail import Trail
+
+
+class CDCL(Solver):
+
+    def __init__(
+        self,
+        selector: BaseSelector,
+        verbose: bool = False,
+        max_learnts: int = None,
+        learnt_growth: float = 1.1,
+        restart_policy: RestartPolicy = None,
+        phase_saving: bool = False,
+        max_decisions: int = None,
+        max_propagations: int = None,
+        max_conflicts: int = None
+    ):
+
+        super().__init__(
+            verbose=verbose,
+            restart_policy=restart_policy,
+            phase_saving=phase_saving,
+            max_decisions=max_decisions,
+            max_propagations=max_propagations,
+            max_conflicts=max_conflicts
+        )
+        self._selector = selector
+        self.add_observer(SelectorLearning(selector))
+        self._init_max_learnts = max_learnts
+        self._learnt_growth = learnt_growth
+
+        return
+
+    def solve(self, formula: CNF, timeout: float = None) -> Tau:
+
+        self.stats = SolverStats()
+        t_start = time.perf_counter()
+        self._init_budgets(timeout)
+
+        self._formula = formula
+        self._trail = Trail(formula.n_vars)
+        self._propagator = WatchedPropagator(self._trail)
+        self._seen = [False] * (formula.n_vars + 1)
+        self._learnts = list()
+        self._lbd = dict()
+        self._init_restarts(self._trail)
+
+        try:
+            for clause in self._load_clauses(formula):
+                if not self._propagator.add_clause(clause):
+                    raise UNSATException
+            if self._init_max_learnts is None:
+                self._max_learnts = max(len(self._propagator.clauses) / 3, 100)
+            else:
+                self._max_learnts = self._init_max_learnts
+            self.stats.copy_time = time.perf_counter() - t_start
+            self._selector.reset(formula, self._trail)
+            self._search()
+            tau = self._trail.to_tau(formula)
+        except UNSATException:
+            tau = None
+        finally:
+            self.stats.propagations = self._propagator.n_propagations
+            self.stats.total_time = time.perf_counter() - t_start
+
+        return tau
+
+    def _search(self):
+
+        trail = self._trail
+        propagator = self._propagator
+        stats = self.stats
+
+        while True:
+            self._check_budgets(self._propagator)
+
+            t_start = time.perf_counter()
+            n_assigned = len(trail)
+            conflict = propagator.propagate()
+            stats.propagate_time += time.perf_counter() - t_start
+            for hook in self._on_propagate_hooks:
+                hook(self, len(trail) - n_assigned)
+            if conflict is not None:
+                self._n_conflicts += 1
+                self._count_conflict()
+                if trail.decision_level == 0:
+                    for hook in self._on_conflict_hooks:
+                        hook(self, conflict)
+                    raise UNSATException
+                t_start = time.perf_counter()
+                learnt, level = self._analyze(conflict)
+                stats.analyze_time += time.perf_counter() - t_start
+                for hook in self._on_conflict_hooks:
+                    hook(self, learnt)
+                propagator.backtrack(level)
+                stats.backtracks += 1
+                for hook in self._on_backtrack_hooks:
+                    hook(self, level)
+                self._learn(learnt)
+                continue
+
+            if self._restart_due() and trail.decision_level > 0:
+                self._restart(propagator)
+                continue
+
+            if len(self._learnts) - len(trail) >= self._max_learnts:
+                self._reduce_learnts()
+                self._max_learnts *= self._learnt_growth
+
+            t_start = time.perf_counter()
+            lit = self._pick_branch()
+            stats.select_time += time.perf_counter() - t_start
+            if lit is None:
+                return
+
+            self._n_calls += 1
+            for hook in self._on_decide_hooks:
+                hook(self, lit, trail.decision_level)
+            trail.new_level()
+            trail.assign(lit)
+            if trail.decision_level > stats.max_depth:
+                stats.max_depth = trail.decision_level
+
+    def _pick_branch(self) -> Optional[int]:
+
+        # the next decision literal, None once the formula is satisfied
+        selection = self._selector.select(self._formula, self._trail)
+        if selection is None:
+            return None
+
+        var, val = selection
+        val = self._phase(var, val)
+
+        return var if val else -var
+
+    def _analyze(self, conflict: List[int]) -> Tuple[List[int], int]:
+
+        # resolves the conflict against the reasons of the current level's
+        # literals, newest first, until a single one is left (the first UIP)
+        trail = self._trail
+        levels = trail.levels
+        seen = self._seen
+        level = trail.decision_level
+
+        learnt = [0]
+        n_pending = 0
+        lit = 0
+        idx = len(trail.lits) - 1
+        clause = conflict
+
+        while True:
+            for q in clause:
+                var = abs(q)
+                if q == lit or seen[var] or levels[var] == 0:
+                    continue
+                seen[var] = True
+                if levels[var] == level:
+                    n_pending += 1
+                else:
+                    learnt.append(q)
+
+            while not seen[abs(trail.lits[idx])]:
+                idx -= 1
+            lit = trail.lits[idx]
+            idx -= 1
+            seen[abs(lit)] = False
+            n_pending -= 1
+            if n_pending == 0:
+                break
+            clause = trail.reasons[abs(lit)]
+
+        learnt[0] = -lit
+        for q in learnt[1:]:
+            seen[abs(q)] = False
+
+        # the literal assigned last among the rest becomes the second watch
+        # and determines the backjump level
+        if len(learnt) == 1:
+            return learnt, 0
+        i_max = max(
+            range(1, len(learnt)), key=lambda i: levels[abs(learnt[i])]
+        )
+        learnt[1], learnt[i_max] = learnt[i_max], learnt[1]
+
+        return learnt, levels[abs(learnt[1])]
+
+    def _learn(self, learnt: List[int]):
+
+        if len(learnt) == 1:
+            self._trail.assign(learnt[0], reason=learnt)
+            return
+
+        levels = self._trail.levels
+        self._lbd[id(learnt)] = len({levels[abs(lit)] for lit in learnt[1:]})
+        self._learnts.append(learnt)
+        self._propagator.attach(learnt)
+        self._trail.assign(learnt[0], reason=learnt)
+
+        return
+
+    def _reduce_learnts(self):
+
+        # drop the worse half of the learned clauses by literal block
+        # distance, keeping binary clauses and clauses that are the reason
+        # for a current assignment
+        trail = self._trail
+
+        def is_locked(clause: List[int]) -> bool:
+
+            return trail.values[clause[0]] == 1 and \
+                trail.reasons[abs(clause[0])] is clause
+
+        ranked = sorted(
+            self._learnts, key=lambda c: (self._lbd[id(c)], len(c))
+        )
+        keep = ranked[:len(ranked) // 2]
+        for clause in ranked[len(ranked) // 2:]:
+            if len(clause) == 2 or is_locked(clause):
+                keep.append(clause)
+            else:
+                self._propagator.detach(clause)
+                del self._lbd[id(clause)]
+
+        self._learnts = keep
+
+        return
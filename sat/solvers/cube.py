@@ -0,0 +1,237 @@
+import math
+import multiprocessing as mp
+import os
+import queue
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ._base_solver import Solver
+from ._propagation import WatchedPropagator
+from .cdcl import CDCL
+from ._exceptions import UNSATException, TimeoutException
+from ._stats import SolverStats
+from ..selectors import VSIDSSelector
+
+from ..constants import Tau
+from ..formulas import CNF
+from ..trail import Trail
+
+
+# seconds between checks that the workers are still alive while waiting for
+# their answers
+POLL_INTERVAL = 0.1
+
+
+class CubeAndConquer(Solver):
+
+    def __init__(
+        self,
+        solver: Solver = None,
+        depth: int = None,
+        n_workers: int = None,
+        n_candidates: int = 8,
+        verbose: bool = False
+    ):
+
+        super().__init__(verbose=verbose)
+
+        # the solver run on every cube, and the number of decisions per cube;
+        # by default there are about eight cubes per worker so that workers
+        # finishing early keep taking new ones
+        self.solver = solver or CDCL(selector=VSIDSSelector())
+        self.n_workers = n_workers or os.cpu_count()
+        self.depth = depth
+        if depth is None:
+            self.depth = math.ceil(math.log2(self.n_workers)) + 3
+        self.n_candidates = n_candidates
+
+        return
+
+    def solve(self, formula: CNF, timeout: float = None) -> Tau:
+
+        self.stats = SolverStats()
+        t_start = time.perf_counter()
+        deadline = None if timeout is None else time.time() + timeout
+
+        try:
+            cubes = self._split(formula)
+        except UNSATException:
+            return None
+        finally:
+            self.stats.select_time = time.perf_counter() - t_start
+        if self._verbose:
+            print(f"split into {len(cubes)} cubes")
+
+        # workers claim the next unsolved cube from a shared counter as soon
+        # as they are idle; the first satisfiable cube ends the run
+        next_cube = mp.Value("i", 0)
+        answers = mp.Queue()
+        processes = [
+            mp.Process(
+                target=_conquer,
+                args=(
+                    formula, self.solver, cubes, next_cube, deadline, answers
+                ),
+                daemon=True
+            )
+            for _ in range(min(self.n_workers, len(cubes)))
+        ]
+        for process in processes:
+            process.start()
+
+        # a worker may die without answering, e.g. when killed, so the
+        # answers are polled for while any worker is left to send them
+        try:
+            n_answers = 0
+            while n_answers < len(cubes):
+                alive = any(process.is_alive() for process in processes)
+                try:
+                    status, tau, stats = answers.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if deadline is not None and time.time() > deadline:
+                        raise TimeoutException
+                    if not alive:
+                        raise RuntimeError(
+                            "Cube workers exited with "
+                            f"{len(cubes) - n_answers} cubes unanswered"
+                        )
+                    continue
+                n_answers += 1
+                self.stats.merge(stats)
+                if status == "timeout":
+                    raise TimeoutException
+                elif status == "error":
+                    raise RuntimeError("Solving a cube failed")
+                elif status == "sat":
+                    return tau
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            answers.close()
+            self.stats.total_time = time.perf_counter() - t_start
+
+        return None
+
+    def _split(self, formula: CNF) -> List[List[int]]:
+
+        # partial assignments of up to `depth` decisions that cover every
+        # model; branches refuted by propagation are dropped
+        trail = Trail(formula.n_vars)
+        propagator = WatchedPropagator(trail)
+        for clause in self._load_clauses(formula):
+            if not propagator.add_clause(clause):
+                raise UNSATException
+        if propagator.propagate() is not None:
+            raise UNSATException
+
+        lits, _ = formula.as_arrays()
+        occ = np.bincount(np.abs(lits), minlength=formula.n_vars + 1)
+        order = [int(var) for var in np.argsort(-occ, kind="stable")
+                 if occ[var] > 0]
+
+        cubes = list()
+        stack = [list()]
+        while len(stack) > 0:
+            cube = stack.pop()
+            propagator.backtrack(0)
+            for lit in cube:
+                trail.new_level()
+                trail.assign(lit)
+            propagator.propagate()
+
+            var = None
+            if len(cube) < self.depth:
+                var = self._lookahead(trail, propagator, order)
+            if var is None:
+                cubes.append(cube)
+                continue
+
+            self._n_calls += 1
+            for lit in (-var, var):
+                trail.new_level()
+                trail.assign(lit)
+                if propagator.propagate() is None:
+                    stack.append(cube + [lit])
+                propagator.backtrack(len(cube))
+
+        return cubes
+
+    def _lookahead(
+        self, trail: Trail, propagator: WatchedPropagator, order: List[int]
+    ) -> Optional[int]:
+
+        # among the most frequent unassigned variables, the one whose two
+        # branches propagate the most; None once every variable is assigned
+        level = trail.decision_level
+        best_var = None
+        best_score = -1
+        n_candidates = 0
+        for var in order:
+            if trail.values[var] != 0:
+                continue
+            n_candidates += 1
+
+            counts = list()
+            for lit in (var, -var):
+                n_assigned = len(trail)
+                trail.new_level()
+                trail.assign(lit)
+                conflict = propagator.propagate()
+                counts.append(
+                    math.inf if conflict else len(trail) - n_assigned
+                )
+                propagator.backtrack(level)
+
+            score = counts[0] * counts[1]
+            if score > best_score:
+                best_var = var
+                best_score = score
+            if n_candidates == self.n_candidates or math.isinf(score):
+                break
+
+        return best_var
+
+
+def _conquer(
+    formula: CNF,
+    solver: Solver,
+    cubes: List[List[int]],
+    next_cube: mp.Value,
+    deadline: float,
+    answers: mp.Queue
+):
+
+    while True:
+        with next_cube.get_lock():
+            i = next_cube.value
+            next_cube.value += 1
+        if i >= len(cubes):
+            return
+        answers.put(_solve_cube(formula, solver, cubes[i], deadline))
+
+
+def _solve_cube(
+    formula: CNF, solver: Solver, cube: List[int], deadline: float
+) -> Tuple[str, Optional[Tau], SolverStats]:
+
+    # the cube's decisions become unit clauses of a copy of the formula
+    cube_formula = formula.copy()
+    for lit in cube:
+        cube_formula.add_int_clause(lit)
+
+    timeout = None
+    if deadline is not None:
+        timeout = max(deadline - time.time(), 0.0)
+    try:
+        tau = solver.solve(cube_formula, timeout=timeout)
+    except TimeoutException:
+        return "timeout", None, solver.stats
+    except Exception:
+        return "error", None, solver.stats
+
+    return ("unsat" if tau is None else "sat"), tau, solver.stats
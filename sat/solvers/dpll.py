@@ -1,119 +1,150 @@
-
-import copy
 import time
-from typing import Dict, Tuple
+from typing import List, Optional
 
 from ._base_solver import Solver
+from ._propagation import WatchedPropagator
+from ._restarts import RestartPolicy
+from ._stats import SolverStats
 from ..selectors._base_selector import BaseSelector
-from ._exceptions import UNSATException, TimeoutException
+from ._exceptions import UNSATException
+from .observers import SelectorLearning
 
-from ..constants import Tau, NOT
+from ..constants import Tau
 from ..formulas import CNF
+from ..trail import Trail
 
 
 class DPLL(Solver):
 
-    def __init__(self, selector: BaseSelector, verbose: bool = False):
-
-        super().__init__(verbose=verbose)
+    def __init__(
+        self,
+        selector: BaseSelector,
+        verbose: bool = False,
+        restart_policy: RestartPolicy = None,
+        phase_saving: bool = False,
+        max_decisions: int = None,
+        max_propagations: int = None,
+        max_conflicts: int = None
+    ):
+
+        super().__init__(
+            verbose=verbose,
+            restart_policy=restart_policy,
+            phase_saving=phase_saving,
+            max_decisions=max_decisions,
+            max_propagations=max_propagations,
+            max_conflicts=max_conflicts
+        )
         self._selector = selector
+        self.add_observer(SelectorLearning(selector))
 
         return
 
     def solve(self, formula: CNF, timeout: float = None) -> Tau:
 
-        tau = {var: True for var in formula.vars}
-        self._n_calls = 0
-        self._timeout = timeout
-        self._t_start = time.time()
+        self.stats = SolverStats()
+        t_start = time.perf_counter()
+        self._init_budgets(timeout)
+
+        self._formula = formula
+        self._trail = Trail(formula.n_vars)
+        self._propagator = WatchedPropagator(self._trail)
+        self._init_restarts(self._trail)
 
         try:
-            _, tau = self._solve_rec(formula, tau)
+            for clause in self._load_clauses(formula):
+                if not self._propagator.add_clause(clause):
+                    raise UNSATException
+            self.stats.copy_time = time.perf_counter() - t_start
+            self._selector.reset(formula, self._trail)
+            self._search()
+            tau = self._trail.to_tau(formula)
         except UNSATException:
             tau = None
+        finally:
+            self.stats.propagations = self._propagator.n_propagations
+            self.stats.total_time = time.perf_counter() - t_start
 
         return tau
 
-    def _solve_rec(
-        self, formula: CNF, tau: Dict[str, bool], depth: int = 0
-    ) -> Tuple[CNF, Tau]:
-
-        if self._timeout is not None and \
-           (time.time() - self._t_start) > self._timeout:
-            raise TimeoutException
-
-        if len(formula) == 0:
-            return formula, tau
-        elif formula.has_empty_clauses():
-            if self._verbose:
-                print(" " * depth, "empty clauses found!")
-            raise UNSATException
-
-        if formula.has_unit_clauses():
-            reduced_formula, updated_tau = self._unit_propagate(
-                formula, tau, depth=depth
-            )
-            return self._solve_rec(
-                reduced_formula, updated_tau, depth=depth + 1
-            )
-        else:
-            try:
-                var, val = self._selector.select(formula)
-                reduced_formula, updated_tau = self._split(
-                    formula, var, val, tau, depth=depth
-                )
-                return self._solve_rec(
-                    reduced_formula, updated_tau, depth=depth + 1
-                )
-            except UNSATException:
-                if self._verbose:
-                    print(" " * depth, "backtracking...")
-                reduced_formula, updated_tau = self._split(
-                    formula, var, not val, tau, depth=depth
-                )
-                return self._solve_rec(
-                    reduced_formula, updated_tau, depth=depth + 1
-                )
-
-    def _unit_propagate(
-        self, formula: CNF, tau: Tau, depth: int = 0
-    ) -> Tuple[CNF, Tau]:
-
-        unit_clauses = formula.get_unit_clauses()
-
-        literal = unit_clauses[0][0]
-        if literal.startswith(NOT):
-            var = literal[1:]
-            val = False
-        else:
-            var = literal
-            val = True
-
-        if self._verbose:
-            print(" " * depth, "propagating...", len(formula), var, val)
-
-        assignment = {var: val}
-        reduced_formula = copy.deepcopy(formula)
-        reduced_formula.reduce(assignment)
-
-        updated_tau = copy.deepcopy(tau)
-        updated_tau.update(assignment)
-
-        return reduced_formula, updated_tau
-
-    def _split(
-        self, formula: CNF, var: str, val: bool, tau: Tau, depth: int = 0
-    ) -> Tuple[CNF, Tau]:
-
-        if self._verbose:
-            print(" " * depth, "splitting...", len(formula), var, val)
-        self._n_calls += 1
+    def _search(self):
+
+        trail = self._trail
+        stats = self.stats
+
+        # whether the decision at each level is already the second branch
+        flipped = list()
+
+        while True:
+            self._check_budgets(self._propagator)
+
+            t_start = time.perf_counter()
+            conflict = self._propagate()
+            stats.propagate_time += time.perf_counter() - t_start
+            if conflict is not None:
+                self._n_conflicts += 1
+                for hook in self._on_conflict_hooks:
+                    hook(self, conflict)
+                self._count_conflict()
+
+                # undo up to the latest decision whose other branch is untried
+                while len(flipped) > 0 and flipped[-1]:
+                    flipped.pop()
+                if len(flipped) == 0:
+                    raise UNSATException
+
+                level = len(flipped) - 1
+                lit = trail.lits[trail.level_starts[level]]
+                self._propagator.backtrack(level)
+                stats.backtracks += 1
+                for hook in self._on_backtrack_hooks:
+                    hook(self, level)
+                flipped[-1] = True
+                self._split(abs(lit), lit < 0, depth=level)
+                continue
+
+            # the search stays complete since the longest restart interval
+            # so far grows without bound, even where, as with Luby, the
+            # intervals keep returning to 1
+            if self._restart_due() and trail.decision_level > 0:
+                self._restart(self._propagator)
+                flipped.clear()
+                continue
+
+            t_start = time.perf_counter()
+            selection = self._selector.select(self._formula, trail)
+            stats.select_time += time.perf_counter() - t_start
+            if selection is None:
+                return
+
+            var, val = selection
+            val = self._phase(var, val)
+            flipped.append(False)
+            self._split(var, val, depth=trail.decision_level)
+
+    def _propagate(self) -> Optional[List[int]]:
+
+        # returns the clause falsified by propagation, if any
+        if len(self._on_propagate_hooks) == 0:
+            return self._propagator.propagate()
+
+        n_assigned = len(self._trail)
+        conflict = self._propagator.propagate()
+        for hook in self._on_propagate_hooks:
+            hook(self, len(self._trail) - n_assigned)
+
+        return conflict
+
+    def _split(self, var: int, val: bool, depth: int = 0):
 
-        assignment = {var: val}
-        reduced_formula = copy.deepcopy(formula)
-        reduced_formula.reduce(assignment)
+        self._n_calls += 1
+        lit = var if val else -var
+        for hook in self._on_decide_hooks:
+            hook(self, lit, depth)
 
-        updated_tau = copy.deepcopy(tau)
-        updated_tau.update(assignment)
+        self._trail.new_level()
+        self._trail.assign(lit)
+        if self._trail.decision_level > self.stats.max_depth:
+            self.stats.max_depth = self._trail.decision_level
 
-        return reduced_formula, updated_tau
+        return
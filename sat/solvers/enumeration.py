@@ -0,0 +1,48 @@
+from typing import Iterable, Iterator
+
+from .incremental import IncrementalSolver
+from ..selectors import VSIDSSelector
+from ..selectors._base_selector import BaseSelector
+
+from ..constants import NOT, Tau
+from ..formulas import CNF
+
+
+def iter_models(
+    formula: CNF,
+    projection: Iterable[str] = None,
+    limit: int = None,
+    selector: BaseSelector = None
+) -> Iterator[Tau]:
+
+    # yields the distinct assignments of the `projection` variables (all by
+    # default) that extend to a model, lazily; every one found is excluded by
+    # a blocking clause over the projection only, and one incremental solver
+    # keeps its learned clauses from model to model
+    if projection is None:
+        projection = sorted(formula.vars)
+    else:
+        projection = list(dict.fromkeys(projection))
+        unknown = [var for var in projection if var not in formula.vars]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown projection variables: {unknown}")
+
+    solver = IncrementalSolver(
+        selector=selector or VSIDSSelector(), formula=formula
+    )
+
+    n_models = 0
+    while limit is None or n_models < limit:
+        tau = solver.solve()
+        if tau is None:
+            return
+
+        # the blocking clause is built before the model is handed out, in
+        # case the caller modifies it
+        blocking = [NOT + var if tau[var] else var for var in projection]
+        yield {var: tau[var] for var in projection}
+        n_models += 1
+
+        solver.add_clause(*blocking)
+
+    return
@@ -0,0 +1,210 @@
+import time
+from typing import List, Optional, Sequence
+
+from .cdcl import CDCL
+from ._propagation import WatchedPropagator
+from ._restarts import RestartPolicy
+from ._stats import SolverStats
+from ..selectors._base_selector import BaseSelector
+from ._exceptions import UNSATException
+
+from ..constants import Tau
+from ..formulas import CNF, normalize_clause
+from ..trail import Trail
+
+
+class IncrementalSolver(CDCL):
+
+    def __init__(
+        self,
+        selector: BaseSelector,
+        formula: CNF = None,
+        verbose: bool = False,
+        max_learnts: int = None,
+        learnt_growth: float = 1.1,
+        restart_policy: RestartPolicy = None,
+        phase_saving: bool = False,
+        max_decisions: int = None,
+        max_propagations: int = None,
+        max_conflicts: int = None
+    ):
+
+        super().__init__(
+            selector=selector,
+            verbose=verbose,
+            max_learnts=max_learnts,
+            learnt_growth=learnt_growth,
+            restart_policy=restart_policy,
+            phase_saving=phase_saving,
+            max_decisions=max_decisions,
+            max_propagations=max_propagations,
+            max_conflicts=max_conflicts
+        )
+
+        # the clause database, the trail at level 0 and the learned clauses
+        # persist between calls; the formula is a copy that grows with
+        # `add_clause`
+        self._formula = CNF()
+        self._trail = Trail(0)
+        self._propagator = WatchedPropagator(self._trail)
+        self._seen = [False]
+        self._learnts = list()
+        self._lbd = dict()
+        self._phases = [0]
+        if phase_saving:
+            self._trail.backtrack_hooks.append(self._save_phases)
+        self._max_learnts = max_learnts
+
+        # set once a clause is falsified at level 0, for good
+        self._unsat = False
+
+        # the assumptions of the current call, and the subset of them that
+        # made the last call unsatisfiable
+        self._assumptions = list()
+        self.failed_assumptions = list()
+
+        if formula is not None:
+            self.add_formula(formula)
+
+        return
+
+    @property
+    def formula(self) -> CNF:
+
+        return self._formula
+
+    def add_formula(self, formula: CNF):
+
+        # variables in no clause are kept too, so that models assign them
+        for var in formula._var_names[1:]:
+            self._formula._intern(var)
+        self._grow()
+
+        for lits in formula.int_clauses():
+            self.add_clause(*[formula.decode(lit) for lit in lits])
+
+        return
+
+    def add_clause(self, *literals: str):
+
+        # the clause is propagated lazily, by the next call to `solve`
+        self._formula.add_clause(*literals)
+        self._grow()
+
+        lits = self._formula.int_clause(len(self._formula) - 1)
+        clause = normalize_clause(lits)
+        if clause is None:
+            return
+
+        self._propagator.backtrack(0)
+        if not self._propagator.add_clause(clause):
+            self._unsat = True
+
+        return
+
+    def solve(
+        self, assumptions: Sequence[str] = (), timeout: float = None
+    ) -> Tau:
+
+        # returns a model satisfying the assumptions, or None; in that case
+        # `failed_assumptions` holds the assumptions responsible, empty if
+        # the clauses are unsatisfiable on their own
+        self.stats = SolverStats()
+        t_start = time.perf_counter()
+        self._init_budgets(timeout)
+
+        self._assumptions = [self._encode(lit) for lit in assumptions]
+        self.failed_assumptions = list()
+        self._propagator.backtrack(0)
+        self._propagator.n_propagations = 0
+        self._restart_policy.reset()
+        self._conflicts_to_restart = self._restart_policy.next_interval()
+        if self._init_max_learnts is None:
+            self._max_learnts = max(
+                len(self._propagator.clauses) / 3, 100, self._max_learnts or 0
+            )
+
+        try:
+            if self._unsat:
+                raise UNSATException
+            self.stats.copy_time = time.perf_counter() - t_start
+            self._selector.reset(self._formula, self._trail)
+            self._search()
+            tau = self._trail.to_tau(self._formula)
+        except UNSATException:
+            tau = None
+            if self._trail.decision_level == 0 and \
+               len(self.failed_assumptions) == 0:
+                self._unsat = True
+        finally:
+            self.stats.propagations = self._propagator.n_propagations
+            self.stats.total_time = time.perf_counter() - t_start
+
+        return tau
+
+    def _encode(self, literal: str) -> int:
+
+        # assumptions on variables unseen so far are free to take any value
+        lit = self._formula.encode(literal)
+        self._grow()
+
+        return lit
+
+    def _grow(self):
+
+        n_vars = self._formula.n_vars
+        if n_vars <= self._trail.n_vars:
+            return
+
+        self._propagator.grow(n_vars)
+        self._seen.extend([False] * (n_vars + 1 - len(self._seen)))
+        self._phases.extend([0] * (n_vars + 1 - len(self._phases)))
+
+        return
+
+    def _pick_branch(self) -> Optional[int]:
+
+        # the assumptions are decided first, one per level; an assumption
+        # that already holds gets an empty level so that levels and
+        # assumptions stay aligned
+        trail = self._trail
+        while trail.decision_level < len(self._assumptions):
+            lit = self._assumptions[trail.decision_level]
+            if trail.values[lit] == 1:
+                trail.new_level()
+            elif trail.values[lit] == -1:
+                failed = self._analyze_final(lit)
+                self.failed_assumptions = [
+                    self._formula.decode(q) for q in failed
+                ]
+                raise UNSATException
+            else:
+                return lit
+
+        return super()._pick_branch()
+
+    def _analyze_final(self, lit: int) -> List[int]:
+
+        # the assumptions from which the negation of `lit` follows, found by
+        # walking the implication graph back to the decisions above level 0
+        trail = self._trail
+        seen = self._seen
+        failed = [lit]
+        if trail.levels[abs(lit)] == 0:
+            return failed
+
+        seen[abs(lit)] = True
+        for assigned in reversed(trail.lits[trail.level_starts[0]:]):
+            var = abs(assigned)
+            if not seen[var]:
+                continue
+            seen[var] = False
+            reason = trail.reasons[var]
+            if reason is None:
+                failed.append(assigned)
+                continue
+            for q in reason:
+                if q != assigned and trail.levels[abs(q)] > 0:
+                    seen[abs(q)] = True
+
+        return list(dict.fromkeys(failed))
@@ -0,0 +1,236 @@
+import time
+from typing import Dict, List
+
+from ..selectors._base_selector import BaseSelector
+
+
+# the events a solver reports, each called with the solver first
+EVENTS = (
+    "on_decide",
+    "on_propagate",
+    "on_conflict",
+    "on_backtrack",
+    "on_restart"
+)
+
+
+class SearchObserver:
+
+    # solvers only call the events a subclass overrides, so an observer
+    # costs nothing for the events it ignores
+
+    def on_decide(self, solver, lit: int, level: int):
+
+        return
+
+    def on_propagate(self, solver, n_assigned: int):
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        # the clause learned from the conflict, or the falsified clause for
+        # solvers that do not learn
+        return
+
+    def on_backtrack(self, solver, level: int):
+
+        return
+
+    def on_restart(self, solver):
+
+        return
+
+    def overrides(self, event: str) -> bool:
+
+        return getattr(type(self), event) is not getattr(SearchObserver, event)
+
+
+class SelectorLearning(SearchObserver):
+
+    def __init__(self, selector: BaseSelector):
+
+        # feeds conflicts to the selector driving the search, e.g. for
+        # activity-based selectors such as VSIDS
+        self.selector = selector
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        self.selector.on_conflict(clause)
+
+        return
+
+
+class TraceLogger(SearchObserver):
+
+    # prints every event, indented by decision level
+
+    def on_decide(self, solver, lit: int, level: int):
+
+        print(" " * level, "deciding...", len(solver._trail), lit)
+
+        return
+
+    def on_propagate(self, solver, n_assigned: int):
+
+        level = solver._trail.decision_level
+        print(" " * level, "propagating...", n_assigned, "literals")
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        level = solver._trail.decision_level
+        print(" " * level, "conflict in", clause)
+
+        return
+
+    def on_backtrack(self, solver, level: int):
+
+        print(" " * level, "backtracking to level", level)
+
+        return
+
+    def on_restart(self, solver):
+
+        print("restarting...")
+
+        return
+
+
+class ProgressLogger(SearchObserver):
+
+    def __init__(self, interval: float = 1.0, check_every: int = 256):
+
+        # prints the solver's counters at most once per `interval` seconds;
+        # the clock is read on every `check_every`-th decision or conflict
+        self.interval = interval
+        self.check_every = check_every
+
+        self._n_events = 0
+        self._t_start = None
+        self._t_last = None
+
+        return
+
+    def on_decide(self, solver, lit: int, level: int):
+
+        self._tick(solver)
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        self._tick(solver)
+
+        return
+
+    def _tick(self, solver):
+
+        self._n_events += 1
+        if self._n_events % self.check_every != 0:
+            return
+
+        now = time.perf_counter()
+        if self._t_start is None:
+            self._t_start = now
+            self._t_last = now
+        if now - self._t_last < self.interval:
+            return
+        self._t_last = now
+
+        stats = solver.stats
+        print(
+            f"{now - self._t_start:8.1f}s",
+            f"decisions={stats.decisions}",
+            f"conflicts={stats.conflicts}",
+            f"restarts={stats.restarts}",
+            f"depth={solver._trail.decision_level}"
+        )
+
+        return
+
+
+class SamplingProfiler(SearchObserver):
+
+    def __init__(self, interval: float = 0.01, check_every: int = 16):
+
+        # snapshots of the search state, at most one per `interval` seconds
+        self.interval = interval
+        self.check_every = check_every
+        self.samples = list()
+        self.event_counts = {event: 0 for event in EVENTS}
+
+        self._n_events = 0
+        self._t_start = None
+        self._t_last = None
+
+        return
+
+    def on_decide(self, solver, lit: int, level: int):
+
+        self.event_counts["on_decide"] += 1
+        self._tick(solver)
+
+        return
+
+    def on_propagate(self, solver, n_assigned: int):
+
+        self.event_counts["on_propagate"] += 1
+        self._tick(solver)
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        self.event_counts["on_conflict"] += 1
+        self._tick(solver)
+
+        return
+
+    def on_backtrack(self, solver, level: int):
+
+        self.event_counts["on_backtrack"] += 1
+
+        return
+
+    def on_restart(self, solver):
+
+        self.event_counts["on_restart"] += 1
+
+        return
+
+    def _tick(self, solver):
+
+        self._n_events += 1
+        if self._n_events % self.check_every != 0:
+            return
+
+        now = time.perf_counter()
+        if self._t_start is None:
+            self._t_start = now
+            self._t_last = now - self.interval
+        if now - self._t_last < self.interval:
+            return
+        self._t_last = now
+
+        self.samples.append(self._sample(solver, now - self._t_start))
+
+        return
+
+    def _sample(self, solver, elapsed: float) -> Dict:
+
+        stats = solver.stats
+
+        return {
+            "time": elapsed,
+            "depth": solver._trail.decision_level,
+            "assigned": len(solver._trail),
+            "decisions": stats.decisions,
+            "conflicts": stats.conflicts,
+            "select_time": stats.select_time,
+            "propagate_time": stats.propagate_time,
+            "analyze_time": stats.analyze_time
+        }
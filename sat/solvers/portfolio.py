@@ -0,0 +1,148 @@
+import multiprocessing as mp
+import os
+import queue
+import time
+import traceback
+from typing import List
+
+import numpy as np
+
+from ._base_solver import Solver
+from .dpll import DPLL
+from ._exceptions import TimeoutException
+from ._stats import SolverStats
+from ..selectors import (
+    NaiveSelector,
+    RandomChoiceSelector,
+    TwoClauseSelector,
+    ModalVariableSelector
+)
+
+from ..constants import Tau
+from ..formulas import CNF
+
+
+class PortfolioSolver(Solver):
+
+    def __init__(
+        self,
+        solvers: List[Solver] = None,
+        seeds: List[int] = None,
+        verbose: bool = False
+    ):
+
+        super().__init__(verbose=verbose)
+
+        # every solver runs in its own process with its own seed for the
+        # randomized selectors
+        if solvers is None:
+            solvers = self.default_solvers()
+        if seeds is None:
+            seeds = list(range(len(solvers)))
+        self.solvers = solvers
+        self.seeds = seeds
+        if len(self.seeds) != len(self.solvers):
+            raise ValueError("Expected one seed per solver")
+
+        # index of the solver that answered the last call
+        self.winner = None
+
+        return
+
+    @staticmethod
+    def default_solvers(n_random: int = None) -> List[Solver]:
+
+        # the deterministic selectors once, and the random one on the cores
+        # left over
+        solvers = [
+            DPLL(selector=NaiveSelector()),
+            DPLL(selector=TwoClauseSelector()),
+            DPLL(selector=ModalVariableSelector())
+        ]
+        if n_random is None:
+            n_random = max((os.cpu_count() or 1) - len(solvers), 1)
+        solvers.extend(
+            DPLL(selector=RandomChoiceSelector()) for _ in range(n_random)
+        )
+
+        return solvers
+
+    def solve(self, formula: CNF, timeout: float = None) -> Tau:
+
+        self.stats = SolverStats()
+        self.winner = None
+        t_start = time.time()
+
+        answers = mp.Queue()
+        processes = [
+            mp.Process(
+                target=_run_solver,
+                args=(i, solver, seed, formula, timeout, answers),
+                daemon=True
+            )
+            for i, (solver, seed) in enumerate(zip(self.solvers, self.seeds))
+        ]
+        for process in processes:
+            process.start()
+
+        # the first solver to finish wins, the others are cancelled; a
+        # solver that times out or crashes drops out of the race
+        errors = list()
+        try:
+            n_pending = len(processes)
+            while n_pending > 0:
+                remaining = None
+                if timeout is not None:
+                    remaining = max(timeout - (time.time() - t_start), 0)
+                try:
+                    i, finished, tau, stats, error = answers.get(
+                        timeout=remaining
+                    )
+                except queue.Empty:
+                    break
+                n_pending -= 1
+                if error is not None:
+                    errors.append((i, error))
+                if finished:
+                    self.winner = i
+                    self.stats = stats
+                    if self._verbose:
+                        print(f"solver {i} finished first")
+                    return tau
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            answers.close()
+
+        # crashes are only reported if they, not the deadline, ended the race
+        if len(errors) > 0 and \
+           (timeout is None or time.time() - t_start < timeout):
+            i, error = errors[0]
+            raise RuntimeError(f"Solver {i} failed:\n{error}")
+
+        raise TimeoutException
+
+
+def _run_solver(
+    i: int,
+    solver: Solver,
+    seed: int,
+    formula: CNF,
+    timeout: float,
+    answers: mp.Queue
+):
+
+    # the traceback is sent as text, the exception itself may not pickle
+    np.random.seed(seed)
+    try:
+        tau = solver.solve(formula, timeout=timeout)
+        answers.put((i, True, tau, solver.stats, None))
+    except TimeoutException:
+        answers.put((i, False, None, solver.stats, None))
+    except Exception:
+        answers.put((i, False, None, solver.stats, traceback.format_exc()))
+
+    return
@@ -0,0 +1,105 @@
+from typing import List, Optional
+
+from .constants import Tau
+from .formulas import CNF
+
+
+class Trail:
+
+    def __init__(self, n_vars: int):
+
+        self.n_vars = n_vars
+
+        # indexed by signed literal: 1 if true, -1 if false, 0 if unassigned
+        # (negative literals wrap around to the back half of the list)
+        self.values = [0] * (2 * n_vars + 1)
+        self.levels = [-1] * (n_vars + 1)
+        self.reasons = [None] * (n_vars + 1)
+
+        # assigned literals in assignment order, and the position in `lits`
+        # at which each decision level starts
+        self.lits = list()
+        self.level_starts = list()
+
+        # called with the undone literals after every backtrack, for
+        # structures that mirror the trail lazily
+        self.backtrack_hooks = list()
+
+        return
+
+    def grow(self, n_vars: int):
+
+        # makes room for new variables; the signed indexing of `values`
+        # means the negative half has to move
+        if n_vars <= self.n_vars:
+            return
+
+        values = [0] * (2 * n_vars + 1)
+        for var in range(1, self.n_vars + 1):
+            values[var] = self.values[var]
+            values[-var] = self.values[-var]
+        self.values = values
+        self.levels.extend([-1] * (n_vars - self.n_vars))
+        self.reasons.extend([None] * (n_vars - self.n_vars))
+        self.n_vars = n_vars
+
+        return
+
+    def __len__(self) -> int:
+
+        return len(self.lits)
+
+    @property
+    def decision_level(self) -> int:
+
+        return len(self.level_starts)
+
+    def value(self, lit: int) -> int:
+
+        return self.values[lit]
+
+    def is_assigned(self, var: int) -> bool:
+
+        return self.values[var] != 0
+
+    def new_level(self):
+
+        self.level_starts.append(len(self.lits))
+
+        return
+
+    def assign(self, lit: int, reason: Optional[List[int]] = None):
+
+        self.values[lit] = 1
+        self.values[-lit] = -1
+        self.levels[abs(lit)] = len(self.level_starts)
+        self.reasons[abs(lit)] = reason
+        self.lits.append(lit)
+
+        return
+
+    def backtrack(self, level: int) -> List[int]:
+
+        if level >= len(self.level_starts):
+            return []
+
+        start = self.level_starts[level]
+        undone = self.lits[start:]
+        values = self.values
+        for lit in undone:
+            values[lit] = 0
+            values[-lit] = 0
+        del self.lits[start:]
+        del self.level_starts[level:]
+        for hook in self.backtrack_hooks:
+            hook(undone)
+
+        return undone
+
+    def to_tau(self, formula: CNF) -> Tau:
+
+        # unassigned variables do not affect satisfaction and default to True
+        return {
+            formula.var_name(var): self.values[var] != -1
+            for var in range(1, self.n_vars + 1)
+        }
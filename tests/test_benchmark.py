@@ -0,0 +1,97 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sat.benchmark import BenchmarkSuite, COUNTERS
+from sat.formulas import CNF
+from sat.selectors import RandomChoiceSelector
+from sat.solvers import DPLL
+
+
+class TestBenchmarkSuite(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.suite = BenchmarkSuite()
+        self.suite.add_solver(
+            "random/dpll",
+            lambda: DPLL(selector=RandomChoiceSelector()),
+            CNF.generate_many(20, 85, 3, seed=0)
+        )
+        self.suite.add("noop", lambda: None)
+
+        return
+
+    def test_run(self):
+
+        results = self.suite.run(repeat=2)
+        self.assertEqual(set(results.keys()), {"random/dpll", "noop"})
+        self.assertEqual(set(results["noop"].keys()), {"time"})
+        self.assertGreater(results["random/dpll"]["decisions"], 0)
+
+        # the randomized selector is reseeded, so the counters repeat
+        rerun = self.suite.run(repeat=1, pattern="dpll")
+        self.assertEqual(
+            results["random/dpll"]["decisions"],
+            rerun["random/dpll"]["decisions"]
+        )
+
+        return
+
+    def test_duplicate_case(self):
+
+        with self.assertRaises(ValueError):
+            self.suite.add("noop", lambda: None)
+
+        return
+
+    def test_compare(self):
+
+        baseline = {
+            "a": {"time": 1.0, "decisions": 10},
+            "b": {"time": 1e-4},
+            "c": {"time": 1.0}
+        }
+        results = {
+            "a": {"time": 1.05, "decisions": 20},
+            "b": {"time": 5e-4},
+            "d": {"time": 10.0}
+        }
+
+        regressions = BenchmarkSuite.compare(results, baseline, threshold=0.1)
+        self.assertEqual(
+            [(r.case, r.metric) for r in regressions], [("a", "decisions")]
+        )
+        self.assertEqual(regressions[0].ratio, 2.0)
+
+        regressions = BenchmarkSuite.compare(
+            results, baseline, threshold=0.01, metrics=["time"]
+        )
+        self.assertEqual(
+            [(r.case, r.metric) for r in regressions], [("a", "time")]
+        )
+
+        # the counter gate of benchmark.py
+        regressions = BenchmarkSuite.compare(
+            {"a": {"time": 10.0, "decisions": 10}}, baseline, metrics=COUNTERS
+        )
+        self.assertEqual(regressions, [])
+
+        return
+
+    def test_write_read(self):
+
+        results = {"a": {"time": 1.0, "decisions": 10}}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fp = os.path.join(tmp_dir, "results.json")
+            self.assertIsNone(BenchmarkSuite.read(fp))
+            self.assertIsNone(BenchmarkSuite.read_machine(fp))
+            BenchmarkSuite.write(fp, results)
+            self.assertEqual(BenchmarkSuite.read(fp), results)
+            self.assertEqual(
+                BenchmarkSuite.read_machine(fp), BenchmarkSuite.machine()
+            )
+
+        return
@@ -0,0 +1,125 @@
+import itertools
+from unittest import TestCase
+
+from sat.cardinality import at_most_one, exactly_one, at_most_k
+from sat.formulas import CNF
+from sat.selectors import VSIDSSelector
+from sat.solvers import IncrementalSolver, iter_models
+
+
+AMO_ENCODINGS = ["pairwise", "sequential", "commander", "ladder"]
+MAX_LITERALS = 7
+
+
+class TestCardinality(TestCase):
+
+    def assert_counts(self, build, allowed, n: int):
+
+        # the formula must be satisfiable under an assignment of the
+        # literals exactly if the number of true ones is allowed
+        cnf = CNF()
+        literals = [f"x{i}" for i in range(n)]
+        build(cnf, literals)
+        solver = IncrementalSolver(selector=VSIDSSelector(), formula=cnf)
+
+        for bits in itertools.product([False, True], repeat=n):
+            assumptions = [
+                literal if bit else "¬" + literal
+                for literal, bit in zip(literals, bits)
+            ]
+            self.assertEqual(
+                solver.solve(assumptions=assumptions) is not None,
+                allowed(sum(bits)),
+                msg=f"{cnf} under {bits}"
+            )
+
+        return
+
+    def test_at_most_one(self):
+
+        for encoding, n in itertools.product(
+            AMO_ENCODINGS, range(1, MAX_LITERALS + 1)
+        ):
+            self.assert_counts(
+                lambda cnf, lits: at_most_one(cnf, lits, encoding=encoding),
+                lambda count: count <= 1,
+                n
+            )
+
+        return
+
+    def test_exactly_one(self):
+
+        for encoding, n in itertools.product(
+            AMO_ENCODINGS, range(1, MAX_LITERALS + 1)
+        ):
+            self.assert_counts(
+                lambda cnf, lits: exactly_one(cnf, lits, encoding=encoding),
+                lambda count: count == 1,
+                n
+            )
+
+        return
+
+    def test_at_most_k(self):
+
+        for n in range(1, MAX_LITERALS + 1):
+            for k in range(n + 1):
+                self.assert_counts(
+                    lambda cnf, lits: at_most_k(cnf, lits, k),
+                    lambda count: count <= k,
+                    n
+                )
+
+        return
+
+    def test_linear_size(self):
+
+        n = 100
+        for encoding in ["sequential", "commander", "ladder"]:
+            cnf = CNF()
+            at_most_one(cnf, [f"x{i}" for i in range(n)], encoding=encoding)
+            self.assertLessEqual(len(cnf), 3 * n)
+
+        return
+
+    def test_aux_names(self):
+
+        cnf = CNF()
+        cnf.add_clause("aux3")
+        at_most_one(cnf, ["a", "¬b"], aux_prefix="aux")
+        at_most_one(cnf, ["a", "c"], aux_prefix="aux")
+
+        # fresh names never reuse a variable of the formula
+        self.assertEqual(cnf.n_vars, 6)
+        self.assertEqual(len(cnf.vars), 6)
+
+        return
+
+    def test_merge(self):
+
+        # separately encoded constraints stay independent once merged
+        for encoding in ["sequential", "commander", "ladder"]:
+            cnf = CNF()
+            exactly_one(cnf, ["a", "b", "c"], encoding=encoding)
+            other = CNF()
+            exactly_one(other, ["x", "y", "z"], encoding=encoding)
+            cnf.append_cnf(other)
+
+            models = list(
+                iter_models(cnf, projection=["a", "b", "c", "x", "y", "z"])
+            )
+            self.assertEqual(len(models), 9)
+
+        return
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            at_most_one(CNF(), ["a", "b"], encoding="binary")
+        with self.assertRaises(ValueError):
+            at_most_k(CNF(), ["a", "b", "c"], 2, encoding="ladder")
+        with self.assertRaises(ValueError):
+            at_most_k(CNF(), ["a", "b"], -1)
+
+        return
@@ -0,0 +1,123 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sat.dimacs import read_dimacs
+from sat.formulas import CNF
+
+
+TEST_DIMACS_FP = "./tests/artifacts/test_dimacs.txt"
+TEST_DIMACS_CLAUSES = [[1, 2, 3], [-4, -5, -6]]
+
+STANDARD_DIMACS = """c comment
+p cnf 5 4
+
+1 -2 0 3
+ -4 5 0
+c another comment
+-1 0 2 3 4
+5 0
+%
+0
+"""
+STANDARD_DIMACS_CLAUSES = [[1, -2], [3, -4, 5], [-1], [2, 3, 4, 5]]
+
+# the first 0 only comes on the second data line
+SPANNING_DIMACS = "p cnf 3 2\n1 2\n3 0 -1 -2 0\n"
+SPANNING_DIMACS_CLAUSES = [[1, 2, 3], [-1, -2]]
+
+
+class TestReadDimacs(TestCase):
+
+    def _read(self, text: str, chunk_size: int):
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fp = os.path.join(tmp_dir, "cnf.txt")
+            with open(fp, "w") as f:
+                f.write(text)
+            lits, offsets = read_dimacs(fp, chunk_size=chunk_size)
+
+        return [
+            lits[offsets[i]:offsets[i + 1]].tolist()
+            for i in range(len(offsets) - 1)
+        ]
+
+    def test_line_terminated(self):
+
+        lits, offsets = read_dimacs(TEST_DIMACS_FP)
+
+        self.assertListEqual(
+            [
+                lits[offsets[i]:offsets[i + 1]].tolist()
+                for i in range(len(offsets) - 1)
+            ],
+            TEST_DIMACS_CLAUSES
+        )
+
+        return
+
+    def test_zero_terminated(self):
+
+        for chunk_size in (4, 16, 1 << 20):
+            self.assertListEqual(
+                self._read(STANDARD_DIMACS, chunk_size),
+                STANDARD_DIMACS_CLAUSES
+            )
+
+        return
+
+    def test_first_clause_spans_lines(self):
+
+        for chunk_size in (4, 8, 1 << 20):
+            self.assertListEqual(
+                self._read(SPANNING_DIMACS, chunk_size),
+                SPANNING_DIMACS_CLAUSES
+            )
+        self.assertListEqual(
+            self._read("1 2\n3 0 -1 -2 0\n", 4), SPANNING_DIMACS_CLAUSES
+        )
+
+        return
+
+    def test_line_terminated_with_header(self):
+
+        self.assertListEqual(
+            self._read("c legacy\np cnf 3 2\n1 2 3\n-1 -2\n", 8),
+            [[1, 2, 3], [-1, -2]]
+        )
+
+        return
+
+    def test_missing_terminator(self):
+
+        self.assertListEqual(
+            self._read("p cnf 2 2\n1 0\n-1 2", 8), [[1], [-1, 2]]
+        )
+
+        return
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            self._read("p cnf 2 1\n1 x 0\n", 64)
+
+        return
+
+    def test_cnf_from_dimacs(self):
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fp = os.path.join(tmp_dir, "cnf.txt")
+            with open(fp, "w") as f:
+                f.write(STANDARD_DIMACS)
+            cnf = CNF.from_dimacs(fp)
+
+        self.assertEqual(len(cnf), len(STANDARD_DIMACS_CLAUSES))
+        self.assertListEqual(
+            [[cnf.decode(lit) for lit in lits] for lits in cnf.int_clauses()],
+            [
+                [f"¬p{-i}" if i < 0 else f"p{i}" for i in clause]
+                for clause in STANDARD_DIMACS_CLAUSES
+            ]
+        )
+
+        return
@@ -0,0 +1,188 @@
+from multiprocessing.pool import Pool
+import os
+import signal
+import tempfile
+import time
+from unittest import TestCase
+
+from sat.experiment import Dataset, Experiment, _run_tasks
+from sat.formulas import CNF
+from sat.selectors import NaiveSelector
+from sat.solvers import CDCL
+
+
+SIMPLE_SAT = "(p0 v p1) ∧ (¬p0 v p1)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+
+
+class StuckSolver(CDCL):
+
+    # ignores its timeout, and any alarm, in a call that does not return
+    def solve(self, formula, timeout=None):
+
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        time.sleep(60.0)
+
+
+class TestExperiment(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.experiment = Experiment(
+            selector=NaiveSelector(),
+            n_vars=3,
+            min_ratio=1.0,
+            max_ratio=2.0,
+            ratio_step=1.0,
+            solver=CDCL
+        )
+
+        return
+
+    def test_solve_formula(self):
+
+        result = self.experiment._solve_formula(CNF.from_str(SIMPLE_SAT))
+        self.assertTrue(result.result)
+        self.assertEqual(result.status, "sat")
+
+        result = self.experiment._solve_formula(CNF.from_str(COMPLEX_UNSAT))
+        self.assertFalse(result.result)
+        self.assertEqual(result.status, "unsat")
+
+        return
+
+    def test_budget_result(self):
+
+        self.experiment.solver_options = {"max_conflicts": 1}
+        result = self.experiment._solve_formula(CNF.from_str(COMPLEX_UNSAT))
+
+        self.assertFalse(result.result)
+        self.assertEqual(result.status, "budget")
+
+        return
+
+    def test_no_timeout(self):
+
+        self.experiment.timeout = None
+        result = self.experiment._solve_formula(CNF.from_str(COMPLEX_UNSAT))
+
+        self.assertFalse(result.result)
+        self.assertEqual(result.status, "unsat")
+
+        return
+
+    def test_run_tasks(self):
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "l=6")
+            Dataset.generate(n_vars=3, n_clauses=6, seed=0).write(path)
+            dataset = Dataset.from_cache(path)
+
+            self.experiment.n_workers = 2
+            tasks = [(path, i) for i in range(4)]
+            results = dict(_run_tasks(self.experiment, tasks))
+
+        self.assertCountEqual(results.keys(), range(4))
+        for i, result in results.items():
+            self.assertIn(result.status, ["sat", "unsat"])
+            self.assertEqual(
+                result.result,
+                CDCL(selector=NaiveSelector()).solve(dataset[i]) is not None
+            )
+
+        return
+
+    def test_kill_stuck_task(self):
+
+        experiment = Experiment(
+            selector=NaiveSelector(),
+            n_vars=3,
+            min_ratio=1.0,
+            max_ratio=2.0,
+            ratio_step=1.0,
+            solver=StuckSolver,
+            n_workers=1,
+            timeout=0.1,
+            kill_grace=0.1
+        )
+
+        # the single worker is replaced after every kill
+        t_start = time.time()
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "l=6")
+            Dataset.generate(n_vars=3, n_clauses=6, seed=0).write(path)
+            tasks = [(path, i) for i in range(3)]
+            results = list(_run_tasks(experiment, tasks))
+        self.assertLess(time.time() - t_start, 10.0)
+
+        self.assertCountEqual([i for i, _ in results], range(3))
+        for _, result in results:
+            self.assertEqual(result.status, "killed")
+            self.assertFalse(result.result)
+            self.assertGreaterEqual(result.runtime, 0.2)
+
+        return
+
+
+class TestDataset(TestCase):
+
+    def test_write_from_cache(self):
+
+        dataset = Dataset.generate(n_vars=10, n_clauses=30)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "l=30")
+            dataset.write(path)
+            self.assertFalse(
+                any(fp.endswith(".cnf") for fp in os.listdir(path))
+            )
+
+            cached = Dataset.from_cache(path)
+            self.assertTrue(cached.is_cached)
+            self.assertDictEqual(cached.config, dataset.config)
+            self.assertEqual(len(cached), len(dataset))
+            for i in [0, 1, len(dataset) - 1]:
+                self.assertListEqual(
+                    [list(lits) for lits in cached[i].int_clauses()],
+                    [list(lits) for lits in dataset[i].int_clauses()]
+                )
+
+            with self.assertRaises(ValueError):
+                dataset.write(path)
+
+        return
+
+    def test_generate_seeded(self):
+
+        dataset = Dataset.generate(n_vars=10, n_clauses=30, seed=3)
+        with Pool(processes=2) as pool:
+            pooled = Dataset.generate(
+                n_vars=10, n_clauses=30, seed=3, pool=pool
+            )
+
+        self.assertEqual(dataset.config["seed"], 3)
+        self.assertEqual(len(pooled), len(dataset))
+        for formula, other in zip(dataset.formulas, pooled.formulas):
+            self.assertEqual(str(formula), str(other))
+
+        return
+
+    def test_convert_dimacs(self):
+
+        legacy = Dataset.from_cache(TEST_DATASET_PATH)
+        self.assertFalse(legacy.is_cached)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            legacy.write(dir_path, overwrite=True)
+            cached = Dataset.from_cache(dir_path)
+
+            self.assertEqual(len(cached), len(legacy))
+            for i in range(len(legacy)):
+                self.assertEqual(len(cached[i]), len(legacy[i]))
+                self.assertEqual(cached[i].n_vars, legacy[i].n_vars)
+
+        return
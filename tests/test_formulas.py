@@ -1,7 +1,11 @@
 
+import os
+import tempfile
 from unittest import TestCase
 
-from sat.formulas import CNF, DNF
+import numpy as np
+
+from sat.formulas import CNF, DNF, normalize_clause
 from sat.clauses import Disjunction
 from sat.constants import NOT
 
@@ -24,6 +28,12 @@ TEST_DNF_STR = "(p0 ∧ p1 ∧ p2) v (p3 ∧ p4 ∧ p5)"
 TEST_DNF_CLAUSE_LEN = 3
 TEST_DNF_LEN = 2
 
+TEST_SIMPLIFY_CNF = (
+    "(p0 v p1) ∧ (p0 v p1 v p2) ∧ (¬p0 v p1 v p3) ∧ (p2 v p3) ∧ "
+    "(p3 v p2 v ¬p4)"
+)
+TEST_SIMPLIFY_EXP = "(p0 v p1) ∧ (p1 v p3) ∧ (p2 v p3)"
+
 TEST_DIMACS_FP = "./tests/artifacts/test_dimacs.txt"
 TEST_DIMACS_LITERALS = ["p1", "p2", "p3", "p4", "p5", "p6"]
 
@@ -55,6 +65,41 @@ class TestCNF(TestCase):
 
         return
 
+    def test_encode_decode(self):
+
+        for literals in TEST_CNF_CLAUSES:
+            for literal in literals:
+                lit = self.cnf.encode(literal)
+                self.assertEqual(lit < 0, literal.startswith(NOT))
+                self.assertEqual(self.cnf.decode(lit), literal)
+
+        return
+
+    def test_int_clauses(self):
+
+        for i, literals in enumerate(TEST_CNF_CLAUSES):
+            self.assertListEqual(
+                [self.cnf.decode(lit) for lit in self.cnf.int_clause(i)],
+                literals
+            )
+            self.assertListEqual(self.cnf[i].literals, literals)
+
+        return
+
+    def test_to_dimacs(self):
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fp = os.path.join(tmp_dir, "cnf.txt")
+            self.cnf.to_dimacs(fp)
+            cnf = CNF.from_dimacs(fp)
+
+        self.assertEqual(len(cnf), len(self.cnf))
+        self.assertEqual(len(cnf.vars), TEST_CNF_N_VARS)
+        for lits, exp_lits in zip(cnf.int_clauses(), self.cnf.int_clauses()):
+            self.assertListEqual(list(lits), list(exp_lits))
+
+        return
+
     def test_from_dnf(self):
 
         dnf = DNF.from_str(TEST_DNF_STR)
@@ -65,6 +110,30 @@ class TestCNF(TestCase):
 
         return
 
+    def test_from_dnf_definitional(self):
+
+        dnf = DNF.from_str(TEST_DNF_STR)
+        cnf = CNF.from_dnf_definitional(dnf, "aux")
+
+        # one clause per literal of every term, and one for the disjunction
+        self.assertEqual(len(cnf), TEST_DNF_CLAUSE_LEN * TEST_DNF_LEN + 1)
+        self.assertSetEqual(cnf.vars, dnf.vars | {"aux0", "aux1"})
+
+        # the models are those of the DNF, extended by the auxiliaries
+        for bits in range(2 ** 6):
+            tau = {f"p{i}": bool(bits >> i & 1) for i in range(6)}
+            extended = dict(tau)
+            extended["aux0"] = tau["p0"] and tau["p1"] and tau["p2"]
+            extended["aux1"] = tau["p3"] and tau["p4"] and tau["p5"]
+            self.assertEqual(
+                cnf.evaluate(extended), CNF.from_dnf(dnf).evaluate(tau)
+            )
+
+        with self.assertRaises(ValueError):
+            CNF.from_dnf_definitional(DNF.from_str("(p0 ∧ x0) v p1"), "x")
+
+        return
+
     def test_generate(self):
 
         n_vars = 20
@@ -77,6 +146,29 @@ class TestCNF(TestCase):
 
         return
 
+    def test_generate_seeded(self):
+
+        cnfs = CNF.generate_many(n=6, l=50, count=4, k=3, seed=7)
+        again = CNF.generate_many(n=6, l=50, count=4, k=3, seed=7)
+
+        self.assertEqual(len(cnfs), 4)
+        for cnf, other in zip(cnfs, again):
+            self.assertEqual(str(cnf), str(other))
+            self.assertTrue(cnf.vars <= {f"p{i}" for i in range(6)})
+            for lits in cnf.int_clauses():
+                self.assertEqual(len({abs(lit) for lit in lits}), 3)
+        self.assertNotEqual(str(cnfs[0]), str(CNF.generate(6, 50, seed=8)))
+
+        # drawing every variable takes the permutation path
+        cnf = CNF.generate(n=4, l=10, k=4, seed=0)
+        for lits in cnf.int_clauses():
+            self.assertEqual(len({abs(lit) for lit in lits}), 4)
+
+        with self.assertRaises(ValueError):
+            CNF.generate(n=2, l=1, k=3)
+
+        return
+
     def test_add_clause(self):
 
         cnf = CNF(
@@ -89,6 +181,22 @@ class TestCNF(TestCase):
 
         return
 
+    def test_as_arrays(self):
+
+        cnf = CNF(
+            [Disjunction(*literals) for literals in TEST_CNF_CLAUSES]
+        )
+        lits, offsets = cnf.as_arrays()
+        self.assertEqual(len(offsets), len(TEST_CNF_CLAUSES) + 1)
+        self.assertEqual(offsets[-1], len(lits))
+
+        # the arrays must not keep the formula from growing
+        cnf.add_clause(*TEST_ADD_CLAUSE)
+        self.assertEqual(len(cnf.as_arrays()[1]), len(offsets) + 1)
+        self.assertEqual(len(CNF().as_arrays()[0]), 0)
+
+        return
+
     def test_append_cnf(self):
 
         cnf = CNF(
@@ -137,9 +245,61 @@ class TestCNF(TestCase):
             [Disjunction(*literals) for literals in TEST_CNF_CLAUSES]
         )
         cnf.add_clause(*TEST_CNF_CLAUSES[0])
-        cnf.simplify()
+        stats = cnf.simplify()
 
         self.assertEqual(len(cnf), len(TEST_CNF_CLAUSES))
+        self.assertEqual(stats.duplicates, 1)
+
+        return
+
+    def test_simplify_subsumption(self):
+
+        cnf = CNF.from_str(TEST_SIMPLIFY_CNF)
+        stats = cnf.simplify()
+
+        self.assertEqual(str(cnf), TEST_SIMPLIFY_EXP)
+        self.assertEqual(stats.subsumed, 2)
+        self.assertEqual(stats.strengthened, 1)
+
+        return
+
+    def test_simplify_equivalent(self):
+
+        n_vars = 8
+        assignments = (
+            np.arange(2 ** n_vars)[:, None] >> np.arange(n_vars) & 1
+        ).astype(bool)
+        for _ in range(20):
+            cnf = CNF.generate(n=n_vars, l=40, k=2)
+            cnf.add_clause("p0", "p1", "p2")
+            cnf.add_clause("p3", "¬p3")
+            if cnf.n_vars != n_vars:
+                continue
+            exp_satisfied, _ = cnf.evaluate_batch(assignments)
+            cnf.simplify()
+            satisfied, _ = cnf.evaluate_batch(assignments)
+            self.assertListEqual(satisfied.tolist(), exp_satisfied.tolist())
+
+        return
+
+    def test_simplify_tautology(self):
+
+        cnf = CNF.from_str(
+            "(p0 v ¬p0) ∧ (¬p0 v p1) ∧ (¬p1 v p2) ∧ (¬p1 v ¬p2)"
+        )
+        stats = cnf.simplify()
+
+        self.assertEqual(stats.tautologies, 1)
+        self.assertFalse(cnf.has_empty_clauses())
+        self.assertTrue(cnf.evaluate({"p0": False, "p1": False, "p2": True}))
+
+        return
+
+    def test_normalize_clause(self):
+
+        self.assertListEqual(normalize_clause([3, -1, 3, 2, -1]), [3, -1, 2])
+        self.assertIsNone(normalize_clause([1, 2, -1]))
+        self.assertListEqual(normalize_clause([]), [])
 
         return
 
@@ -207,3 +367,38 @@ class TestCNF(TestCase):
         self.assertFalse(self.cnf.evaluate(tau))
 
         return
+
+    def test_evaluate_batch(self):
+
+        cnf = CNF.generate(n=8, l=20)
+        cnf.add_clause()
+        cnf.add_clause("p0")
+        assignments = np.random.default_rng(0).uniform(
+            size=(64, cnf.n_vars)
+        ) > 0.5
+
+        satisfied, unsat_counts = cnf.evaluate_batch(assignments)
+
+        exp_satisfied = list()
+        exp_unsat_counts = np.zeros(len(cnf), dtype=int)
+        for row in assignments:
+            tau = {
+                cnf.var_name(var): bool(row[var - 1])
+                for var in range(1, cnf.n_vars + 1)
+            }
+            exp_satisfied.append(cnf.evaluate(tau))
+            for i in range(len(cnf)):
+                exp_unsat_counts[i] += not CNF([cnf[i]]).evaluate(tau)
+
+        self.assertListEqual(satisfied.tolist(), exp_satisfied)
+        self.assertListEqual(unsat_counts.tolist(), exp_unsat_counts.tolist())
+        self.assertEqual(unsat_counts[-2], len(assignments))
+
+        return
+
+    def test_evaluate_batch_shape(self):
+
+        with self.assertRaises(ValueError):
+            self.cnf.evaluate_batch(np.zeros((2, TEST_CNF_N_VARS + 1)))
+
+        return
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+import numpy as np
+
+from sat.formulas import CNF
+from sat.occurrences import OccurrenceIndex
+from sat.trail import Trail
+
+
+TEST_CNF = "(p0 v ¬p1 v p2) ∧ (p1 v p2) ∧ (¬p0 v ¬p2 v p3 v p1) ∧ (p3 v ¬p1)"
+
+
+class TestOccurrenceIndex(TestCase):
+
+    def _assert_matches_rebuild(self, index: OccurrenceIndex):
+
+        # an index built directly on the current trail must agree with one
+        # that followed it incrementally
+        exp_index = OccurrenceIndex(index.formula, index.trail)
+        exp_index.sync()
+        exp_index.close()
+
+        self.assertListEqual(index.counts, exp_index.counts)
+        self.assertListEqual(index.scores, exp_index.scores)
+        self.assertSetEqual(set(index.active), set(exp_index.active))
+        self.assertListEqual(index.buckets, exp_index.buckets)
+        self.assertSetEqual(index.two_clause_vars, exp_index.two_clause_vars)
+        if max(exp_index.scores) == 0:
+            self.assertIsNone(index.modal_var())
+        else:
+            self.assertEqual(
+                index.scores[index.modal_var()], max(exp_index.scores)
+            )
+
+        return
+
+    def test_initial(self):
+
+        cnf = CNF.from_str(TEST_CNF)
+        index = OccurrenceIndex(cnf, Trail(cnf.n_vars))
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.counts[cnf.encode("p1")], 2)
+        self.assertEqual(index.counts[cnf.encode("¬p1")], 2)
+        self.assertEqual(index.modal_var(), cnf.encode("p1"))
+        self.assertSetEqual(index.buckets[2], {1, 3})
+
+        return
+
+    def test_assign(self):
+
+        cnf = CNF.from_str(TEST_CNF)
+        trail = Trail(cnf.n_vars)
+        index = OccurrenceIndex(cnf, trail)
+
+        trail.assign(cnf.encode("¬p2"))
+        index.sync()
+
+        self.assertEqual(len(index), 3)
+        self.assertSetEqual(index.buckets[1], {1})
+        self.assertSetEqual(index.buckets[2], {0, 3})
+        self._assert_matches_rebuild(index)
+
+        return
+
+    def test_random_walk(self):
+
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            cnf = CNF.generate(n=12, l=30, k=int(rng.integers(2, 5)))
+            trail = Trail(cnf.n_vars)
+            index = OccurrenceIndex(cnf, trail)
+            for _ in range(40):
+                free = [
+                    var for var in range(1, cnf.n_vars + 1)
+                    if not trail.is_assigned(var)
+                ]
+                if len(free) > 0 and rng.uniform() < 0.7:
+                    trail.new_level()
+                    var = int(rng.choice(free))
+                    trail.assign(var if rng.uniform() < 0.5 else -var)
+                elif trail.decision_level > 0:
+                    trail.backtrack(
+                        int(rng.integers(0, trail.decision_level))
+                    )
+                if rng.uniform() < 0.5:
+                    index.sync()
+                    self._assert_matches_rebuild(index)
+
+        return
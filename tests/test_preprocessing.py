@@ -0,0 +1,105 @@
+import glob
+import itertools
+import os
+from unittest import TestCase
+
+from sat.formulas import CNF
+from sat.preprocessing import Preprocessor
+from sat.selectors import NaiveSelector
+from sat.solvers import CDCL
+
+
+PURE_CNF = "(p0 v p1) ∧ (p0 v ¬p2) ∧ (p1 v p2)"
+ELIMINATE_CNF = "(p0 v p1) ∧ (¬p0 v p2) ∧ (¬p1 v ¬p2) ∧ (p1 v p2)"
+UNSAT_CNF = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+TAUTOLOGY_CNF = "(p0 v ¬p0) ∧ (¬p0 v p1) ∧ (¬p1 v p2) ∧ (¬p1 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+
+
+class TestPreprocessor(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.solver = CDCL(selector=NaiveSelector())
+
+        return
+
+    def test_pure_literals(self):
+
+        cnf = CNF.from_str(PURE_CNF)
+        preprocessor = Preprocessor()
+        reduced = preprocessor.preprocess(cnf)
+
+        self.assertEqual(len(reduced), 0)
+        self.assertGreater(preprocessor.stats.pure_literals, 0)
+        self.assertTrue(
+            cnf.evaluate(preprocessor.reconstruct(self.solver.solve(reduced)))
+        )
+
+        return
+
+    def test_reconstruct_all_models(self):
+
+        # whatever model the reduced formula has, the reconstruction must
+        # satisfy the original formula
+        cnf = CNF.from_str(ELIMINATE_CNF)
+        preprocessor = Preprocessor()
+        reduced = preprocessor.preprocess(cnf, frozen=["p2"])
+
+        self.assertGreater(preprocessor.stats.eliminated_vars, 0)
+        for values in itertools.product([True, False], repeat=cnf.n_vars):
+            tau = dict(zip(sorted(cnf.vars), values))
+            if reduced.evaluate(tau):
+                model = preprocessor.reconstruct(tau)
+                self.assertTrue(cnf.evaluate(model))
+                self.assertEqual(model["p2"], tau["p2"])
+
+        return
+
+    def test_unsat(self):
+
+        reduced = Preprocessor().preprocess(CNF.from_str(UNSAT_CNF))
+
+        self.assertTrue(reduced.has_empty_clauses())
+        self.assertIsNone(self.solver.solve(reduced))
+
+        return
+
+    def test_tautology(self):
+
+        cnf = CNF.from_str(TAUTOLOGY_CNF)
+        preprocessor = Preprocessor()
+        reduced = preprocessor.preprocess(cnf, frozen=["p0"])
+
+        self.assertEqual(preprocessor.stats.tautologies, 1)
+        self.assertFalse(reduced.has_empty_clauses())
+        tau = self.solver.solve(reduced)
+        self.assertIsNotNone(tau)
+        self.assertTrue(cnf.evaluate(preprocessor.reconstruct(tau)))
+
+        return
+
+    def test_resolvent_limit(self):
+
+        cnf = CNF.from_str(ELIMINATE_CNF)
+        reduced = Preprocessor(max_occurrences=1).preprocess(cnf)
+
+        self.assertEqual(len(reduced), len(cnf))
+
+        return
+
+    def test_dataset(self):
+
+        for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf")):
+            cnf = CNF.from_dimacs(cnf_fp)
+            preprocessor = Preprocessor()
+            reduced = preprocessor.preprocess(cnf)
+            tau = self.solver.solve(reduced)
+            self.assertEqual(tau is None, self.solver.solve(cnf) is None)
+            if tau is not None:
+                self.assertTrue(cnf.evaluate(preprocessor.reconstruct(tau)))
+
+        return
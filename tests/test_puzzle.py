@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from sat.puzzle import AUX_PREFIX, Puzzle
+from sat.selectors import VSIDSSelector
+from sat.solvers import CDCL
+
+
+SMALL_VALS = {
+    "col": ["red", "gre", "blu"],
+    "pet": ["cat", "dog", "fis"]
+}
+SMALL_SOLUTION = {
+    0: {"col": "blu", "pet": "dog"},
+    1: {"col": "red", "pet": "fis"},
+    2: {"col": "gre", "pet": "cat"}
+}
+
+
+class TestPuzzle(TestCase):
+
+    def build_small(
+        self, definitional: bool, cardinality: str = "pairwise"
+    ) -> Puzzle:
+
+        puzzle = Puzzle(
+            n=3,
+            vals=SMALL_VALS,
+            definitional=definitional,
+            cardinality=cardinality
+        )
+        puzzle.location("col", "blu", 0)
+        puzzle.coincidence("col", "red", "pet", "fis")
+        puzzle.adjacent("pet", "cat", "pet", "fis")
+        puzzle.consecutive("pet", "dog", "col", "red")
+
+        return puzzle
+
+    def test_encodings_agree(self):
+
+        for definitional in [False, True]:
+            puzzle = self.build_small(definitional)
+            cnf = puzzle.cnf
+            tau = CDCL(selector=VSIDSSelector()).solve(cnf)
+
+            self.assertTrue(cnf.evaluate(tau))
+            self.assertDictEqual(puzzle.decode(tau), SMALL_SOLUTION)
+            self.assertEqual(
+                any(var.startswith(AUX_PREFIX) for var in cnf.vars),
+                definitional
+            )
+
+        return
+
+    def test_cardinality_encodings(self):
+
+        for cardinality in ["sequential", "commander", "ladder"]:
+            puzzle = self.build_small(True, cardinality=cardinality)
+            tau = CDCL(selector=VSIDSSelector()).solve(puzzle.cnf)
+            self.assertDictEqual(puzzle.decode(tau), SMALL_SOLUTION)
+
+        return
+
+    def test_definitional_linear(self):
+
+        # rules over many houses stay linear in size, where distributing
+        # them would take 2^n clauses each
+        n = 16
+        vals = {
+            cat: [f"{cat}{chr(ord('a') + i)}" for i in range(n)]
+            for cat in ["x", "y"]
+        }
+        puzzle = Puzzle(n=n, vals=vals)
+        puzzle.coincidence("x", "xa", "y", "yb")
+        puzzle.adjacent("x", "xc", "y", "ya")
+        n_baseline = len(puzzle._baseline_rules)
+
+        cnf = puzzle.cnf
+        self.assertLessEqual(len(cnf) - n_baseline, 6 * n)
+
+        tau = CDCL(selector=VSIDSSelector()).solve(cnf)
+        self.assertTrue(cnf.evaluate(tau))
+        solution = puzzle.decode(tau)
+        house = next(pos for pos in range(n) if solution[pos]["x"] == "xa")
+        self.assertEqual(solution[house]["y"], "yb")
+
+        return
+
+    def test_iter_solutions(self):
+
+        puzzle = self.build_small(True, cardinality="ladder")
+        self.assertListEqual(list(puzzle.iter_solutions()), [SMALL_SOLUTION])
+
+        # without the adjacency rule red may be at the second or third house
+        puzzle = Puzzle(n=3, vals=SMALL_VALS)
+        puzzle.location("col", "blu", 0)
+        puzzle.coincidence("col", "red", "pet", "fis")
+        puzzle.consecutive("pet", "dog", "col", "red")
+        solutions = list(puzzle.iter_solutions())
+        self.assertEqual(len(solutions), 2)
+        self.assertIn(SMALL_SOLUTION, solutions)
+        self.assertEqual(len(list(puzzle.iter_solutions(limit=1))), 1)
+
+        return
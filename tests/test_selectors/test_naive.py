@@ -4,7 +4,7 @@ import json
 import os
 from unittest import TestCase
 
-from sat.solvers import DPLL
+from sat.solvers import CDCL, DPLL
 from sat.selectors import NaiveSelector
 from sat.formulas import CNF
 
@@ -13,6 +13,23 @@ TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
 RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
 
 
+class FullScanSelector(NaiveSelector):
+
+    # the first literal of the first residual clause, found by scanning from
+    # the first clause
+    def select(self, formula, trail):
+
+        values = trail.values
+        for lits in formula.int_clauses():
+            if any(values[lit] == 1 for lit in lits):
+                continue
+            free = [lit for lit in lits if values[lit] == 0]
+            if len(free) > 0:
+                return (self._lit_to_var(free[0]), self.assign(free[0]))
+
+        return None
+
+
 class TestNaiveSelector(TestCase):
 
     def __init__(self, *args, **kwargs):
@@ -38,3 +55,18 @@ class TestNaiveSelector(TestCase):
         )
 
         return
+
+    def test_same_as_full_scan(self):
+
+        # the cursor is rewound on backtracks and restarts
+        for seed in range(20):
+            cnf = CNF.generate(20, 80 + seed, seed=seed)
+            for solver_cls in (DPLL, CDCL):
+                solver = solver_cls(selector=NaiveSelector())
+                reference = solver_cls(selector=FullScanSelector())
+                self.assertEqual(solver.solve(cnf), reference.solve(cnf))
+                self.assertEqual(
+                    solver.stats.decisions, reference.stats.decisions
+                )
+
+        return
@@ -0,0 +1,83 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import CDCL, DPLL
+from sat.selectors import VSIDSSelector
+from sat.selectors._heap import ActivityHeap
+from sat.formulas import CNF
+from sat.trail import Trail
+
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+TEST_CNF = "(p0 v p1) ∧ (¬p1 v p2) ∧ (¬p1 v ¬p2 v p3)"
+
+
+class TestActivityHeap(TestCase):
+
+    def test_order(self):
+
+        activity = [0.0, 3.0, 1.0, 4.0, 1.5, 9.0]
+        heap = ActivityHeap(activity)
+        for var in range(1, len(activity)):
+            heap.push(var)
+
+        activity[2] = 10.0
+        heap.increased(2)
+
+        self.assertListEqual(
+            [heap.pop() for _ in range(len(heap))], [2, 5, 3, 1, 4]
+        )
+
+        return
+
+
+class TestVSIDSSelector(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.cnfs = []
+        for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf")):
+            self.cnfs.append((CNF.from_dimacs(cnf_fp)))
+
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            self.exp_results = json.load(f)["results"]
+
+        return
+
+    def test_bump_and_phase(self):
+
+        cnf = CNF.from_str(TEST_CNF)
+        trail = Trail(cnf.n_vars)
+        selector = VSIDSSelector()
+        selector.reset(cnf, trail)
+
+        # p1 occurs most often
+        self.assertEqual(selector.select(cnf, trail), (2, True))
+
+        selector.on_conflict([-4])
+        selector.on_conflict([-4, 1])
+        trail.new_level()
+        trail.assign(-4)
+        trail.backtrack(0)
+
+        self.assertEqual(selector.select(cnf, trail), (4, False))
+
+        return
+
+    def test_vsids_selector(self):
+
+        for solver in (DPLL(selector=VSIDSSelector()),
+                       CDCL(selector=VSIDSSelector())):
+            results = [solver.solve(cnf) is not None for cnf in self.cnfs]
+            self.assertListEqual(
+                results,
+                [exp_result["result"] for exp_result in self.exp_results]
+            )
+
+        return
@@ -0,0 +1,15 @@
+from sat.formulas import CNF
+
+
+def pigeonhole(n: int) -> CNF:
+
+    # n + 1 pigeons in n holes, unsatisfiable and hard for resolution
+    cnf = CNF()
+    for i in range(n + 1):
+        cnf.add_clause(*[f"p{i}_{j}" for j in range(n)])
+    for j in range(n):
+        for i in range(n + 1):
+            for k in range(i + 1, n + 1):
+                cnf.add_clause(f"¬p{i}_{j}", f"¬p{k}_{j}")
+
+    return cnf
@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from sat.solvers import DPLL, CDCL
+from sat.solvers._exceptions import BudgetException
+from sat.selectors import NaiveSelector
+
+from helpers import pigeonhole
+
+
+PIGEONHOLE_N = 5
+
+
+class TestBudgets(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.cnf = pigeonhole(PIGEONHOLE_N)
+
+        return
+
+    def test_max_decisions(self):
+
+        for solver_cls in [DPLL, CDCL]:
+            solver = solver_cls(selector=NaiveSelector(), max_decisions=10)
+            with self.assertRaises(BudgetException):
+                solver.solve(self.cnf)
+            self.assertEqual(solver._n_calls, 10)
+
+        return
+
+    def test_max_conflicts(self):
+
+        for solver_cls in [DPLL, CDCL]:
+            solver = solver_cls(selector=NaiveSelector(), max_conflicts=3)
+            with self.assertRaises(BudgetException):
+                solver.solve(self.cnf)
+            self.assertEqual(solver._n_conflicts, 3)
+
+        return
+
+    def test_max_propagations(self):
+
+        solver = CDCL(selector=NaiveSelector(), max_propagations=50)
+        with self.assertRaises(BudgetException):
+            solver.solve(self.cnf)
+        self.assertGreaterEqual(solver._propagator.n_propagations, 50)
+
+        return
+
+    def test_deterministic(self):
+
+        # the same budget stops the search at the same point every time
+        runs = list()
+        for _ in range(2):
+            solver = CDCL(selector=NaiveSelector(), max_conflicts=20)
+            with self.assertRaises(BudgetException):
+                solver.solve(self.cnf)
+            runs.append((solver._n_calls, solver._propagator.n_propagations))
+        self.assertEqual(runs[0], runs[1])
+
+        return
+
+    def test_within_budget(self):
+
+        solver = CDCL(selector=NaiveSelector(), max_conflicts=10 ** 6)
+
+        self.assertIsNone(solver.solve(self.cnf))
+
+        return
@@ -0,0 +1,91 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import CDCL
+from sat.selectors import NaiveSelector
+from sat.formulas import CNF
+
+
+SIMPLE_SAT = "p0 ∧ ¬p1"
+SIMPLE_UNSAT = "p0 ∧ ¬p0"
+COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+
+class TestCDCL(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.solver = CDCL(selector=NaiveSelector())
+
+        return
+
+    def test_solve_simple_sat(self):
+
+        cnf = CNF.from_str(SIMPLE_SAT)
+        tau = self.solver.solve(cnf)
+
+        self.assertDictEqual(tau, {"p0": True, "p1": False})
+        self.assertTrue(cnf.evaluate(tau))
+
+        return
+
+    def test_solve_simple_unsat(self):
+
+        cnf = CNF.from_str(SIMPLE_UNSAT)
+
+        tau = self.solver.solve(cnf)
+        self.assertIsNone(tau)
+
+        return
+
+    def test_solve_complex_sat_backtrack(self):
+
+        cnf = CNF.from_str(COMPLEX_SAT_BACKTRACK)
+        tau = self.solver.solve(cnf)
+
+        self.assertDictEqual(
+            tau, {"p0": True, "p1": False, "p2": False, "p3": True}
+        )
+        self.assertEqual(self.solver._n_conflicts, 1)
+        self.assertTrue(cnf.evaluate(tau))
+
+        return
+
+    def test_solve_complex_unsat(self):
+
+        cnf = CNF.from_str(COMPLEX_UNSAT)
+
+        tau = self.solver.solve(cnf)
+        self.assertIsNone(tau)
+
+        return
+
+    def test_solve_dataset(self):
+
+        solver = CDCL(selector=NaiveSelector(), max_learnts=5)
+        cnfs = [
+            CNF.from_dimacs(cnf_fp)
+            for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf"))
+        ]
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            exp_results = json.load(f)["results"]
+
+        results = list()
+        for cnf in cnfs:
+            tau = solver.solve(cnf)
+            if tau is not None:
+                self.assertTrue(cnf.evaluate(tau))
+            results.append(tau is not None)
+        self.assertListEqual(
+            results, [exp_result["result"] for exp_result in exp_results]
+        )
+
+        return
@@ -0,0 +1,86 @@
+import glob
+import itertools
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import CDCL, CubeAndConquer
+from sat.selectors import VSIDSSelector
+from sat.formulas import CNF
+
+
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+
+class DyingSolver(CDCL):
+
+    # ends its worker process without sending an answer
+    def solve(self, formula, timeout=None):
+
+        os._exit(1)
+
+
+class TestCubeAndConquer(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.solver = CubeAndConquer(depth=3, n_workers=2)
+        self.cnfs = [
+            CNF.from_dimacs(cnf_fp)
+            for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf"))
+        ]
+
+        return
+
+    def test_split(self):
+
+        cnf = self.cnfs[0]
+        cubes = self.solver._split(cnf)
+
+        self.assertGreater(len(cubes), 1)
+        self.assertLessEqual(len(cubes), 2 ** self.solver.depth)
+
+        # any two cubes disagree on some variable
+        for cube, other in itertools.combinations(cubes, 2):
+            self.assertTrue(any(-lit in other for lit in cube))
+
+        return
+
+    def test_solve_dataset(self):
+
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            exp_results = json.load(f)["results"]
+
+        results = list()
+        for cnf in self.cnfs:
+            tau = self.solver.solve(cnf)
+            if tau is not None:
+                self.assertTrue(cnf.evaluate(tau))
+                self.assertSetEqual(set(tau), cnf.vars)
+            results.append(tau is not None)
+        self.assertListEqual(
+            results, [exp_result["result"] for exp_result in exp_results]
+        )
+
+        return
+
+    def test_solve_unsat(self):
+
+        self.assertIsNone(self.solver.solve(CNF.from_str(COMPLEX_UNSAT)))
+
+        return
+
+    def test_worker_died(self):
+
+        solver = CubeAndConquer(
+            solver=DyingSolver(selector=VSIDSSelector()), depth=3, n_workers=2
+        )
+        with self.assertRaises(RuntimeError):
+            solver.solve(self.cnfs[0])
+
+        return
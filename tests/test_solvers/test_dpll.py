@@ -11,6 +11,7 @@ SIMPLE_UNSAT = "p0 ∧ ¬p0"
 COMPLEX_SAT = "(p0 v ¬p1) ∧ (¬p2 v ¬p3)"
 COMPLEX_SAT_MULT_OCCUR = "(p0 v ¬p1) ∧ (p2 v ¬p3) ∧ (p1 v ¬p2)"
 COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+DEEP_SEARCH_N_VARS = 3000
 
 
 class TestDPLL(TestCase):
@@ -77,3 +78,16 @@ class TestDPLL(TestCase):
         self.assertTrue(cnf.evaluate(tau))
 
         return
+
+    def test_solve_deep_search(self):
+
+        # one decision per clause, far beyond the default recursion limit
+        cnf = CNF()
+        for i in range(0, DEEP_SEARCH_N_VARS, 2):
+            cnf.add_clause(f"p{i}", f"p{i + 1}")
+        tau = self.solver.solve(cnf)
+
+        self.assertEqual(self.solver._n_calls, DEEP_SEARCH_N_VARS // 2)
+        self.assertTrue(cnf.evaluate(tau))
+
+        return
@@ -0,0 +1,111 @@
+import itertools
+from unittest import TestCase
+
+from sat.cardinality import at_most_k
+from sat.solvers import iter_models
+from sat.selectors import NaiveSelector
+from sat.formulas import CNF
+
+
+COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+
+def brute_force_models(cnf: CNF, projection):
+
+    models = set()
+    names = sorted(cnf.vars)
+    for bits in itertools.product([False, True], repeat=len(names)):
+        tau = dict(zip(names, bits))
+        if cnf.evaluate(tau):
+            models.add(tuple(tau[var] for var in projection))
+
+    return models
+
+
+class TestIterModels(TestCase):
+
+    def test_all_models(self):
+
+        cnf = CNF.from_str(COMPLEX_SAT_BACKTRACK)
+        models = list(iter_models(cnf))
+        projection = sorted(cnf.vars)
+
+        self.assertEqual(len(models), 6)
+        for model in models:
+            self.assertTrue(cnf.evaluate(model))
+        self.assertSetEqual(
+            {tuple(model[var] for var in projection) for model in models},
+            brute_force_models(cnf, projection)
+        )
+
+        return
+
+    def test_projection(self):
+
+        cnf = CNF.from_str(COMPLEX_SAT_BACKTRACK)
+        models = list(
+            iter_models(cnf, projection=["p2", "p3"], selector=NaiveSelector())
+        )
+
+        self.assertCountEqual(
+            models,
+            [{"p2": False, "p3": False}, {"p2": False, "p3": True}]
+        )
+
+        return
+
+    def test_unused_vars(self):
+
+        # a variable in no clause is free, doubling the models
+        cnf = CNF.from_str("(p0 v p1) ∧ (p3 v ¬p3)")
+        cnf.simplify()
+        models = list(iter_models(cnf))
+
+        self.assertEqual(len(models), 6)
+        self.assertSetEqual(
+            {(model["p0"], model["p1"], model["p3"]) for model in models},
+            brute_force_models(cnf, ["p0", "p1", "p3"])
+        )
+
+        # a bound reaching the number of literals only interns them
+        cnf = CNF()
+        at_most_k(cnf, ["p0", "p1"], 2)
+        self.assertEqual(len(list(iter_models(cnf))), 4)
+
+        return
+
+    def test_limit(self):
+
+        cnf = CNF.from_str(COMPLEX_SAT_BACKTRACK)
+
+        self.assertEqual(len(list(iter_models(cnf, limit=2))), 2)
+        self.assertEqual(len(list(iter_models(cnf, limit=0))), 0)
+        self.assertEqual(len(list(iter_models(cnf, projection=[]))), 1)
+
+        return
+
+    def test_lazy(self):
+
+        # the generator stops where the caller does, leaving the rest unsolved
+        models = iter_models(CNF.from_str(COMPLEX_SAT_BACKTRACK))
+        first = next(models)
+        self.assertTrue(CNF.from_str(COMPLEX_SAT_BACKTRACK).evaluate(first))
+        models.close()
+
+        return
+
+    def test_unsat(self):
+
+        self.assertListEqual(
+            list(iter_models(CNF.from_str(COMPLEX_UNSAT))), list()
+        )
+
+        return
+
+    def test_unknown_projection(self):
+
+        with self.assertRaises(ValueError):
+            next(iter_models(CNF.from_str("p0"), projection=["q0"]))
+
+        return
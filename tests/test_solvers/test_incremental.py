@@ -0,0 +1,136 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import IncrementalSolver
+from sat.selectors import NaiveSelector, VSIDSSelector
+from sat.formulas import CNF
+
+
+COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+FORCED_NEGATIVE = "(p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+
+class TestIncrementalSolver(TestCase):
+
+    def test_solve_formula(self):
+
+        cnf = CNF.from_str(COMPLEX_SAT_BACKTRACK)
+        solver = IncrementalSolver(selector=NaiveSelector(), formula=cnf)
+
+        tau = solver.solve()
+        self.assertTrue(cnf.evaluate(tau))
+
+        # the formula is copied, later clauses leave it untouched
+        solver.add_clause("p0")
+        self.assertEqual(len(cnf), 3)
+        self.assertEqual(len(solver.formula), 4)
+
+        return
+
+    def test_unused_vars(self):
+
+        # variables left without clauses still get a value, as with DPLL
+        cnf = CNF.from_str("(p0 v p1) ∧ (p3 v ¬p3)")
+        cnf.simplify()
+        solver = IncrementalSolver(selector=VSIDSSelector(), formula=cnf)
+
+        self.assertSetEqual(set(solver.solve()), {"p0", "p1", "p3"})
+
+        return
+
+    def test_add_clause(self):
+
+        solver = IncrementalSolver(selector=VSIDSSelector())
+        solver.add_clause("p0", "p1")
+        self.assertIsNotNone(solver.solve())
+
+        solver.add_clause("¬p0")
+        tau = solver.solve()
+        self.assertEqual((tau["p0"], tau["p1"]), (False, True))
+
+        # new variables are added on the fly
+        solver.add_clause("¬p1", "p2")
+        self.assertTrue(solver.solve()["p2"])
+
+        solver.add_clause("¬p2")
+        self.assertIsNone(solver.solve())
+        self.assertListEqual(solver.failed_assumptions, list())
+        self.assertIsNone(solver.solve(assumptions=["p3"]))
+
+        return
+
+    def test_assumptions(self):
+
+        solver = IncrementalSolver(
+            selector=VSIDSSelector(), formula=CNF.from_str(FORCED_NEGATIVE)
+        )
+
+        # the clauses force ¬p0 and thus ¬p1
+        self.assertIsNone(solver.solve(assumptions=["p3", "p1"]))
+        self.assertListEqual(solver.failed_assumptions, ["p1"])
+
+        tau = solver.solve(assumptions=["p3", "¬p1"])
+        self.assertTrue(tau["p3"])
+        self.assertFalse(tau["p1"])
+        self.assertListEqual(solver.failed_assumptions, list())
+
+        # conflicting assumptions are both to blame
+        self.assertIsNone(solver.solve(assumptions=["p4", "p3", "¬p4"]))
+        self.assertCountEqual(solver.failed_assumptions, ["p4", "¬p4"])
+
+        # failed assumptions do not make the formula unsatisfiable
+        self.assertIsNotNone(solver.solve())
+
+        return
+
+    def test_failed_implication_chain(self):
+
+        solver = IncrementalSolver(selector=NaiveSelector())
+        solver.add_clause("¬a", "b")
+        solver.add_clause("¬b", "c")
+        solver.add_clause("¬c", "¬d")
+
+        self.assertIsNone(solver.solve(assumptions=["e", "a", "f", "d"]))
+        self.assertCountEqual(solver.failed_assumptions, ["a", "d"])
+
+        return
+
+    def test_solve_dataset(self):
+
+        # every formula of the dataset, each selected by its own assumption
+        # literal, in one solver
+        cnf_fps = glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf"))
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            exp_results = json.load(f)["results"]
+
+        solver = IncrementalSolver(selector=VSIDSSelector())
+        for i, cnf_fp in enumerate(cnf_fps):
+            cnf = CNF.from_dimacs(cnf_fp)
+            for lits in cnf.int_clauses():
+                solver.add_clause(f"¬s{i}", *[
+                    ("¬" if lit < 0 else "") + f"f{i}_{cnf.var_name(abs(lit))}"
+                    for lit in lits
+                ])
+
+        results = list()
+        for i, cnf_fp in enumerate(cnf_fps):
+            tau = solver.solve(assumptions=[f"s{i}"])
+            if tau is not None:
+                cnf = CNF.from_dimacs(cnf_fp)
+                self.assertTrue(cnf.evaluate({
+                    var: tau.get(f"f{i}_{var}", True) for var in cnf.vars
+                }))
+            else:
+                self.assertListEqual(solver.failed_assumptions, [f"s{i}"])
+            results.append(tau is not None)
+        self.assertListEqual(
+            results, [exp_result["result"] for exp_result in exp_results]
+        )
+
+        return
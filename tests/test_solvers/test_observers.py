@@ -0,0 +1,142 @@
+import contextlib
+import io
+from typing import List
+from unittest import TestCase
+
+from sat.solvers import (
+    DPLL,
+    CDCL,
+    LubyRestarts,
+    SearchObserver,
+    SamplingProfiler
+)
+from sat.selectors import NaiveSelector, VSIDSSelector
+from sat.formulas import CNF
+
+from helpers import pigeonhole
+
+
+COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+
+class EventRecorder(SearchObserver):
+
+    def __init__(self):
+
+        self.events = list()
+
+        return
+
+    def on_decide(self, solver, lit: int, level: int):
+
+        self.events.append(("decide", lit, level))
+
+        return
+
+    def on_conflict(self, solver, clause: List[int]):
+
+        self.events.append(("conflict", list(clause)))
+
+        return
+
+    def on_backtrack(self, solver, level: int):
+
+        self.events.append(("backtrack", level))
+
+        return
+
+    def on_restart(self, solver):
+
+        self.events.append(("restart",))
+
+        return
+
+
+class TestObservers(TestCase):
+
+    def test_events_match_stats(self):
+
+        for solver_cls in (DPLL, CDCL):
+            solver = solver_cls(selector=NaiveSelector())
+            recorder = EventRecorder()
+            solver.add_observer(recorder)
+            solver.solve(CNF.from_str(COMPLEX_UNSAT))
+
+            kinds = [event[0] for event in recorder.events]
+            self.assertEqual(kinds.count("decide"), solver.stats.decisions)
+            self.assertEqual(kinds.count("conflict"), solver.stats.conflicts)
+            self.assertEqual(
+                kinds.count("backtrack"), solver.stats.backtracks
+            )
+
+        return
+
+    def test_only_overridden_events_hooked(self):
+
+        solver = DPLL(selector=NaiveSelector())
+        n_conflict_hooks = len(solver._on_conflict_hooks)
+        recorder = EventRecorder()
+        solver.add_observer(recorder)
+
+        self.assertEqual(solver._on_propagate_hooks, list())
+        self.assertEqual(len(solver._on_decide_hooks), 1)
+        self.assertEqual(
+            len(solver._on_conflict_hooks), n_conflict_hooks + 1
+        )
+
+        solver.remove_observer(recorder)
+        solver.solve(CNF.from_str(COMPLEX_SAT_BACKTRACK))
+        self.assertEqual(solver._on_decide_hooks, list())
+        self.assertEqual(recorder.events, list())
+
+        return
+
+    def test_restart_event(self):
+
+        solver = CDCL(
+            selector=VSIDSSelector(), restart_policy=LubyRestarts(unit=1)
+        )
+        recorder = EventRecorder()
+        solver.add_observer(recorder)
+        solver.solve(pigeonhole(4))
+
+        n_restarts = sum(event[0] == "restart" for event in recorder.events)
+        self.assertGreater(n_restarts, 0)
+        self.assertEqual(n_restarts, solver.stats.restarts)
+
+        return
+
+    def test_verbose_traces(self):
+
+        solver = DPLL(selector=NaiveSelector(), verbose=True)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            solver.solve(CNF.from_str(COMPLEX_SAT_BACKTRACK))
+
+        self.assertIn("deciding...", output.getvalue())
+        self.assertIn("backtracking to level", output.getvalue())
+
+        return
+
+    def test_sampling_profiler(self):
+
+        solver = CDCL(selector=NaiveSelector())
+        profiler = SamplingProfiler(interval=0.0, check_every=1)
+        solver.add_observer(profiler)
+        solver.solve(CNF.from_str(COMPLEX_UNSAT))
+
+        counts = profiler.event_counts
+        self.assertEqual(counts["on_decide"], solver.stats.decisions)
+        self.assertEqual(counts["on_conflict"], solver.stats.conflicts)
+        self.assertEqual(
+            len(profiler.samples),
+            counts["on_decide"] + counts["on_propagate"] +
+            counts["on_conflict"]
+        )
+        self.assertTrue(all(
+            sample["decisions"] <= solver.stats.decisions
+            for sample in profiler.samples
+        ))
+
+        return
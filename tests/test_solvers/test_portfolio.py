@@ -0,0 +1,118 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import DPLL, CDCL, PortfolioSolver
+from sat.solvers._exceptions import TimeoutException
+from sat.selectors import NaiveSelector, RandomChoiceSelector
+from sat.formulas import CNF
+
+from helpers import pigeonhole
+
+
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+
+class CrashingSolver(DPLL):
+
+    def solve(self, formula, timeout=None):
+
+        raise ValueError("crashed")
+
+
+class TestPortfolioSolver(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.solver = PortfolioSolver(
+            solvers=[
+                DPLL(selector=NaiveSelector()),
+                DPLL(selector=RandomChoiceSelector()),
+                CDCL(selector=RandomChoiceSelector())
+            ]
+        )
+
+        return
+
+    def test_solve_dataset(self):
+
+        cnfs = [
+            CNF.from_dimacs(cnf_fp)
+            for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf"))
+        ]
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            exp_results = json.load(f)["results"]
+
+        results = list()
+        for cnf in cnfs[:5]:
+            tau = self.solver.solve(cnf)
+            if tau is not None:
+                self.assertTrue(cnf.evaluate(tau))
+            self.assertIn(self.solver.winner, range(3))
+            results.append(tau is not None)
+        self.assertListEqual(
+            results, [exp_result["result"] for exp_result in exp_results[:5]]
+        )
+
+        return
+
+    def test_solve_unsat(self):
+
+        self.assertIsNone(self.solver.solve(CNF.from_str(COMPLEX_UNSAT)))
+
+        return
+
+    def test_timeout(self):
+
+        # nine pigeons in eight holes take DPLL far longer than the timeout
+        cnf = pigeonhole(8)
+
+        solver = PortfolioSolver(solvers=[DPLL(selector=NaiveSelector())])
+        with self.assertRaises(TimeoutException):
+            solver.solve(cnf, timeout=0.5)
+        self.assertIsNone(solver.winner)
+
+        return
+
+    def test_crash(self):
+
+        # the error, not a timeout, once every solver has crashed
+        solver = PortfolioSolver(
+            solvers=[
+                CrashingSolver(selector=NaiveSelector()),
+                CrashingSolver(selector=NaiveSelector())
+            ]
+        )
+        for timeout in (None, 60.0):
+            with self.assertRaisesRegex(RuntimeError, "ValueError: crashed"):
+                solver.solve(CNF.from_str(COMPLEX_UNSAT), timeout=timeout)
+            self.assertIsNone(solver.winner)
+
+        # a solver left in the race still answers
+        solver = PortfolioSolver(
+            solvers=[
+                CrashingSolver(selector=NaiveSelector()),
+                DPLL(selector=NaiveSelector())
+            ]
+        )
+        self.assertIsNone(solver.solve(CNF.from_str(COMPLEX_UNSAT)))
+        self.assertEqual(solver.winner, 1)
+
+        return
+
+    def test_seeds(self):
+
+        with self.assertRaises(ValueError):
+            PortfolioSolver(solvers=[DPLL(selector=NaiveSelector())], seeds=[])
+        with self.assertRaises(ValueError):
+            PortfolioSolver(
+                solvers=[DPLL(selector=NaiveSelector())], seeds=[1, 2]
+            )
+
+        return
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from sat.solvers._propagation import WatchedPropagator
+from sat.trail import Trail
+
+
+class TestWatchedPropagator(TestCase):
+
+    def test_add_unit_clause(self):
+
+        propagator = WatchedPropagator(Trail(2))
+
+        self.assertTrue(propagator.add_clause([-1]))
+        self.assertEqual(propagator.trail.value(-1), 1)
+        self.assertFalse(propagator.add_clause([1]))
+        self.assertFalse(propagator.add_clause([]))
+
+        return
+
+    def test_propagate_chain(self):
+
+        propagator = WatchedPropagator(Trail(3))
+        propagator.add_clause([-1, 2])
+        propagator.add_clause([-2, 3])
+
+        propagator.trail.new_level()
+        propagator.trail.assign(1)
+
+        self.assertIsNone(propagator.propagate())
+        self.assertListEqual(propagator.trail.lits, [1, 2, 3])
+        self.assertListEqual(propagator.trail.reasons[3], [3, -2])
+
+        return
+
+    def test_propagate_conflict(self):
+
+        propagator = WatchedPropagator(Trail(3))
+        propagator.add_clause([-1, 2, 3])
+        propagator.add_clause([-1, 2, -3])
+
+        propagator.trail.new_level()
+        propagator.trail.assign(1)
+        self.assertIsNone(propagator.propagate())
+        propagator.trail.new_level()
+        propagator.trail.assign(-2)
+
+        self.assertIsNotNone(propagator.propagate())
+
+        propagator.backtrack(1)
+        self.assertEqual(propagator.qhead, 1)
+        self.assertEqual(propagator.trail.value(2), 0)
+
+        return
@@ -0,0 +1,85 @@
+import glob
+import json
+import os
+from unittest import TestCase
+
+from sat.solvers import DPLL, CDCL, LubyRestarts, GeometricRestarts
+from sat.solvers._restarts import luby
+from sat.selectors import NaiveSelector, VSIDSSelector
+from sat.formulas import CNF
+
+
+LUBY_PREFIX = [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, 1]
+
+TEST_DATASET_PATH = "./tests/artifacts/test_cnfs/"
+RANDOM_RESULT_PATH = "./tests/artifacts/random_result.json"
+
+
+class TestRestarts(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.cnfs = [
+            CNF.from_dimacs(cnf_fp)
+            for cnf_fp in glob.glob(os.path.join(TEST_DATASET_PATH, "*.cnf"))
+        ]
+        with open(RANDOM_RESULT_PATH, "r") as f:
+            self.exp_results = [
+                exp_result["result"] for exp_result in json.load(f)["results"]
+            ]
+
+        return
+
+    def test_luby(self):
+
+        self.assertListEqual(
+            [luby(i) for i in range(1, len(LUBY_PREFIX) + 1)], LUBY_PREFIX
+        )
+
+        policy = LubyRestarts(unit=10)
+        intervals = [policy.next_interval() for _ in range(4)]
+        self.assertListEqual(intervals, [10, 10, 20, 10])
+        policy.reset()
+        self.assertEqual(policy.next_interval(), 10)
+
+        return
+
+    def test_geometric(self):
+
+        policy = GeometricRestarts(first=10, factor=2.0)
+
+        intervals = [policy.next_interval() for _ in range(4)]
+        self.assertListEqual(intervals, [10, 20, 40, 80])
+
+        return
+
+    def test_solve_dataset(self):
+
+        solvers = [
+            DPLL(
+                selector=NaiveSelector(),
+                restart_policy=LubyRestarts(unit=1),
+                phase_saving=True
+            ),
+            CDCL(
+                selector=VSIDSSelector(),
+                restart_policy=GeometricRestarts(first=1),
+                phase_saving=True
+            )
+        ]
+
+        for solver in solvers:
+            results = list()
+            n_restarts = 0
+            for cnf in self.cnfs:
+                tau = solver.solve(cnf)
+                if tau is not None:
+                    self.assertTrue(cnf.evaluate(tau))
+                results.append(tau is not None)
+                n_restarts += solver._n_restarts
+            self.assertListEqual(results, self.exp_results)
+            self.assertGreater(n_restarts, 0)
+
+        return
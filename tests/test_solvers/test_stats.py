@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from sat.solvers import DPLL, CDCL, SolverStats
+from sat.selectors import NaiveSelector
+from sat.formulas import CNF
+
+
+COMPLEX_SAT_BACKTRACK = "(p2 v ¬p1 v p0) ∧ (¬p2 v p3) ∧ (¬p2 v ¬p3)"
+COMPLEX_UNSAT = "(p0 v p1) ∧ (p0 v ¬p1) ∧ (¬p0 v p2) ∧ (¬p0 v ¬p2)"
+
+
+class TestSolverStats(TestCase):
+
+    def test_dpll(self):
+
+        solver = DPLL(selector=NaiveSelector())
+        solver.solve(CNF.from_str(COMPLEX_SAT_BACKTRACK))
+        stats = solver.stats
+
+        self.assertEqual(stats.decisions, solver._n_calls)
+        self.assertEqual(stats.conflicts, 1)
+        self.assertEqual(stats.backtracks, 1)
+        self.assertEqual(stats.max_depth, 2)
+        self.assertGreater(stats.propagations, 0)
+        self.assertGreaterEqual(
+            stats.total_time,
+            stats.copy_time + stats.select_time + stats.propagate_time
+        )
+
+        return
+
+    def test_cdcl(self):
+
+        solver = CDCL(selector=NaiveSelector())
+        self.assertIsNone(solver.solve(CNF.from_str(COMPLEX_UNSAT)))
+        stats = solver.stats
+
+        self.assertEqual(stats.conflicts, solver._n_conflicts)
+        self.assertEqual(stats.backtracks, stats.conflicts - 1)
+        self.assertGreater(stats.analyze_time, 0.0)
+
+        # the counters start over with every call
+        solver.solve(CNF.from_str(COMPLEX_SAT_BACKTRACK))
+        self.assertEqual(solver.stats.conflicts, 1)
+
+        return
+
+    def test_merge(self):
+
+        stats = SolverStats(decisions=2, max_depth=5, select_time=1.0)
+        stats.merge(SolverStats(decisions=3, max_depth=4, select_time=0.5))
+
+        self.assertEqual(stats.decisions, 5)
+        self.assertEqual(stats.max_depth, 5)
+        self.assertAlmostEqual(stats.select_time, 1.5)
+
+        return
@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from sat.formulas import CNF
+from sat.trail import Trail
+
+
+TEST_CNF = "(p0 v ¬p1) ∧ (p1 v p2)"
+
+
+class TestTrail(TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self.cnf = CNF.from_str(TEST_CNF)
+
+        return
+
+    def test_assign(self):
+
+        trail = Trail(self.cnf.n_vars)
+        trail.assign(-2)
+
+        self.assertEqual(trail.value(-2), 1)
+        self.assertEqual(trail.value(2), -1)
+        self.assertEqual(trail.levels[2], 0)
+        self.assertEqual(len(trail), 1)
+
+        return
+
+    def test_backtrack(self):
+
+        trail = Trail(self.cnf.n_vars)
+        trail.assign(1)
+        trail.new_level()
+        trail.assign(-2)
+        trail.assign(3)
+
+        self.assertEqual(trail.decision_level, 1)
+        self.assertListEqual(trail.backtrack(0), [-2, 3])
+        self.assertEqual(trail.decision_level, 0)
+        self.assertEqual(trail.value(2), 0)
+        self.assertEqual(trail.value(-3), 0)
+        self.assertEqual(trail.value(1), 1)
+        self.assertListEqual(trail.backtrack(0), [])
+
+        return
+
+    def test_to_tau(self):
+
+        trail = Trail(self.cnf.n_vars)
+        trail.assign(-2)
+
+        self.assertDictEqual(
+            trail.to_tau(self.cnf), {"p0": True, "p1": False, "p2": True}
+        )
+
+        return